@@ -1,15 +1,15 @@
-from typing import Type, TypeVar, Generic, List
+from typing import Type, TypeVar, Generic, List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from asisya_api.core.database import get_db
+from asisya_api.core.unit_of_work import get_current_unit_of_work
 
 T = TypeVar('T')
 
 
 class BaseRepository(Generic[T]):
-    _instance = None
-
     def __init__(self, model: Type[T], db: Session):
         self.model = model
         self.db = db
@@ -47,7 +47,10 @@ class BaseRepository(Generic[T]):
         self.db.commit()
 
     def refresh_db(self):
-        self.db = next(get_db())
+        # Tras un rollback se vuelve a la sesión de la unidad de trabajo activa (si la hay)
+        uow = get_current_unit_of_work()
+        if uow is not None:
+            self.db = uow.session
 
     def _parse_integrity_error(self, error: IntegrityError) -> str:
         orig_msg = str(error.orig)
@@ -84,3 +87,47 @@ class BaseRepository(Generic[T]):
             self.db.rollback()
             self.refresh_db()
             raise ValueError(f"Error during bulk create: {str(e)}")
+
+
+class AsyncBaseRepository(Generic[T]):
+    """
+    Variante async de `BaseRepository` sobre una `AsyncSession`: la espera de la
+    base de datos cede el event loop en lugar de bloquearlo.
+    """
+
+    def __init__(self, model: Type[T], db: AsyncSession):
+        self.model = model
+        self.db = db
+
+    async def get(self, id: int) -> Optional[T]:
+        return await self.db.get(self.model, id)
+
+    async def get_all(self) -> List[T]:
+        result = await self.db.execute(select(self.model))
+        return list(result.scalars().all())
+
+    async def create(self, obj: T) -> T:
+        try:
+            self.db.add(obj)
+            await self.db.commit()
+            await self.db.refresh(obj)
+            return obj
+        except IntegrityError as e:
+            await self.db.rollback()
+            raise ValueError(self._parse_integrity_error(e))
+
+    async def update(self, obj: T) -> T:
+        try:
+            await self.db.merge(obj)
+            await self.db.commit()
+            return obj
+        except IntegrityError as e:
+            await self.db.rollback()
+            raise ValueError(self._parse_integrity_error(e))
+
+    async def delete(self, id: int) -> None:
+        obj = await self.get(id)
+        await self.db.delete(obj)
+        await self.db.commit()
+
+    _parse_integrity_error = BaseRepository._parse_integrity_error
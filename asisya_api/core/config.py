@@ -16,6 +16,15 @@ class Settings(BaseSettings):
     db_name: str = Field("app_db", env="DB_NAME")
     db_user: str = Field("app_user", env="DB_USER")
     db_password: str = Field("secret_password", env="DB_PASSWORD")
+    # URL del engine async; si no se define se deriva de DATABASE_URL (asyncpg / aiosqlite)
+    async_database_url: str | None = Field(None, env="ASYNC_DATABASE_URL")
+
+    # --- Pool de conexiones ---
+    db_pool_size: int = Field(10, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(20, env="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(30, env="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(1800, env="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(True, env="DB_POOL_PRE_PING")
 
     # --- Credenciales iniciales ---
     initial_admin_username: str = Field(..., env="INITIAL_ADMIN_USERNAME")
@@ -27,6 +36,14 @@ class Settings(BaseSettings):
     algorithm: str = Field(..., env="ALGORITHM")
     access_token_expire_minutes: int = Field(..., env="ACCESS_TOKEN_EXPIRE_MINUTES")
 
+    # --- Caché del usuario autenticado (get_authenticated_user) ---
+    auth_user_cache_ttl_seconds: float = Field(30, env="AUTH_USER_CACHE_TTL_SECONDS")
+    auth_user_cache_max_size: int = Field(1024, env="AUTH_USER_CACHE_MAX_SIZE")
+
+    # --- Pool de hashing de contraseñas (bcrypt fuera del event loop) ---
+    password_hash_workers: int = Field(2, env="PASSWORD_HASH_WORKERS")
+    password_hash_max_queue: int = Field(16, env="PASSWORD_HASH_MAX_QUEUE")
+
     # --- Archivos y media ---
     MEDIA_ROOT: str = "./media"
     MEDIA_URL: str = "/media"
@@ -41,12 +58,57 @@ class Settings(BaseSettings):
     smtp_password: str | None = Field(None, env="SMTP_PASSWORD")
     sender_email: str | None = Field(None, env="SENDER_EMAIL")
 
+    # --- Listado de productos (conteo de totales) ---
+    product_count_exact_threshold: int = Field(10000, env="PRODUCT_COUNT_EXACT_THRESHOLD")
+    product_count_cache_ttl_seconds: float = Field(30, env="PRODUCT_COUNT_CACHE_TTL_SECONDS")
+    product_count_cache_max_size: int = Field(1024, env="PRODUCT_COUNT_CACHE_MAX_SIZE")
+
+    # --- Caché de categorías (read-through) ---
+    category_cache_backend: str = Field("local", env="CATEGORY_CACHE_BACKEND")  # local | redis
+    category_cache_ttl_seconds: float = Field(300, env="CATEGORY_CACHE_TTL_SECONDS")
+    category_cache_max_size: int = Field(256, env="CATEGORY_CACHE_MAX_SIZE")
+    redis_url: str | None = Field(None, env="REDIS_URL")
+
+    # --- GET condicionales (ETag / Cache-Control) ---
+    categories_cache_control: str = Field("private, max-age=60", env="CATEGORIES_CACHE_CONTROL")
+    products_cache_control: str = Field("private, no-cache", env="PRODUCTS_CACHE_CONTROL")
+
+    # --- Exportación del catálogo (GET /products/export) ---
+    product_export_batch_size: int = Field(1000, env="PRODUCT_EXPORT_BATCH_SIZE")  # filas por lote del cursor
+
+    # --- Métricas de latencia (GET /metrics) ---
+    metrics_enabled: bool = Field(True, env="METRICS_ENABLED")
+
+    # --- Perfilador de SQL por petición (cabecera X-Query-Profile) ---
+    query_profiler_enabled: bool = Field(False, env="QUERY_PROFILER_ENABLED")
+    query_profiler_header: str = Field("X-Query-Profile", env="QUERY_PROFILER_HEADER")
+    query_profiler_repeat_threshold: int = Field(2, env="QUERY_PROFILER_REPEAT_THRESHOLD")  # veces = posible N+1
+
+    # --- Carga masiva: envío a SQS ---
+    sqs_send_concurrency: int = Field(8, env="SQS_SEND_CONCURRENCY")
+    sqs_send_max_retries: int = Field(3, env="SQS_SEND_MAX_RETRIES")
+
+    # --- Carga masiva: consumidor de SQS (worker) ---
+    bulk_consumer_concurrency: int = Field(4, env="BULK_CONSUMER_CONCURRENCY")
+    bulk_consumer_use_processes: bool = Field(False, env="BULK_CONSUMER_USE_PROCESSES")
+    bulk_consumer_wait_time_seconds: int = Field(20, env="BULK_CONSUMER_WAIT_TIME_SECONDS")
+    bulk_consumer_visibility_timeout: int = Field(60, env="BULK_CONSUMER_VISIBILITY_TIMEOUT")
+
+    # --- Carga masiva: normalización (worker y cargas síncronas en la API) ---
+    bulk_normalizer: str = Field("columnar", env="BULK_NORMALIZER")  # columnar | row
+    # Cargas JSON de hasta N productos se procesan en la propia petición, sin SQS (0 = nunca)
+    bulk_sync_max_rows: int = Field(0, env="BULK_SYNC_MAX_ROWS")
+
     # --- S3 config ---
     storage_backend: str = Field("local", env="STORAGE_BACKEND")
     aws_s3_bucket: str | None = Field(None, env="AWS_S3_BUCKET")
     aws_region: str | None = Field(None, env="AWS_REGION")
     aws_access_key_id: str | None = Field(None, env="AWS_ACCESS_KEY_ID")
     aws_secret_access_key: str | None = Field(None, env="AWS_SECRET_ACCESS_KEY")
+    # Subidas: bloques de escritura en disco y partes de las subidas multipart a S3 (mínimo 5 MB)
+    storage_chunk_size: int = Field(1024 * 1024, env="STORAGE_CHUNK_SIZE")
+    s3_multipart_part_size: int = Field(8 * 1024 * 1024, env="S3_MULTIPART_PART_SIZE")
+    s3_multipart_concurrency: int = Field(4, env="S3_MULTIPART_CONCURRENCY")
 
     class Config:
         env_file = ".env"
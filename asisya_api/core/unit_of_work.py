@@ -0,0 +1,152 @@
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from asisya_api.core.database import SessionLocal, get_async_session_factory
+
+_current_unit_of_work: ContextVar[Optional["UnitOfWork"]] = ContextVar("unit_of_work", default=None)
+
+
+class UnitOfWork:
+    """
+    Sesión de base de datos con alcance de una unidad de trabajo (una petición HTTP
+    o un mensaje de la cola). La sesión se abre perezosamente la primera vez que
+    un repositorio la necesita y se cierra al terminar la unidad de trabajo.
+
+    Además de la sesión sync puede abrir una `AsyncSession` (handlers async); cada
+    una toma su propia conexión del pool de su engine.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        async_session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self._session_factory = session_factory
+        self._async_session_factory = async_session_factory
+        self._session: Optional[Session] = None
+        self._async_session: Optional[AsyncSession] = None
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    @property
+    def async_session(self) -> AsyncSession:
+        if self._async_session is None:
+            factory = self._async_session_factory or get_async_session_factory()
+            self._async_session = factory()
+        return self._async_session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def close_async(self) -> None:
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+        self.close()
+
+
+def get_current_unit_of_work() -> Optional[UnitOfWork]:
+    return _current_unit_of_work.get()
+
+
+@contextmanager
+def unit_of_work(
+    session_factory: Callable[[], Session] = SessionLocal,
+    async_session_factory: Optional[Callable[[], AsyncSession]] = None,
+) -> Iterator[UnitOfWork]:
+    """
+    Abre una unidad de trabajo para el contexto actual. Si ya hay una activa
+    (p. ej. la de la petición) se reutiliza y no se cierra al salir.
+
+    Sólo cierra la sesión sync: si se va a usar `async_session` hay que usar
+    `async_unit_of_work`.
+    """
+    current = _current_unit_of_work.get()
+    if current is not None:
+        yield current
+        return
+
+    uow = UnitOfWork(session_factory, async_session_factory)
+    token = _current_unit_of_work.set(uow)
+    try:
+        yield uow
+    finally:
+        _current_unit_of_work.reset(token)
+        uow.close()
+
+
+@asynccontextmanager
+async def async_unit_of_work(
+    session_factory: Callable[[], Session] = SessionLocal,
+    async_session_factory: Optional[Callable[[], AsyncSession]] = None,
+) -> AsyncIterator[UnitOfWork]:
+    """Igual que `unit_of_work`, pero cierra también la sesión async al salir."""
+    current = _current_unit_of_work.get()
+    if current is not None:
+        yield current
+        return
+
+    uow = UnitOfWork(session_factory, async_session_factory)
+    token = _current_unit_of_work.set(uow)
+    try:
+        yield uow
+    finally:
+        _current_unit_of_work.reset(token)
+        await uow.close_async()
+
+
+def current_session() -> Session:
+    """Sesión de la unidad de trabajo activa. Los repositorios la obtienen desde aquí."""
+    uow = _current_unit_of_work.get()
+    if uow is None:
+        raise RuntimeError(
+            "No active unit of work: wrap the call in `unit_of_work()` "
+            "or run it inside a request handled by UnitOfWorkMiddleware"
+        )
+    return uow.session
+
+
+def current_async_session() -> AsyncSession:
+    """Sesión async de la unidad de trabajo activa (repositorios async)."""
+    uow = _current_unit_of_work.get()
+    if uow is None:
+        raise RuntimeError(
+            "No active unit of work: wrap the call in `async_unit_of_work()` "
+            "or run it inside a request handled by UnitOfWorkMiddleware"
+        )
+    return uow.async_session
+
+
+class UnitOfWorkMiddleware:
+    """
+    Middleware ASGI que abre una unidad de trabajo por petición, de modo que los
+    controladores, dependencias y handlers del mediator comparten una misma sesión
+    (y una conexión del pool) sólo durante esa petición.
+    """
+
+    def __init__(
+        self,
+        app,
+        session_factory: Callable[[], Session] = SessionLocal,
+        async_session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self.app = app
+        self.session_factory = session_factory
+        self.async_session_factory = async_session_factory
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        async with async_unit_of_work(self.session_factory, self.async_session_factory):
+            await self.app(scope, receive, send)
@@ -1,14 +1,57 @@
 
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from jose import JWTError, jwt
+from sqlalchemy import inspect
 from asisya_api.features.auth.models import TokenData
 from asisya_api.core.config import settings
+from asisya_api.crosscutting.cache import TTLCache, register_cache
+from asisya_api.crosscutting.logging import get_logger
+from asisya_api.domain.user import UserEntity
 from asisya_api.features.user.repository import UserRepository
 
+logger = get_logger(__name__)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
+# Usuarios ya resueltos por username. Es por proceso: la invalidación explícita sólo
+# llega al worker que hizo el cambio, en el resto el TTL acota cuánto dura un dato viejo.
+authenticated_user_cache = register_cache("authenticated_users", TTLCache(
+    max_size=settings.auth_user_cache_max_size,
+    ttl_seconds=settings.auth_user_cache_ttl_seconds,
+))
+# Cada cuántas búsquedas se registran las métricas de la caché en el log
+CACHE_STATS_LOG_EVERY = 1000
+
+
+def invalidate_authenticated_user(*usernames: Optional[str]) -> None:
+    """Descarta de la caché a los usuarios modificados (update, enable, delete...)."""
+    for username in usernames:
+        if username:
+            authenticated_user_cache.invalidate(username)
+
+
+def _user_snapshot(user: UserEntity) -> dict:
+    # Se guardan sólo las columnas: la entidad pertenece a la sesión de la petición que la cargó
+    return {column.key: getattr(user, column.key) for column in inspect(UserEntity).column_attrs}
+
+
+def _get_user(username: str, user_repo: UserRepository) -> Optional[UserEntity]:
+    snapshot = authenticated_user_cache.get(username)
+    lookups = authenticated_user_cache.hits + authenticated_user_cache.misses
+    if lookups % CACHE_STATS_LOG_EVERY == 0:
+        logger.info("Authenticated user cache stats: %s", authenticated_user_cache.stats())
+    if snapshot is not None:
+        # Entidad transitoria (no ligada a ninguna sesión) con los datos cacheados
+        return UserEntity(**snapshot)
+
+    user = user_repo.get_by_username(username)
+    if user is not None:
+        authenticated_user_cache.set(username, _user_snapshot(user))
+    return user
+
 def get_authenticated_user(token: str = Depends(oauth2_scheme), user_repo: UserRepository = Depends(UserRepository.instance)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,7 +77,7 @@ def get_authenticated_user(token: str = Depends(oauth2_scheme), user_repo: UserR
     except JWTError:
         raise token_exception
 
-    user = user_repo.get_by_username(token_data.username)
+    user = _get_user(token_data.username, user_repo)
     if user is None:
         raise credentials_exception
     if user.disabled:
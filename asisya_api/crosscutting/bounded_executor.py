@@ -0,0 +1,82 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """El pool ya tiene ocupados todos sus workers y su cola: hay que reintentar más tarde."""
+
+    def __init__(self, name: str, retry_after_seconds: int = 1):
+        super().__init__(f"Executor '{name}' is saturated")
+        self.name = name
+        self.retry_after_seconds = retry_after_seconds
+
+
+class BoundedExecutor:
+    """
+    Pool de hilos de tamaño fijo con un límite de trabajos en espera.
+
+    Sirve para sacar del event loop trabajo de CPU que libera el GIL (p. ej. bcrypt)
+    sin que una ráfaga de peticiones acumule una cola infinita: cuando hay
+    `max_workers + max_queue` trabajos en curso, `run` falla inmediatamente con
+    `ExecutorSaturatedError` (back-pressure) en lugar de encolar.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            logger.warning("Executor '%s' saturado: %s trabajos en curso", self.name, self.in_flight)
+            raise ExecutorSaturatedError(self.name)
+
+        with self._lock:
+            self.in_flight += 1
+        # Igual que run_in_threadpool de Starlette: el hilo ve las ContextVar de la petición
+        context = contextvars.copy_context()
+        try:
+            future = self._executor.submit(functools.partial(context.run, fn, *args))
+        except BaseException:
+            self._release(None)
+            raise
+        # El hueco se libera cuando termina el hilo, no cuando deja de esperarse (p. ej. si
+        # el cliente cancela la petición): así el límite refleja el trabajo real en curso.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+        self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,285 @@
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+# Cachés con métricas (hits/misses) por nombre, para exponerlas juntas
+_registry: Dict[str, Any] = {}
+
+
+def register_cache(name: str, cache):
+    """Registra una caché con `stats()` y la devuelve (para usar al declararla)."""
+    _registry[name] = cache
+    return cache
+
+
+def cache_stats() -> Dict[str, dict]:
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+
+class TTLCache:
+    """
+    Caché en memoria del proceso, acotada en tamaño (LRU) y con expiración por TTL.
+    Es thread-safe y lleva contadores de aciertos/fallos para métricas.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 30.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class CacheBackend:
+    """
+    Almacén de `ReadThroughCache` con la interfaz de un cliente de Redis (redis-py):
+    valores en bytes, `set(key, value, ex=segundos)` y `delete(*keys)`.
+
+    `blocking` indica que las llamadas hacen E/S de red: desde código async se
+    ejecutan en el pool de hilos para no bloquear el event loop.
+    """
+
+    blocking = False
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ex: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+
+class LocalCacheBackend(CacheBackend):
+    """En memoria del proceso (LRU con TTL): cada réplica de la API tiene la suya."""
+
+    def __init__(self, max_size: int = 1024):
+        self._cache = TTLCache(max_size=max_size)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes, ex: Optional[float] = None) -> None:
+        self._cache.set(key, value, ttl_seconds=ex)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.invalidate(key)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Compartida entre procesos sobre un cliente compatible con redis-py (o `InMemoryRedisClient`)."""
+
+    blocking = True
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ex: Optional[float] = None) -> None:
+        # Redis sólo admite TTL enteros en `ex`; por debajo del segundo se usa `px`
+        if ex is not None and ex != int(ex):
+            self.client.set(key, value, px=int(ex * 1000))
+        else:
+            self.client.set(key, value, ex=int(ex) if ex is not None else None)
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*keys)
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class ReadThroughCache:
+    """
+    Caché de lectura (read-through) con TTL e invalidación explícita sobre un
+    `CacheBackend`. Los valores se guardan serializados con `encode`/`decode`
+    (JSON por defecto), de modo que el backend puede ser compartido (Redis).
+
+      - `get_or_load(key, loader)`: devuelve lo cacheado o espera a `loader()` y lo
+        guarda. Las cargas concurrentes de una misma clave en el proceso se agrupan
+        en una sola llamada a `loader`.
+      - `invalidate(*keys)` / `invalidate_async(*keys)`: se llama tras escribir. Una
+        carga que empezó antes de la invalidación no guarda su resultado (podría ser
+        anterior a la escritura).
+      - Si el backend falla se sirve desde `loader` sin caché (y se cuenta en `errors`).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        backend: CacheBackend,
+        ttl_seconds: float,
+        encode: Callable[[Any], bytes] = _json_dumps,
+        decode: Callable[[bytes], Any] = json.loads,
+    ):
+        self.name = name
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.encode = encode
+        self.decode = decode
+        self._generation = 0
+        self._loading: Dict[str, "asyncio.Future"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.invalidations = 0
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.name}:{key}"
+
+    async def _call(self, method: Callable, *args, **kwargs):
+        if self.backend.blocking:
+            return await run_in_threadpool(method, *args, **kwargs)
+        return method(*args, **kwargs)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        full_key = self._key(key)
+        try:
+            cached = await self._call(self.backend.get, full_key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Cache '%s' no disponible (get): %s", self.name, e)
+            return await loader()
+
+        if cached is not None:
+            self.hits += 1
+            return self.decode(cached)
+        self.misses += 1
+
+        pending = self._loading.get(full_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[full_key] = future
+        generation = self._generation
+        try:
+            value = await loader()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # evita "exception was never retrieved" si nadie más esperaba
+            raise
+        finally:
+            self._loading.pop(full_key, None)
+
+        future.set_result(value)
+        if generation == self._generation:
+            try:
+                await self._call(self.backend.set, full_key, self.encode(value), ex=self.ttl_seconds)
+            except Exception as e:
+                self.errors += 1
+                logger.warning("Cache '%s' no disponible (set): %s", self.name, e)
+        return value
+
+    def _start_invalidation(self, keys) -> List[str]:
+        # Antes de borrar: una carga en curso ya no guardará su resultado
+        self._generation += 1
+        self.invalidations += 1
+        return [self._key(key) for key in keys]
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+        Síncrono, para handlers sync tras confirmar la escritura. Con un backend
+        `blocking` (Redis) bloquea el hilo: desde handlers async usar `invalidate_async`.
+        """
+        full_keys = self._start_invalidation(keys)
+        try:
+            self.backend.delete(*full_keys)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Cache '%s' no disponible (delete): %s", self.name, e)
+
+    async def invalidate_async(self, *keys: Hashable) -> None:
+        """Como `invalidate`, con el borrado fuera del event loop si el backend es `blocking`."""
+        full_keys = self._start_invalidation(keys)
+        try:
+            await self._call(self.backend.delete, *full_keys)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Cache '%s' no disponible (delete): %s", self.name, e)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hit_rate, 4),
+        }
@@ -0,0 +1,55 @@
+"""
+GET condicionales: ETag, `If-None-Match` y `Cache-Control`.
+
+El ETag es un hash del contenido de la respuesta (antes de serializarlo a JSON): la
+misma respuesta da el mismo ETag en cualquier réplica, y cambia con cualquier campo
+(no depende de la resolución de `updated_at`). Si el cliente ya tiene esa versión se
+responde 304 sin cuerpo, sin pasar por la validación ni la serialización de FastAPI.
+"""
+import hashlib
+from typing import Any, Optional, Type
+
+from fastapi import Request, Response, status
+
+
+def compute_etag(content: Any) -> str:
+    """
+    ETag fuerte a partir de `repr(content)`: DTOs (dataclasses, modelos pydantic),
+    dicts, listas, datetimes y Decimal tienen un `repr` determinista y mucho más
+    barato que serializar a JSON.
+    """
+    digest = hashlib.blake2b(repr(content).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparación débil de `If-None-Match` (RFC 9110): `*`, lista separada por comas y prefijo `W/`."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    content: Any,
+    cache_control: str,
+    response_class: Optional[Type[Response]] = None,
+) -> Any:
+    """
+    Añade `ETag` y `Cache-Control` a la respuesta del endpoint (`response` inyectada por
+    FastAPI) y devuelve `content`, o una respuesta 304 vacía si el cliente ya lo tiene.
+
+    Con `response_class` (p. ej. `FastJSONResponse`) el contenido se devuelve ya
+    serializado con esa clase en lugar de pasar por la serialización de FastAPI.
+    """
+    etag = compute_etag(content)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if response_class is not None:
+        return response_class(content, headers=headers)
+    response.headers.update(headers)
+    return content
@@ -0,0 +1,232 @@
+"""
+Métricas de latencia en formato de exposición de Prometheus, en memoria del proceso.
+
+  - `MetricsMiddleware`: duración de cada petición HTTP por método, ruta (la plantilla,
+    p. ej. `/products/bulk/{job_id}`) y código de estado, y el tiempo que la petición
+    pasó esperando a la base de datos.
+  - `HandlerMetricsBehavior`: behavior del mediator que mide cada handler
+    (`GetProductsQueryHandler`, `CreateProductCommandHandler`...) y su tiempo de base
+    de datos.
+  - El tiempo de base de datos se acumula con los eventos de cursor de SQLAlchemy
+    (engines sync y async) en un contador por petición guardado en una ContextVar.
+  - `render_metrics()` genera el texto de `GET /metrics`.
+"""
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from mediatr import Mediator
+from mediatr import mediator as mediatr_registry
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from asisya_api.core.config import settings
+
+# Buckets por defecto de los clientes de Prometheus (segundos)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class Histogram:
+    """
+    Histograma de Prometheus con etiquetas. Cada serie guarda el número de
+    observaciones por bucket (no acumulado), la suma y el total; `render` los acumula.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        # Primer bucket con límite >= value (los buckets son "le"); más allá del último sólo cuenta en +Inf
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def series(self) -> Dict[Tuple[str, ...], Tuple[List[int], float, int]]:
+        """Copia de las series: {etiquetas: (cuentas acumuladas por bucket, suma, total)}."""
+        with self._lock:
+            snapshot = {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+        result = {}
+        for labels, (counts, total, count) in snapshot.items():
+            cumulative, running = [], 0
+            for bucket_count in counts[:-1]:
+                running += bucket_count
+                cumulative.append(running)
+            result[labels] = (cumulative, total, count)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, (cumulative, total, count) in sorted(self.series().items()):
+            pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels))
+            prefix = f"{pairs}," if pairs else ""
+            for bound, bucket_count in zip(self.buckets, cumulative):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{_format_bound(bound)}"}} {bucket_count}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{pairs}}} {total!r}")
+            lines.append(f"{self.name}_count{{{pairs}}} {count}")
+        return lines
+
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Duración de las peticiones HTTP.", ("method", "route", "status"),
+)
+http_request_db_duration = Histogram(
+    "http_request_db_duration_seconds", "Tiempo de base de datos de cada petición HTTP.", ("method", "route"),
+)
+handler_duration = Histogram(
+    "mediator_handler_duration_seconds", "Duración de los handlers del mediator.", ("handler", "outcome"),
+)
+handler_db_duration = Histogram(
+    "mediator_handler_db_duration_seconds", "Tiempo de base de datos de los handlers del mediator.", ("handler",),
+)
+
+REGISTRY: List[Histogram] = [http_request_duration, http_request_db_duration, handler_duration, handler_db_duration]
+
+
+def render_metrics() -> str:
+    return "\n".join(line for histogram in REGISTRY for line in histogram.render()) + "\n"
+
+
+class DbTimer:
+    """Tiempo acumulado de las sentencias SQL ejecutadas en una petición."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self):
+        self.seconds = 0.0
+
+
+_db_timer: ContextVar[Optional[DbTimer]] = ContextVar("db_timer", default=None)
+
+
+def current_db_seconds() -> float:
+    timer = _db_timer.get()
+    return timer.seconds if timer is not None else 0.0
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _db_timer.get() is not None:
+        conn.info["metrics_query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info.pop("metrics_query_start", None)
+    timer = _db_timer.get()
+    if start is not None and timer is not None:
+        timer.seconds += time.perf_counter() - start
+
+
+def install_db_timing() -> None:
+    """Escucha los eventos de cursor de todos los engines (el async ejecuta sobre un Engine sync)."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mide cada petición HTTP. La ruta es la plantilla que resolvió
+    FastAPI (`scope["route"]`), no la URL: `/products/bulk/{job_id}` y no un id por
+    petición. Las peticiones que no encajan en ninguna ruta se agrupan en `unmatched`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        install_db_timing()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        timer = DbTimer()
+        token = _db_timer.set(timer)
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            _db_timer.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            http_request_duration.observe(elapsed, scope["method"], path, str(status_code))
+            http_request_db_duration.observe(timer.seconds, scope["method"], path)
+
+
+def handler_name(request) -> str:
+    """Nombre del handler registrado para `request` (por convención, `<Request>Handler`)."""
+    handler = mediatr_registry.__handlers__.get(type(request))
+    return getattr(handler, "__name__", None) or f"{type(request).__name__}Handler"
+
+
+@Mediator.behavior
+class HandlerMetricsBehavior:
+    """
+    Behavior del pipeline del mediator para todas las requests (`object`): mide la
+    duración del handler y la parte que pasó en la base de datos. Funciona con
+    `send` (handlers sync) y con `send_async`, donde `next()` devuelve una corutina.
+    """
+
+    def handle(self, request: object, next):
+        if not settings.metrics_enabled:
+            return next()
+        name = handler_name(request)
+        start, db_start = time.perf_counter(), current_db_seconds()
+        try:
+            result = next()
+        except BaseException:
+            self._observe(name, "error", start, db_start)
+            raise
+        if inspect.isawaitable(result):
+            return self._observe_async(name, result, start, db_start)
+        self._observe(name, "success", start, db_start)
+        return result
+
+    async def _observe_async(self, name: str, result, start: float, db_start: float):
+        try:
+            value = await result
+        except BaseException:
+            self._observe(name, "error", start, db_start)
+            raise
+        self._observe(name, "success", start, db_start)
+        return value
+
+    @staticmethod
+    def _observe(name: str, outcome: str, start: float, db_start: float) -> None:
+        handler_duration.observe(time.perf_counter() - start, name, outcome)
+        handler_db_duration.observe(current_db_seconds() - db_start, name)
@@ -0,0 +1,165 @@
+"""
+Perfilador de SQL por petición: sentencias, filas y tiempo de base de datos, y
+detección de sentencias repetidas (el síntoma de un N+1: la misma SQL con distintos
+parámetros, p. ej. una carga perezosa de `CategoryEntity.products` por cada fila).
+
+  - `install_query_profiler(engine)` engancha los eventos de cursor de un engine
+    (`core/database.py` lo hace con los engines sync y async de la aplicación).
+  - `profile_queries()` abre un perfil en el contexto actual; sin perfil activo los
+    eventos no hacen nada más que consultar una ContextVar.
+  - `QueryProfilerMiddleware` perfila las peticiones que traen la cabecera
+    `X-Query-Profile` (si `QUERY_PROFILER_ENABLED`): devuelve el resumen en cabeceras
+    `X-Query-*` y lo escribe en el log, con aviso si hay sentencias repetidas.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from asisya_api.core.config import settings
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+_current_profile: ContextVar[Optional["QueryProfile"]] = ContextVar("query_profile", default=None)
+
+
+class StatementStats:
+    __slots__ = ("count", "rows", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+
+class QueryProfile:
+    """
+    Sentencias ejecutadas en una unidad de trabajo, agrupadas por su SQL (con
+    parámetros enlazados, así que la misma consulta con otro id cuenta como repetida).
+
+    Las filas son las que informa el driver (`cursor.rowcount`): las afectadas por
+    INSERT/UPDATE/DELETE y, con psycopg2, también las devueltas por un SELECT; los
+    drivers que no lo informan (SQLite, asyncpg en SELECT) no suman filas.
+    """
+
+    def __init__(self):
+        self.statements = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.by_statement: Dict[str, StatementStats] = {}
+
+    def record(self, statement: str, rows: int, seconds: float) -> None:
+        stats = self.by_statement.get(statement)
+        if stats is None:
+            stats = self.by_statement[statement] = StatementStats()
+        stats.count += 1
+        stats.seconds += seconds
+        self.statements += 1
+        self.seconds += seconds
+        if rows > 0:
+            stats.rows += rows
+            self.rows += rows
+
+    def repeated(self, threshold: Optional[int] = None) -> List[Tuple[str, StatementStats]]:
+        """Sentencias ejecutadas al menos `threshold` veces, de más a menos repetida."""
+        threshold = threshold or settings.query_profiler_repeat_threshold
+        repeated = [(sql, stats) for sql, stats in self.by_statement.items() if stats.count >= threshold]
+        return sorted(repeated, key=lambda item: item[1].count, reverse=True)
+
+    def summary(self) -> str:
+        return (
+            f"{self.statements} queries, {self.rows} rows, {self.seconds * 1000:.1f} ms, "
+            f"{len(self.repeated())} repeated"
+        )
+
+    def report(self) -> str:
+        """Resumen y detalle por sentencia (la más costosa primero), para logs y asserts."""
+        lines = [self.summary()]
+        ordered = sorted(self.by_statement.items(), key=lambda item: item[1].seconds, reverse=True)
+        for sql, stats in ordered:
+            lines.append(f"  {stats.count}x {stats.seconds * 1000:.1f} ms {stats.rows} rows: {_shorten(sql)}")
+        return "\n".join(lines)
+
+
+def _shorten(sql: str, limit: int = 200) -> str:
+    sql = " ".join(sql.split())
+    return sql if len(sql) <= limit else sql[:limit] + "..."
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    """
+    Perfila las sentencias del contexto actual (y de las tareas y greenlets que se
+    creen dentro). Si ya hay un perfil activo se reutiliza.
+    """
+    current = _current_profile.get()
+    if current is not None:
+        yield current
+        return
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info["profiler_query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info.pop("profiler_query_start", None)
+    profile = _current_profile.get()
+    if start is not None and profile is not None:
+        profile.record(statement, cursor.rowcount, time.perf_counter() - start)
+
+
+def install_query_profiler(engine) -> None:
+    """Engancha el perfilador a un `Engine` (para un `AsyncEngine`, su `sync_engine`)."""
+    engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryProfilerMiddleware:
+    """
+    Middleware ASGI que perfila la petición si trae la cabecera configurada
+    (`QUERY_PROFILER_HEADER`). Los totales se añaden a la respuesta al empezar a
+    enviarla: en una respuesta en streaming no incluyen las consultas posteriores,
+    que sí aparecen en el log al terminar.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.header = settings.query_profiler_header.lower().encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(name == self.header for name, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as profile:
+
+            async def send_with_profile(message):
+                if message["type"] == "http.response.start":
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-query-count", str(profile.statements).encode()),
+                        (b"x-query-rows", str(profile.rows).encode()),
+                        (b"x-query-time-ms", f"{profile.seconds * 1000:.3f}".encode()),
+                        (b"x-query-repeated", str(len(profile.repeated())).encode()),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_profile)
+            finally:
+                route = f"{scope['method']} {scope['path']}"
+                logger.info(f"Query profile {route}: {profile.summary()}")
+                for sql, stats in profile.repeated():
+                    logger.warning(f"Repeated query in {route} ({stats.count}x): {_shorten(sql)}")
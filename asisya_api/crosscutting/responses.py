@@ -0,0 +1,32 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    # Lo que orjson no serializa de forma nativa; Decimal como jsonable_encoder (int o float)
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def json_dumps(content: Any) -> bytes:
+    """JSON con orjson y los mismos formatos que `jsonable_encoder` (también para NDJSON)."""
+    return orjson.dumps(content, default=_default)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Respuesta JSON serializada con orjson, para los listados grandes.
+
+    orjson convierte de forma nativa (en C) dicts, listas, dataclasses (los DTOs de
+    categorías) y datetimes con el mismo formato ISO que `jsonable_encoder`; Decimal se
+    convierte con `_default`. Se usa devolviendo la respuesta directamente desde el
+    endpoint, de modo que FastAPI no valida el contenido contra `response_model` ni lo
+    recorre con `jsonable_encoder` (el `response_model` de la ruta queda para OpenAPI).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
@@ -2,3 +2,4 @@ from asisya_api.domain.user import UserEntity
 from asisya_api.domain.product import ProductEntity
 from asisya_api.domain.category import CategoryEntity
 from asisya_api.domain.role import Role
+from asisya_api.domain.import_job import ImportJobEntity, ImportJobErrorEntity
@@ -0,0 +1,53 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, func
+
+from asisya_api.core.database import Base
+
+# Estados de un job de importación
+JOB_QUEUED = "queued"          # creado, mensajes encolándose o pendientes
+JOB_PROCESSING = "processing"  # el worker ya ha procesado algún mensaje
+JOB_COMPLETED = "completed"    # todos los mensajes procesados (puede tener filas fallidas)
+JOB_FAILED = "failed"          # no se pudo encolar todo el catálogo
+
+
+class ImportJobEntity(Base):
+    """Carga masiva de productos: progreso y contadores por resultado de fila."""
+
+    __tablename__ = "product_import_jobs"
+
+    id = Column(String(32), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    source = Column(String(20), nullable=False)  # json | csv | ndjson
+    on_conflict = Column(String(10), nullable=False)
+    status = Column(String(20), nullable=False, default=JOB_QUEUED)
+
+    # Lado de la API (None mientras se lee un fichero)
+    total_rows = Column(Integer, nullable=True)
+    rejected_rows = Column(Integer, nullable=False, default=0)
+    messages_total = Column(Integer, nullable=True)
+
+    # Lado del worker (se incrementan una vez por mensaje)
+    messages_processed = Column(Integer, nullable=False, default=0)
+    inserted_rows = Column(Integer, nullable=False, default=0)
+    updated_rows = Column(Integer, nullable=False, default=0)
+    unchanged_rows = Column(Integer, nullable=False, default=0)
+    skipped_rows = Column(Integer, nullable=False, default=0)
+    duplicate_rows = Column(Integer, nullable=False, default=0)
+    failed_rows = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)  # filas guardadas en el informe de errores
+
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+
+
+class ImportJobErrorEntity(Base):
+    """Fila rechazada de un job (informe de errores descargable)."""
+
+    __tablename__ = "product_import_job_errors"
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(String(32), ForeignKey("product_import_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    line = Column(Integer, nullable=True)  # sólo en cargas desde fichero validadas en la API
+    sku = Column(String(100), nullable=True)
+    name = Column(String(255), nullable=True)
+    error = Column(Text, nullable=False)
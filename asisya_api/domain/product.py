@@ -14,6 +14,7 @@ from sqlalchemy import (
     DateTime,
     func,
     Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from asisya_api.core.database import Base
@@ -40,7 +41,8 @@ class ProductEntity(Base):
     available = Column(Boolean, default=True, nullable=False)
 
     # Relaciones
-    category_id = Column(Integer, ForeignKey("categories.id", ondelete="SET NULL"), nullable=True, index=True)
+    # Sin índice propio: `ix_products_category_available_price_id` empieza por category_id
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="SET NULL"), nullable=True)
     category = relationship("CategoryEntity", back_populates="products", lazy="joined")
 
     created_by_user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
@@ -52,6 +54,21 @@ class ProductEntity(Base):
 
     __table_args__ = (
         Index("ix_products_name_sku", "name", "sku"),
+        # Índices (columna, id) para la paginación por cursor (keyset)
+        Index("ix_products_name_id", "name", "id"),
+        Index("ix_products_price_id", "price", "id"),
+        Index("ix_products_created_at_id", "created_at", "id"),
+        # Combinaciones de filtros del listado (GetProductsQuery); los totales salen de
+        # index-only scans. Los parciales cubren el caso habitual `discontinued = false`
+        Index("ix_products_category_available_price_id", "category_id", "available", "price", "id"),
+        Index(
+            "ix_products_active_category_id", "category_id", "id",
+            postgresql_where=text("discontinued = false"), sqlite_where=text("discontinued = 0"),
+        ),
+        Index(
+            "ix_products_active_price_id", "price", "id",
+            postgresql_where=text("discontinued = false"), sqlite_where=text("discontinued = 0"),
+        ),
     )
 
     def to_domain(self, storage_url_resolver: Optional[callable] = None) -> "Product":
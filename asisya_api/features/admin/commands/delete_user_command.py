@@ -1,4 +1,5 @@
 from mediatr import Mediator
+from asisya_api.crosscutting.authorization import invalidate_authenticated_user
 from asisya_api.features.user.repository import UserRepository
 from asisya_api.crosscutting.logging import get_logger
 
@@ -16,6 +17,9 @@ class DeleteUserCommandHandler:
     def handle(self, command: DeleteUserCommand) -> None:
         logger.info(f"Deleting user with id: {command.user_id}")
         try:
+            user = self.user_repository.get(command.user_id)
+            username = user.username if user else None
             self.user_repository.delete(command.user_id)
+            invalidate_authenticated_user(username)
         except Exception as e:
             raise ValueError(f"Error deleting user: {str(e)}")
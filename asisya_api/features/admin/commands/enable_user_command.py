@@ -1,4 +1,5 @@
 from mediatr import Mediator
+from asisya_api.crosscutting.authorization import invalidate_authenticated_user
 from asisya_api.features.user.repository import UserRepository
 from asisya_api.features.user.models import User
 from asisya_api.crosscutting.logging import get_logger
@@ -23,5 +24,6 @@ class EnableUserCommandHandler:
 
         user.disabled = False
         self.user_repository.update(user)
+        invalidate_authenticated_user(user.username)
         logger.info(f"User {user.username} has been enabled.")
         return User.model_validate(user, from_attributes=True)
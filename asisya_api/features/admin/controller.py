@@ -5,6 +5,7 @@ from asisya_api.features.admin.commands.delete_user_command import DeleteUserCom
 from asisya_api.features.user.models import User
 from asisya_api.features.admin.commands.enable_user_command import EnableUserCommand
 from asisya_api.features.admin.queries.get_all_users_query import GetAllUsersQuery
+from asisya_api.features.admin.queries.get_cache_stats_query import GetCacheStatsQuery
 from asisya_api.crosscutting.logging import get_logger
 from asisya_api.features.user.models import User
 
@@ -21,6 +22,7 @@ class AdminController:
         self.router.get("/users", response_model=list[User])(self.get_all_users)
         self.router.put("/users/{user_id}/enable", response_model=User)(self.enable_user)    
         self.router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)(self.delete_user)
+        self.router.get("/cache-stats", description="Aciertos y fallos de las cachés del proceso")(self.get_cache_stats)
 
     async def get_all_users(self):
         logger.info(f"an admin user is retrieving all users")
@@ -44,3 +46,6 @@ class AdminController:
             await self.mediator.send_async(DeleteUserCommand(user_id))
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def get_cache_stats(self):
+        return await self.mediator.send_async(GetCacheStatsQuery())
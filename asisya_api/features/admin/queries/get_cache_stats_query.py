@@ -0,0 +1,17 @@
+from mediatr import Mediator
+
+from asisya_api.crosscutting.cache import cache_stats
+# Las cachés se registran al importar el módulo que las declara
+import asisya_api.features.categories.cache  # noqa: F401
+import asisya_api.features.products.counting  # noqa: F401
+
+
+class GetCacheStatsQuery:
+    """Query para las métricas (aciertos, fallos, tamaño...) de las cachés del proceso."""
+    pass
+
+
+@Mediator.handler
+class GetCacheStatsQueryHandler:
+    def handle(self, query: GetCacheStatsQuery) -> dict:
+        return cache_stats()
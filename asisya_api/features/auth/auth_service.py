@@ -3,14 +3,27 @@ from fastapi import HTTPException, status
 from jose import ExpiredSignatureError, JWTError, jwt
 from passlib.context import CryptContext
 from asisya_api.core.config import settings
+from asisya_api.crosscutting.bounded_executor import BoundedExecutor
 from asisya_api.domain.user import UserEntity
 from asisya_api.features.user.repository import UserRepository
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt tarda ~250 ms por operación a propósito: se ejecuta en este pool y no en el event loop
+password_executor = BoundedExecutor(
+    "password-hash",
+    max_workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+)
+
 class AuthService:   
-    def __init__(self, user_repo: UserRepository):
-        self.user_repo = user_repo
+    def __init__(self, user_repo: UserRepository | None = None):
+        self._user_repo = user_repo
+
+    @property
+    def user_repo(self) -> UserRepository:
+        # Sin repositorio explícito se usa el de la unidad de trabajo de la petición en curso
+        return self._user_repo if self._user_repo is not None else UserRepository.instance()
 
     def authenticate_user(self, username: str, password: str) -> UserEntity | None:
         user = self.user_repo.get_by_username(username)
@@ -18,6 +31,14 @@ class AuthService:
             return None
         return user
 
+    async def authenticate_user_async(self, username: str, password: str) -> UserEntity | None:
+        """
+        Como `authenticate_user`, ejecutado entero en `password_executor`. La búsqueda del
+        usuario también va al pool: esperar una conexión del pool sync nunca bloquea el
+        event loop y sólo `max_workers` logins tienen una conexión abierta durante bcrypt.
+        """
+        return await password_executor.run(self.authenticate_user, username, password)
+
     def create_access_token(self, data: dict, expires_delta: timedelta | None = None):
         to_encode = data.copy()
         if expires_delta:
@@ -46,6 +67,11 @@ class AuthService:
     @staticmethod
     def get_password_hash(password: str) -> str:
         return pwd_context.hash(password)
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        """Como `get_password_hash`, ejecutado en `password_executor`."""
+        return await password_executor.run(pwd_context.hash, password)
     
     def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
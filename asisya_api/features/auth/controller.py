@@ -20,7 +20,7 @@ class AuthController:
 
     async def authenticate(self, form_data: OAuth2PasswordRequestForm = Depends()):
         logger.info(f"Logging in user: {form_data.username}")
-        user = self.auth_service.authenticate_user(form_data.username, form_data.password)
+        user = await self.auth_service.authenticate_user_async(form_data.username, form_data.password)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
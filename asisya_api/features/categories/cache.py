@@ -0,0 +1,83 @@
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Optional, Union
+
+from asisya_api.core.config import settings
+from asisya_api.crosscutting.cache import (
+    CacheBackend,
+    LocalCacheBackend,
+    ReadThroughCache,
+    RedisCacheBackend,
+    register_cache,
+)
+from asisya_api.features.categories.models import CategoryResponseDTO
+
+# Claves de la caché de categorías
+ALL_CATEGORIES = "all"
+
+
+def category_key(category_id: int) -> str:
+    return f"id:{category_id}"
+
+
+def _encode_category(category: CategoryResponseDTO) -> dict:
+    data = asdict(category)
+    data["created_at"] = category.created_at.isoformat() if category.created_at else None
+    data["updated_at"] = category.updated_at.isoformat() if category.updated_at else None
+    return data
+
+
+def _decode_category(data: dict) -> CategoryResponseDTO:
+    for field in ("created_at", "updated_at"):
+        if data[field] is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    return CategoryResponseDTO(**data)
+
+
+def encode_categories(value: Union[CategoryResponseDTO, List[CategoryResponseDTO]]) -> bytes:
+    if isinstance(value, list):
+        return json.dumps([_encode_category(category) for category in value]).encode()
+    return json.dumps(_encode_category(value)).encode()
+
+
+def decode_categories(raw: bytes) -> Union[CategoryResponseDTO, List[CategoryResponseDTO]]:
+    data = json.loads(raw)
+    if isinstance(data, list):
+        return [_decode_category(item) for item in data]
+    return _decode_category(data)
+
+
+def build_cache_backend(backend: str, redis_url: Optional[str] = None, max_size: int = 256) -> CacheBackend:
+    if backend == "local":
+        return LocalCacheBackend(max_size=max_size)
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("REDIS_URL is required when CATEGORY_CACHE_BACKEND=redis")
+        # Dependencia opcional: sólo se exige a quien usa el backend redis
+        import redis
+
+        return RedisCacheBackend(redis.Redis.from_url(redis_url, socket_timeout=0.5))
+    raise ValueError(f"Unknown cache backend '{backend}'. Allowed: local, redis")
+
+
+# Las categorías cambian pocas veces al día y el frontend las pide en cada render
+category_cache = register_cache("categories", ReadThroughCache(
+    "categories",
+    build_cache_backend(
+        settings.category_cache_backend, settings.redis_url, settings.category_cache_max_size
+    ),
+    ttl_seconds=settings.category_cache_ttl_seconds,
+    encode=encode_categories,
+    decode=decode_categories,
+))
+
+
+def invalidate_categories(*category_ids: int) -> None:
+    """Tras crear, actualizar o borrar: el listado completo y las categorías afectadas."""
+    category_cache.invalidate(ALL_CATEGORIES, *(category_key(category_id) for category_id in category_ids))
+
+
+async def invalidate_categories_async(*category_ids: int) -> None:
+    """Igual que `invalidate_categories`, para handlers async."""
+    await category_cache.invalidate_async(ALL_CATEGORIES, *(category_key(category_id) for category_id in category_ids))
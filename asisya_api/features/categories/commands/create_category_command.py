@@ -2,11 +2,11 @@ from mediatr import Mediator
 from fastapi import UploadFile
 from typing import Optional
 
-from asisya_api.core.config import settings
 from asisya_api.domain.category import CategoryEntity
+from asisya_api.features.categories.cache import invalidate_categories_async
 from asisya_api.features.categories.models import CategoryCreateDTO, CategoryResponseDTO
-from asisya_api.features.categories.repository import CategoryRepository
-from asisya_api.infrastructure.storage_service import LocalStorage, S3Storage
+from asisya_api.features.categories.repository import AsyncCategoryRepository
+from asisya_api.infrastructure.storage_service import get_storage
 from asisya_api.crosscutting.logging import get_logger
 
 logger = get_logger(__name__)
@@ -26,20 +26,17 @@ class CreateCategoryCommand:
 @Mediator.handler
 class CreateCategoryCommandHandler:
     def __init__(self):
-        self.category_repository = CategoryRepository.instance()
-        self.storage = (
-            S3Storage(settings.aws_s3_bucket, settings.aws_region)
-            if settings.storage_backend == "s3"
-            else LocalStorage()
-        )
+        self.category_repository = AsyncCategoryRepository.instance()
+        self.storage = get_storage()
 
-    def handle(self, request: CreateCategoryCommand) -> CategoryResponseDTO:
+    async def handle(self, request: CreateCategoryCommand) -> CategoryResponseDTO:
         logger.info(f"User {request.user.id} is creating category '{request.data.name}'")
 
-        # 1️⃣ Guardar imagen si fue enviada
+        # 1️⃣ Guardar imagen si fue enviada (sin bloquear el event loop: una imagen
+        # grande no debe frenar el resto de peticiones)
         picture_key = None
         if request.picture:
-            picture_key = self.storage.save(request.picture, prefix="categories")
+            picture_key = await self.storage.save_async(request.picture, prefix="categories")
             logger.debug(f"Imagen guardada en: {picture_key}")
 
         # 2️⃣ Crear la entidad ORM
@@ -51,8 +48,15 @@ class CreateCategoryCommandHandler:
         )
 
         # 3️⃣ Persistir en BD
-        created_category = self.category_repository.create(category_entity)
+        try:
+            created_category = await self.category_repository.create(category_entity)
+        except ValueError:
+            # Slug o nombre duplicado: no dejar la imagen huérfana
+            if picture_key:
+                await self.storage.delete_async(picture_key)
+            raise
         logger.info(f"Categoría creada: ID={created_category.id}, nombre={created_category.name}")
+        await invalidate_categories_async()
 
         # 4️⃣ Obtener URL pública
         picture_url = (
@@ -1,3 +1,6 @@
+from asisya_api.features.categories.cache import invalidate_categories
+
+
 class DeleteCategoryCommand:
     def __init__(self, repo):
         self.repo = repo
@@ -7,3 +10,4 @@ class DeleteCategoryCommand:
         if not category:
             raise ValueError("Category not found")
         self.repo.delete(category)
+        invalidate_categories(category_id)
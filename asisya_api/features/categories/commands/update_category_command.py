@@ -1,3 +1,6 @@
+from asisya_api.features.categories.cache import invalidate_categories
+
+
 class UpdateCategoryCommand:
     def __init__(self, repo):
         self.repo = repo
@@ -12,4 +15,6 @@ class UpdateCategoryCommand:
         category.description = data.description or category.description
         category.picture_path = data.picture_path or category.picture_path
 
-        return self.repo.update(category)
+        updated = self.repo.update(category)
+        invalidate_categories(category_id)
+        return updated
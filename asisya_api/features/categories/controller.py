@@ -1,8 +1,11 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, UploadFile, File, Form
 from mediatr import Mediator
 
+from asisya_api.core.config import settings
 from asisya_api.crosscutting.authorization import get_authenticated_user
+from asisya_api.crosscutting.http_cache import conditional_response
+from asisya_api.crosscutting.responses import FastJSONResponse
 from asisya_api.features.categories.commands.create_category_command import CreateCategoryCommand
 from asisya_api.features.categories.queries.get_all_categories_query import GetAllCategoriesQuery
 from asisya_api.features.categories.queries.get_category_by_id_query import GetCategoryByIdQuery
@@ -11,8 +14,11 @@ from asisya_api.features.user.models import User
 
 
 CREATE_CATEGORY_DESCRIPTION = "Crea una nueva categoría con información básica y una imagen opcional."
-GET_CATEGORIES_DESCRIPTION = "Obtiene todas las categorías disponibles."
-GET_CATEGORY_BY_ID_DESCRIPTION = "Obtiene una categoría específica por su ID."
+GET_CATEGORIES_DESCRIPTION = (
+    "Obtiene todas las categorías disponibles. Responde con `ETag`: con `If-None-Match` "
+    "devuelve 304 sin cuerpo si no han cambiado."
+)
+GET_CATEGORY_BY_ID_DESCRIPTION = "Obtiene una categoría específica por su ID (con `ETag`, como el listado)."
 
 
 class CategoryController:
@@ -64,18 +70,18 @@ class CategoryController:
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    async def get_all_categories(self):
+    async def get_all_categories(self, request: Request, response: Response):
         try:
             query = GetAllCategoriesQuery()
             result = await self.mediator.send_async(query)
-            return result
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return conditional_response(request, response, result, settings.categories_cache_control, FastJSONResponse)
 
-    async def get_category_by_id(self, category_id: int):
+    async def get_category_by_id(self, category_id: int, request: Request, response: Response):
         try:
             query = GetCategoryByIdQuery(category_id)
             result = await self.mediator.send_async(query)
-            return result
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return conditional_response(request, response, result, settings.categories_cache_control)
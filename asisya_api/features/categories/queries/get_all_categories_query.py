@@ -1,5 +1,6 @@
 from mediatr import Mediator
-from asisya_api.features.categories.repository import CategoryRepository
+from asisya_api.features.categories.cache import ALL_CATEGORIES, category_cache
+from asisya_api.features.categories.repository import AsyncCategoryRepository
 from asisya_api.features.categories.models import CategoryResponseDTO
 from asisya_api.crosscutting.logging import get_logger
 
@@ -14,13 +15,17 @@ class GetAllCategoriesQuery:
 @Mediator.handler
 class GetAllCategoriesQueryHandler:
     def __init__(self):
-        self.category_repository = CategoryRepository.instance()
+        self.category_repository = AsyncCategoryRepository.instance()
 
-    def handle(self, query: GetAllCategoriesQuery) -> list[CategoryResponseDTO]:
-        categories = self.category_repository.get_all()
+    async def handle(self, query: GetAllCategoriesQuery) -> list[CategoryResponseDTO]:
+        # Read-through: la base de datos sólo se consulta si el listado no está en caché
+        categories = await category_cache.get_or_load(ALL_CATEGORIES, self._load)
         if not categories:
             raise ValueError("No categories found")
+        return categories
 
+    async def _load(self) -> list[CategoryResponseDTO]:
+        categories = await self.category_repository.get_all()
         logger.debug(f"Se encontraron {len(categories)} categorías registradas")
 
         # Convertimos las entidades ORM a DTOs para respuesta
@@ -1,5 +1,6 @@
 from mediatr import Mediator
-from asisya_api.features.categories.repository import CategoryRepository
+from asisya_api.features.categories.cache import category_cache, category_key
+from asisya_api.features.categories.repository import AsyncCategoryRepository
 from asisya_api.features.categories.models import CategoryResponseDTO
 from asisya_api.crosscutting.logging import get_logger
 
@@ -15,12 +16,18 @@ class GetCategoryByIdQuery:
 @Mediator.handler
 class GetCategoryByIdQueryHandler:
     def __init__(self):
-        self.category_repository = CategoryRepository.instance()
+        self.category_repository = AsyncCategoryRepository.instance()
 
-    def handle(self, query: GetCategoryByIdQuery) -> CategoryResponseDTO:
-        category = self.category_repository.get(query.category_id)
+    async def handle(self, query: GetCategoryByIdQuery) -> CategoryResponseDTO:
+        # Una categoría inexistente lanza ValueError y no se cachea
+        return await category_cache.get_or_load(
+            category_key(query.category_id), lambda: self._load(query.category_id)
+        )
+
+    async def _load(self, category_id: int) -> CategoryResponseDTO:
+        category = await self.category_repository.get(category_id)
         if not category:
-            raise ValueError(f"Category with ID {query.category_id} not found")
+            raise ValueError(f"Category with ID {category_id} not found")
 
         logger.debug(f"Categoría encontrada: {category.name} (ID={category.id})")
 
@@ -1,6 +1,7 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from asisya_api.core.database import get_db
-from asisya_api.core.base_repository import BaseRepository
+from asisya_api.core.unit_of_work import current_async_session, current_session
+from asisya_api.core.base_repository import AsyncBaseRepository, BaseRepository
 from asisya_api.domain.category import CategoryEntity
 
 
@@ -10,10 +11,8 @@ class CategoryRepository(BaseRepository[CategoryEntity]):
 
     @classmethod
     def instance(cls):
-        if cls._instance is None:
-            db = next(get_db())
-            cls._instance = cls(db)
-        return cls._instance
+        # Repositorio ligado a la sesión de la unidad de trabajo actual (petición o mensaje)
+        return cls(current_session())
 
     def get_by_name(self, name: str) -> CategoryEntity:
         """
@@ -26,3 +25,13 @@ class CategoryRepository(BaseRepository[CategoryEntity]):
         Retorna una categoría por su slug, si existe.
         """
         return self.db.query(CategoryEntity).filter(CategoryEntity.slug == slug).first()
+
+
+class AsyncCategoryRepository(AsyncBaseRepository[CategoryEntity]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(CategoryEntity, db)
+
+    @classmethod
+    def instance(cls):
+        # Repositorio ligado a la sesión async de la unidad de trabajo actual
+        return cls(current_async_session())
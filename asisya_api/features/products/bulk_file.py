@@ -0,0 +1,129 @@
+"""
+Lectura incremental de ficheros de carga masiva (CSV o NDJSON).
+
+El fichero se recorre línea a línea y cada fila se valida con `ProductBulkCreateDTO`
+al leerla: en memoria sólo está el bloque de filas que se va a encolar. Las líneas NDJSON
+de más de `MAX_LINE_BYTES` se rechazan sin llegar a cargarlas.
+"""
+import codecs
+import csv
+import io
+import json
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from asisya_api.features.products.models import ProductBulkCreateDTO
+
+CSV = "csv"
+NDJSON = "ndjson"
+
+EXTENSIONS = {".csv": CSV, ".ndjson": NDJSON, ".jsonl": NDJSON}
+CONTENT_TYPES = {
+    "text/csv": CSV,
+    "application/csv": CSV,
+    "application/x-ndjson": NDJSON,
+    "application/ndjson": NDJSON,
+    "application/jsonl": NDJSON,
+}
+
+# Errores de fila que se devuelven como muestra (el resto sólo se cuentan)
+MAX_REPORTED_ERRORS = 100
+
+# Línea NDJSON más larga que se acepta: acota la memoria también con un fichero sin saltos de línea
+MAX_LINE_BYTES = 1024 * 1024
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str]) -> str:
+    extension = Path(filename or "").suffix.lower()
+    if extension in EXTENSIONS:
+        return EXTENSIONS[extension]
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in CONTENT_TYPES:
+        return CONTENT_TYPES[media_type]
+    raise ValueError("Unsupported file format. Upload a .csv or .ndjson file")
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
+    )
+
+
+class BulkFileReader:
+    """
+    Itera un fichero subido y entrega productos válidos en bloques (`read_valid`).
+    Las filas inválidas se cuentan en `rejected` y las primeras `max_errors` se guardan
+    en `errors` con su número de línea.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        file_format: str,
+        max_errors: int = MAX_REPORTED_ERRORS,
+        max_line_bytes: int = MAX_LINE_BYTES,
+    ):
+        self.file_format = file_format
+        self.max_errors = max_errors
+        self._rows = self._csv_rows(file) if file_format == CSV else self._ndjson_rows(file, max_line_bytes)
+        self.accepted = 0
+        self.rejected = 0
+        self.errors: List[dict] = []
+
+    @staticmethod
+    def _csv_rows(file: BinaryIO) -> Iterator[Tuple[int, object]]:
+        text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        reader = csv.DictReader(text)
+        if not reader.fieldnames:
+            return
+        for row in reader:
+            # Celdas vacías = campo no informado
+            data = {key.strip(): (value.strip() or None) for key, value in row.items() if key and value is not None}
+            yield reader.line_num, data
+        text.detach()
+
+    @staticmethod
+    def _ndjson_rows(file: BinaryIO, max_line_bytes: int) -> Iterator[Tuple[int, object]]:
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        line_number = 0
+        while raw_line := file.readline(max_line_bytes + 1):
+            line_number += 1
+            if len(raw_line) > max_line_bytes and not raw_line.endswith(b"\n"):
+                # Se descarta el resto de la línea por bloques, sin cargarla entera
+                while raw_line and not raw_line.endswith(b"\n"):
+                    raw_line = file.readline(max_line_bytes)
+                yield line_number, ValueError(f"Line longer than {max_line_bytes} bytes")
+                continue
+            line = decoder.decode(raw_line).strip()
+            if not line:
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ValueError(f"Invalid JSON: {e.msg}")
+
+    def _reject(self, line_number: int, message: str) -> None:
+        self.rejected += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line_number, "error": message})
+
+    def read_valid(self, max_rows: int) -> List[dict]:
+        """Hasta `max_rows` productos válidos (lista vacía al final del fichero)."""
+        products = []
+        for line_number, data in self._rows:
+            if isinstance(data, Exception):
+                self._reject(line_number, str(data))
+            elif not isinstance(data, dict):
+                self._reject(line_number, "Each line must be a JSON object")
+            else:
+                try:
+                    products.append(ProductBulkCreateDTO(**data).model_dump(exclude_unset=True))
+                except ValidationError as e:
+                    self._reject(line_number, _format_validation_error(e))
+                    continue
+                self.accepted += 1
+                if len(products) >= max_rows:
+                    break
+        return products
@@ -0,0 +1,57 @@
+from typing import List, Optional
+
+from asisya_api.crosscutting.logging import get_logger
+from asisya_api.features.products.counting import product_count_cache
+from asisya_api.features.products.ingestion import ON_CONFLICT_ERROR
+from asisya_api.features.products.normalization import ProductNormalizer, get_product_normalizer
+from asisya_api.features.products.repository import ImportJobRepository, ProductRepository
+from asisya_api.features.products.search import product_search_index
+
+logger = get_logger(__name__)
+
+
+def load_product_batch(
+    products: List[dict],
+    user_id: Optional[int],
+    on_conflict: str = ON_CONFLICT_ERROR,
+    job_id: Optional[str] = None,
+    normalizer: Optional[ProductNormalizer] = None,
+) -> dict:
+    """
+    Normaliza e inserta un lote de productos (un mensaje del worker o una carga
+    síncrona de la API) y suma el resultado a su job. Usa la sesión de la unidad de
+    trabajo actual; devuelve el resultado por fila o el error que rechazó el lote.
+
+    Sólo los rechazos por los datos cuentan como filas fallidas. Un error transitorio de
+    base de datos se propaga sin tocar el job, para que el mensaje se reintente.
+    """
+    normalizer = normalizer or get_product_normalizer()
+    errors = []
+
+    def on_error(product, error):
+        logger.error(f"❌ Error normalizando producto {product.get('name')}: {str(error)}")
+        errors.append({"sku": product.get("sku"), "name": product.get("name"), "error": str(error)})
+
+    # Todo el lote de una vez: alias, conversiones y SKU por columnas, una sola marca de tiempo
+    rows = normalizer.normalize(products, user_id, on_error=on_error)
+    try:
+        result = ProductRepository.instance().bulk_ingest(rows, on_conflict)
+        logger.info(f"✅ Batch procesado ({on_conflict}): {result.counts}")
+        outcome = {"user_id": user_id, **result.to_dict()}
+        counts, failed_rows = result.counts, len(errors)
+    except ValueError as e:
+        # La base de datos rechaza los datos del lote: todas sus filas cuentan como fallidas
+        logger.warning(f"⚠️ Error en bulk_ingest: {str(e)}")
+        outcome = {"user_id": user_id, "error": str(e)}
+        errors.append({"error": f"Batch of {len(products)} rows rejected: {e}"})
+        counts, failed_rows = {}, len(products)
+
+    if job_id:
+        ImportJobRepository.instance().record_batch(job_id, counts, failed_rows, errors)
+    return outcome
+
+
+def invalidate_product_caches() -> None:
+    """Los totales cacheados y el índice de búsqueda en memoria dejan de ser válidos tras una carga."""
+    product_count_cache.clear()
+    product_search_index.invalidate()
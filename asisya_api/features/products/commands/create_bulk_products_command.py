@@ -1,57 +1,130 @@
 from mediatr import Mediator
-from typing import List, Dict
-import json
+from typing import List, Dict, Optional
+import threading
+import uuid
 import boto3
 import os
+
+from starlette.concurrency import run_in_threadpool
+
+from asisya_api.core.config import settings
+from asisya_api.features.products.bulk_load import invalidate_product_caches, load_product_batch
+from asisya_api.features.products.repository import AsyncImportJobRepository
+from asisya_api.infrastructure.sqs_batch_sender import QueueSendError, SqsBatchSender, chunk_messages
 from asisya_api.crosscutting.logging import get_logger
 
 logger = get_logger(__name__)
 
+_sender: Optional[SqsBatchSender] = None
+_sender_lock = threading.Lock()
+
+
+def get_bulk_products_sender() -> SqsBatchSender:
+    """
+    Emisor compartido por el proceso: crear un cliente de boto3 cuesta decenas de
+    milisegundos y mantiene su propio pool de conexiones HTTP, no tiene sentido por petición.
+    """
+    global _sender
+    with _sender_lock:
+        if _sender is None:
+            # Configurar cliente SQS apuntando a LocalStack o AWS real
+            sqs_client = boto3.client(
+                "sqs",
+                endpoint_url=os.getenv("AWS_ENDPOINT_URL"),
+                aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                region_name=os.getenv("AWS_DEFAULT_REGION"),
+            )
+            _sender = SqsBatchSender(
+                sqs_client,
+                os.getenv("BULK_PRODUCTS_QUEUE_URL"),
+                max_workers=settings.sqs_send_concurrency,
+                max_retries=settings.sqs_send_max_retries,
+            )
+        return _sender
+
 
 class CreateBulkProductsCommand:
-    def __init__(self, products: List[Dict], user):
+    def __init__(self, products: List[Dict], user, on_conflict: str = "error", batch_size: int = 100):
         """
         products: lista de diccionarios con los datos de cada producto
         user: usuario que hace la carga masiva
+        on_conflict: qué hace el worker con los SKU existentes ("error", "update" o "skip")
+        batch_size: máximo de productos por mensaje (también se respeta el límite de 256 KB de SQS)
         """
         self.products = products
         self.user = user
+        self.on_conflict = on_conflict
+        self.batch_size = batch_size
 
 
 @Mediator.handler
 class CreateBulkProductsCommandHandler:
-    def __init__(self):
-        # Configurar cliente SQS apuntando a LocalStack o AWS real
-        self.sqs_client = boto3.client(
-            "sqs",
-            endpoint_url=os.getenv("AWS_ENDPOINT_URL"),
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name=os.getenv("AWS_DEFAULT_REGION"),
-        )
-        self.queue_url = os.getenv("BULK_PRODUCTS_QUEUE_URL")
+    def __init__(self, sender: Optional[SqsBatchSender] = None):
+        self.sender = sender or get_bulk_products_sender()
+        self.jobs = AsyncImportJobRepository.instance()
 
-    def handle(self, request: CreateBulkProductsCommand):
-        logger.info(f"User {request.user.id} encolando {len(request.products)} productos")
+    async def handle(self, request: CreateBulkProductsCommand):
+        job_id = uuid.uuid4().hex
+        if 0 < len(request.products) <= settings.bulk_sync_max_rows:
+            return await self._load_now(request, job_id)
 
-        batch_size = 100  # Cantidad de productos por mensaje
-        total_messages = 0
+        logger.info(f"User {request.user.id} encolando {len(request.products)} productos (job {job_id})")
 
-        for i in range(0, len(request.products), batch_size):
-            batch = request.products[i:i + batch_size]
-            message_body = json.dumps({
-                "user_id": request.user.id,
-                "products": batch
-            })
+        envelope = {"user_id": request.user.id, "on_conflict": request.on_conflict, "job_id": job_id}
+        bodies = list(chunk_messages(request.products, envelope, max_items=request.batch_size))
 
-            self.sqs_client.send_message(
-                QueueUrl=self.queue_url,
-                MessageBody=message_body
-            )
+        # El job existe (y está confirmado) antes de que un worker pueda recibir sus mensajes
+        await self.jobs.start(
+            job_id,
+            request.user.id,
+            "json",
+            request.on_conflict,
+            total_rows=len(request.products),
+            messages_total=len(bodies),
+        )
+
+        # send_message_batch (10 mensajes por llamada), llamadas en paralelo fuera del event loop
+        result = await self.sender.send_async(bodies)
+        logger.info(
+            f"{result.sent} mensajes enviados a SQS para {len(request.products)} productos "
+            f"({result.calls} llamadas)"
+        )
+        if result.failed:
+            await self.jobs.mark_failed(job_id)
+            raise QueueSendError(result.sent, result.failed)
 
-            total_messages += 1
-            logger.debug(f"Lote de {len(batch)} productos encolado (mensaje {total_messages})")
+        return {
+            "job_id": job_id,
+            "message": f"{len(request.products)} productos encolados en {len(bodies)} mensajes",
+            "messages": len(bodies),
+        }
 
-        logger.info(f"{total_messages} mensajes enviados a SQS para {len(request.products)} productos")
+    async def _load_now(self, request: CreateBulkProductsCommand, job_id: str) -> dict:
+        """
+        Carga pequeña: el mismo código que el worker (normalización por columnas e
+        ingesta), en la petición y sin pasar por SQS. Se registra como un job de un mensaje.
+        """
+        logger.info(f"User {request.user.id} cargando {len(request.products)} productos en línea (job {job_id})")
+        await self.jobs.start(
+            job_id, request.user.id, "json", request.on_conflict, total_rows=len(request.products), messages_total=1
+        )
+        # Sesión sync de la unidad de trabajo (COPY en PostgreSQL), fuera del event loop
+        try:
+            result = await run_in_threadpool(
+                load_product_batch, request.products, request.user.id, request.on_conflict, job_id
+            )
+        except Exception:
+            # Error transitorio de base de datos: sin mensaje que reintentar, el job no terminaría
+            await self.jobs.mark_failed(job_id)
+            raise
+        invalidate_product_caches()
+        if "error" in result:
+            raise ValueError(result["error"])
 
-        return {"message": f"{len(request.products)} productos encolados en {total_messages} mensajes"}
+        return {
+            "job_id": job_id,
+            "message": f"{len(request.products)} productos procesados",
+            "messages": 0,
+            "counts": result["counts"],
+        }
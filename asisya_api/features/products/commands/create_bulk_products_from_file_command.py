@@ -0,0 +1,90 @@
+import uuid
+from typing import BinaryIO, Optional
+
+from mediatr import Mediator
+from starlette.concurrency import run_in_threadpool
+
+from asisya_api.features.products.bulk_file import MAX_REPORTED_ERRORS, BulkFileReader, detect_format
+from asisya_api.features.products.commands.create_bulk_products_command import get_bulk_products_sender
+from asisya_api.features.products.repository import MAX_JOB_ERRORS, AsyncImportJobRepository
+from asisya_api.infrastructure.sqs_batch_sender import MAX_BATCH_ENTRIES, QueueSendError, SqsBatchSender, chunk_messages
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Mensajes que se leen y envían de una vez (4 llamadas send_message_batch en paralelo)
+MESSAGES_PER_CHUNK = 4 * MAX_BATCH_ENTRIES
+
+
+class CreateBulkProductsFromFileCommand:
+    """
+    Command para encolar una carga masiva desde un fichero CSV o NDJSON sin cargarlo
+    entero en memoria.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        filename: Optional[str],
+        content_type: Optional[str],
+        user,
+        on_conflict: str = "error",
+        batch_size: int = 100,
+    ):
+        self.file = file
+        self.filename = filename
+        self.content_type = content_type
+        self.user = user
+        self.on_conflict = on_conflict
+        self.batch_size = batch_size
+
+
+@Mediator.handler
+class CreateBulkProductsFromFileCommandHandler:
+    def __init__(self, sender: Optional[SqsBatchSender] = None):
+        self.sender = sender or get_bulk_products_sender()
+        self.jobs = AsyncImportJobRepository.instance()
+
+    async def handle(self, request: CreateBulkProductsFromFileCommand) -> dict:
+        file_format = detect_format(request.filename, request.content_type)
+        # Se guardan tantos errores como admite el informe del job; la respuesta sólo lleva los primeros
+        reader = BulkFileReader(request.file, file_format, max_errors=MAX_JOB_ERRORS)
+        job_id = uuid.uuid4().hex
+        envelope = {"user_id": request.user.id, "on_conflict": request.on_conflict, "job_id": job_id}
+        logger.info(f"User {request.user.id} encolando el fichero '{request.filename}' (job {job_id})")
+
+        # Los totales no se conocen hasta terminar de leer el fichero
+        await self.jobs.start(job_id, request.user.id, file_format, request.on_conflict)
+
+        messages = 0
+        rows_per_chunk = request.batch_size * MESSAGES_PER_CHUNK
+        try:
+            while True:
+                # Lectura y validación en un hilo: el fichero puede estar en disco (SpooledTemporaryFile)
+                products = await run_in_threadpool(reader.read_valid, rows_per_chunk)
+                if not products:
+                    break
+                bodies = list(chunk_messages(products, envelope, max_items=request.batch_size))
+                result = await self.sender.send_async(bodies)
+                messages += result.sent
+                if result.failed:
+                    raise QueueSendError(messages, result.failed)
+        except Exception:
+            # Fichero ilegible a mitad (p. ej. bytes que no son UTF-8) o envío fallido: lo ya
+            # encolado se procesa, pero sin los totales el job no podría completarse nunca
+            await self.jobs.mark_failed(job_id)
+            raise
+
+        await self.jobs.finish_enqueue(job_id, reader.accepted, reader.rejected, messages, reader.errors)
+
+        logger.info(
+            f"Job {job_id}: {reader.accepted} productos encolados en {messages} mensajes, "
+            f"{reader.rejected} filas rechazadas"
+        )
+        return {
+            "job_id": job_id,
+            "accepted": reader.accepted,
+            "rejected": reader.rejected,
+            "messages": messages,
+            "errors": reader.errors[:MAX_REPORTED_ERRORS],
+        }
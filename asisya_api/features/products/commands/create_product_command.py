@@ -1,8 +1,10 @@
 from mediatr import Mediator
 
 from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.counting import product_count_cache
 from asisya_api.features.products.models import ProductCreateDTO, ProductResponseDTO
 from asisya_api.features.products.repository import ProductRepository
+from asisya_api.features.products.search import product_search_index
 
 from asisya_api.crosscutting.logging import get_logger
 
@@ -44,6 +46,9 @@ class CreateProductCommandHandler:
 
         # Guardar en base de datos
         created_product = self.product_repository.create(product_entity)
+        # Los totales cacheados y el índice de búsqueda en memoria dejan de ser válidos
+        product_count_cache.clear()
+        product_search_index.invalidate()
 
         # Mapear a DTO de respuesta
         return ProductResponseDTO(
@@ -1,13 +1,66 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Form, File, UploadFile, Body
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Form, File, UploadFile, Body
 from mediatr import Mediator
+from asisya_api.core.config import settings
 from asisya_api.crosscutting.authorization import get_authenticated_user
+from asisya_api.crosscutting.http_cache import conditional_response
+from asisya_api.crosscutting.responses import FastJSONResponse
 from asisya_api.features.products.commands.create_bulk_products_command import CreateBulkProductsCommand
-from asisya_api.features.products.models import ProductCreateDTO, ProductResponseDTO, BulkProductsRequestDTO
+from asisya_api.features.products.commands.create_bulk_products_from_file_command import CreateBulkProductsFromFileCommand
+from asisya_api.features.products.models import (
+    BulkConflictMode,
+    BulkProductsRequestDTO,
+    ExportFormat,
+    ImportJobResponseDTO,
+    ProductCreateDTO,
+    ProductResponseDTO,
+)
 from asisya_api.features.products.commands.create_product_command import CreateProductCommand
+from asisya_api.features.products.queries.export_products_query import ExportProductsQuery
+from asisya_api.features.products.queries.get_import_job_errors_query import GetImportJobErrorsQuery
+from asisya_api.features.products.queries.get_import_job_query import GetImportJobQuery
 from asisya_api.features.products.queries.get_products_query import GetProductsQuery
+from asisya_api.features.products.search import InMemoryProductSearchIndex
 from asisya_api.features.user.models import User
-from fastapi.responses import JSONResponse
+from asisya_api.infrastructure.sqs_batch_sender import QueueSendError
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+GET_PRODUCTS_DESCRIPTION = (
+    "Listado paginado de productos. Usa `page` para paginar por número de página, "
+    "o `cursor` (vacío para la primera página, luego el `next_cursor` recibido) "
+    "para paginación por cursor con latencia constante en páginas profundas. "
+    "`search` busca en nombre, SKU y descripción y ordena por relevancia; sólo pagina por "
+    "`page` (`next_cursor` es nulo). Sin PostgreSQL la búsqueda devuelve como mucho los "
+    f"{InMemoryProductSearchIndex.MAX_RESULTS} productos más relevantes y, si llega a ese "
+    "límite, `total_items_is_estimate` es true. "
+    "`include_category` añade `category_name` a cada producto. "
+    "Responde con `ETag`: con `If-None-Match` devuelve 304 sin cuerpo si la página no ha cambiado."
+)
+
+EXPORT_DESCRIPTION = (
+    "Exporta todos los productos que cumplen los filtros (los mismos que el listado, sin "
+    "paginación) como NDJSON o CSV, ordenados por id. La respuesta se envía en streaming "
+    "a medida que se lee de la base de datos. Sin PostgreSQL, con `search` se exportan como "
+    f"mucho los {InMemoryProductSearchIndex.MAX_RESULTS} productos más relevantes."
+)
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+BULK_DESCRIPTION = (
+    "Carga masiva de productos. Se encola y responde 202 con el `job_id` para seguir su "
+    "progreso; las cargas de hasta `BULK_SYNC_MAX_ROWS` productos se procesan en la propia "
+    "petición y responden 200 con el resultado."
+)
+
+BULK_FILE_DESCRIPTION = (
+    "Carga masiva desde un fichero CSV (cabecera con los campos del producto) o NDJSON "
+    "(un objeto JSON por línea). El fichero se valida y se encola a medida que se lee; "
+    "las filas inválidas se descartan y se devuelven las primeras con su número de línea."
+)
 
 
 class ProductController:
@@ -18,8 +71,16 @@ class ProductController:
 
     def _add_routes(self):
         self.router.post("/", response_model=ProductResponseDTO)(self.create_product)
-        self.router.get("/", description="Listado paginado de productos")(self.get_products)
-        self.router.post("/bulk", description="Carga masiva de productos")(self.create_bulk_products)
+        self.router.get("/", description=GET_PRODUCTS_DESCRIPTION)(self.get_products)
+        self.router.get("/export", description=EXPORT_DESCRIPTION)(self.export_products)
+        self.router.post("/bulk", description=BULK_DESCRIPTION)(self.create_bulk_products)
+        self.router.post("/bulk/file", description=BULK_FILE_DESCRIPTION)(self.create_bulk_products_from_file)
+        self.router.get(
+            "/bulk/{job_id}", response_model=ImportJobResponseDTO, description="Estado y contadores de una carga masiva"
+        )(self.get_bulk_job)
+        self.router.get(
+            "/bulk/{job_id}/errors", description="Informe CSV con las filas rechazadas de una carga masiva"
+        )(self.get_bulk_job_errors)
 
     async def create_product(
             self,
@@ -39,6 +100,8 @@ class ProductController:
 
     async def get_products(
             self,
+            request: Request,
+            response: Response,
             page: int = 1,
             per_page: int = 10,
             name: Optional[str] = None,
@@ -47,6 +110,11 @@ class ProductController:
             discontinued: Optional[bool] = None,
             min_price: Optional[float] = None,
             max_price: Optional[float] = None,
+            cursor: Optional[str] = None,
+            sort_by: str = "id",
+            sort_order: str = "asc",
+            search: Optional[str] = None,
+            include_category: bool = False,
     ):
         query = GetProductsQuery(
             page=page,
@@ -57,8 +125,48 @@ class ProductController:
             discontinued=discontinued,
             min_price=min_price,
             max_price=max_price,
+            cursor=cursor,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            search=search,
+            include_category=include_category,
+        )
+        try:
+            result = await self.mediator.send_async(query)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return conditional_response(request, response, result, settings.products_cache_control, FastJSONResponse)
+
+    async def export_products(
+            self,
+            format: ExportFormat = ExportFormat.NDJSON,
+            name: Optional[str] = None,
+            category_id: Optional[int] = None,
+            available: Optional[bool] = None,
+            discontinued: Optional[bool] = None,
+            min_price: Optional[float] = None,
+            max_price: Optional[float] = None,
+            search: Optional[str] = None,
+    ):
+        query = ExportProductsQuery(
+            export_format=format.value,
+            name=name,
+            category_id=category_id,
+            available=available,
+            discontinued=discontinued,
+            min_price=min_price,
+            max_price=max_price,
+            search=search,
+        )
+        try:
+            chunks = await self.mediator.send_async(query)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return StreamingResponse(
+            chunks,
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="products.{format.value}"'},
         )
-        return await self.mediator.send_async(query)
 
     async def create_bulk_products(
             self,
@@ -69,28 +177,97 @@ class ProductController:
         Endpoint para carga masiva de productos.
         Recibe JSON con lista de productos y batch_size opcional.
         """
-        products = bulk_request.products
-        batch_size = bulk_request.batch_size
-
-        # Dividir productos en batches
-        messages = [
-            products[i:i + batch_size]
-            for i in range(0, len(products), batch_size)
-        ]
-
-        # Enviar cada batch como mensaje al command
-        result_messages = []
-        for batch in messages:
-            command = CreateBulkProductsCommand(products=[p.dict() for p in batch], user=current_user)
+        # Un único command: el handler trocea en mensajes y los envía en lotes a SQS
+        command = CreateBulkProductsCommand(
+            # Sólo los campos enviados: con "update" lo que se omite conserva el valor guardado
+            products=[p.model_dump(exclude_unset=True) for p in bulk_request.products],
+            user=current_user,
+            on_conflict=bulk_request.on_conflict.value,
+            batch_size=bulk_request.batch_size,
+        )
+        try:
             result = await self.mediator.send_async(command)
-            result_messages.append(result)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except QueueSendError as e:
+            # Reenviar con on_conflict="update" o "skip" no duplica lo que sí se encoló
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"{len(e.failed)} mensajes no se pudieron encolar ({e.sent} encolados)",
+            )
 
-        total_products = len(products)
-        total_messages = len(messages)
+        if "counts" in result:
+            # Carga pequeña procesada en la propia petición (BULK_SYNC_MAX_ROWS)
+            return JSONResponse(
+                status_code=status.HTTP_200_OK,
+                content={"job_id": result["job_id"], "message": result["message"], "counts": result["counts"]},
+            )
         return JSONResponse(
             status_code=status.HTTP_202_ACCEPTED,
             content={
-                "message": f"{total_products} productos encolados en {total_messages} mensajes",
+                "job_id": result["job_id"],
+                "message": result["message"],
                 "details": "El procesamiento se realizará en segundo plano"
             }
         )
+
+    async def create_bulk_products_from_file(
+            self,
+            file: UploadFile = File(...),
+            on_conflict: BulkConflictMode = Form(BulkConflictMode.ERROR),
+            batch_size: int = Form(100, ge=1, le=200),
+            current_user: User = Depends(get_authenticated_user),
+    ):
+        """
+        Endpoint para carga masiva desde fichero.
+        Devuelve el id del job, cuántas filas se han encolado y cuántas se han rechazado.
+        """
+        command = CreateBulkProductsFromFileCommand(
+            file=file.file,
+            filename=file.filename,
+            content_type=file.content_type,
+            user=current_user,
+            on_conflict=on_conflict.value,
+            batch_size=batch_size,
+        )
+        try:
+            result = await self.mediator.send_async(command)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except QueueSendError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"{len(e.failed)} mensajes no se pudieron encolar ({e.sent} encolados)",
+            )
+
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=result)
+
+    async def get_bulk_job(
+            self,
+            job_id: str,
+            current_user: User = Depends(get_authenticated_user),
+    ):
+        """
+        Endpoint para consultar el progreso de una carga masiva (`job_id` de la respuesta 202).
+        """
+        job = await self.mediator.send_async(GetImportJobQuery(job_id, current_user))
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Import job {job_id} not found")
+        return job
+
+    async def get_bulk_job_errors(
+            self,
+            job_id: str,
+            current_user: User = Depends(get_authenticated_user),
+    ):
+        """
+        Endpoint para descargar el informe de errores de una carga masiva.
+        """
+        report = await self.mediator.send_async(GetImportJobErrorsQuery(job_id, current_user))
+        if report is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Import job {job_id} not found")
+        return Response(
+            content=report,
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="import-{job_id}-errors.csv"'},
+        )
@@ -0,0 +1,84 @@
+import json
+from typing import Hashable, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from asisya_api.core.config import settings
+from asisya_api.crosscutting.cache import TTLCache, register_cache
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Caché de totales compartida por todas las peticiones del proceso
+product_count_cache = register_cache("product_counts", TTLCache(
+    max_size=settings.product_count_cache_max_size,
+    ttl_seconds=settings.product_count_cache_ttl_seconds,
+))
+
+
+class ProductCountStrategy:
+    """
+    Calcula el total de productos de un listado filtrado eligiendo la vía más barata:
+
+      1. Caché con TTL indexada por el conjunto de filtros normalizado.
+      2. En PostgreSQL, estimación del planificador (EXPLAIN) si el resultado es grande.
+      3. Conteo exacto cuando el resultado es pequeño (o no hay estimación disponible).
+
+    Devuelve (total, es_estimacion).
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        cache: TTLCache = product_count_cache,
+        exact_threshold: int = settings.product_count_exact_threshold,
+    ):
+        self.db = db
+        self.cache = cache
+        self.exact_threshold = exact_threshold
+
+    def count(self, cache_key: Hashable, filtered: Select) -> Tuple[int, bool]:
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = None
+        if self._supports_estimate():
+            estimate = self._planner_estimate(filtered)
+            if estimate is not None and estimate > self.exact_threshold:
+                result = (estimate, True)
+
+        if result is None:
+            result = (self._exact_count(filtered), False)
+
+        self.cache.set(cache_key, result)
+        return result
+
+    def _supports_estimate(self) -> bool:
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    def _exact_count(self, filtered: Select) -> int:
+        subquery = filtered.order_by(None).subquery()
+        return self.db.scalar(select(func.count()).select_from(subquery))
+
+    def _planner_estimate(self, filtered: Select):
+        """Filas estimadas por el planificador de PostgreSQL para la consulta filtrada."""
+        try:
+            compiled = filtered.order_by(None).compile(dialect=self.db.get_bind().dialect)
+            params = compiled.params
+            if compiled.positional:
+                # asyncpg usa parámetros posicionales ($1, $2...), psycopg2 por nombre
+                params = tuple(params[name] for name in compiled.positiontup)
+            plan = self.db.connection().exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled}", params
+            ).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            # Un error deja la transacción abortada en PostgreSQL: se limpia antes del conteo exacto
+            self.db.rollback()
+            logger.warning("No se pudo obtener la estimación del planificador: %s", e)
+            return None
@@ -0,0 +1,399 @@
+"""
+Ingesta masiva de productos (worker de carga masiva).
+
+Las filas se normalizan a diccionarios planos con las columnas de `products` y se
+escriben con el camino más rápido que ofrezca la base de datos:
+
+  - PostgreSQL (psycopg2): `COPY` en streaming a una tabla temporal de staging y un
+    único `INSERT ... SELECT` hacia `products`.
+  - Resto (SQLite en desarrollo y tests): `INSERT` con executemany por bloques.
+
+Todas las filas de una llamada a `ingest` van en una sola transacción. Con
+`on_conflict` se elige qué pasa con los SKU que ya existen:
+
+  - "error": la carga entera falla (comportamiento original).
+  - "update": `ON CONFLICT (sku) DO UPDATE`, sólo si algún valor ha cambiado. Sólo se
+    reemplazan los campos que trae cada producto; el resto conserva lo guardado.
+  - "skip": `ON CONFLICT (sku) DO NOTHING`.
+
+El resultado (`IngestResult`) indica qué ha pasado con cada fila. Si la base de datos
+rechaza los datos se lanza ValueError; el resto de errores de base de datos (transitorios)
+se propagan tal cual.
+"""
+import io
+from datetime import datetime
+from decimal import Decimal
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Type
+
+from sqlalchemy import insert, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from asisya_api.domain.product import ProductEntity
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Alias de campos aceptados en la carga
+FIELD_ALIASES = {
+    "stock": "units_in_stock",
+    "qty": "units_in_stock",
+    "quantity": "units_in_stock",
+    "price_value": "price",
+}
+
+# Campos que puede enviar el cliente
+ALLOWED_FIELDS = {
+    "name", "sku", "description", "price", "units_in_stock",
+    "discontinued", "available", "quantity_per_unit", "units_on_order", "category_id"
+}
+
+# Columnas escritas por la ingesta (en este orden en COPY)
+INGEST_COLUMNS = (
+    "name", "sku", "description", "quantity_per_unit", "units_in_stock", "units_on_order",
+    "discontinued", "price", "available", "category_id", "created_by_user_id",
+    "created_at", "updated_at",
+)
+
+# Columnas que reemplaza "update" (se conservan creador y fecha de alta)
+UPSERT_UPDATE_COLUMNS = tuple(
+    column for column in INGEST_COLUMNS if column not in ("sku", "created_by_user_id", "created_at")
+)
+# Columnas que se comparan para decidir si la fila ha cambiado
+UPSERT_COMPARE_COLUMNS = tuple(column for column in UPSERT_UPDATE_COLUMNS if column != "updated_at")
+# Clave de cada fila normalizada con las columnas que reemplaza "update": sólo las que trae
+# el producto (y updated_at). Las que el cliente no envía conservan el valor guardado.
+UPDATE_COLUMNS_KEY = "_update_columns"
+
+# Modos de conflicto por SKU
+ON_CONFLICT_ERROR = "error"
+ON_CONFLICT_UPDATE = "update"
+ON_CONFLICT_SKIP = "skip"
+ON_CONFLICT_MODES = (ON_CONFLICT_ERROR, ON_CONFLICT_UPDATE, ON_CONFLICT_SKIP)
+
+# Resultado de cada fila
+INSERTED = "inserted"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+SKIPPED = "skipped"
+DUPLICATE = "duplicate"
+
+
+@lru_cache(maxsize=None)
+def upsert_update_columns(supplied: FrozenSet[str]) -> Tuple[str, ...]:
+    """Columnas de `UPSERT_UPDATE_COLUMNS` que reemplaza "update" en un producto con los campos `supplied`."""
+    return tuple(column for column in UPSERT_UPDATE_COLUMNS if column in supplied or column == "updated_at")
+
+
+def normalize_product_row(raw: dict, user_id: Optional[int], now: Optional[datetime] = None) -> dict:
+    """
+    Convierte un producto tal como llega en el mensaje en una fila con todas las
+    columnas de `INGEST_COLUMNS`. Lanza ValueError si la fila no es válida.
+    """
+    now = now or datetime.utcnow()
+    normalized = {FIELD_ALIASES.get(k, k): v for k, v in raw.items()}
+
+    name = normalized.get("name")
+    if not name:
+        raise ValueError("Product name is required")
+    normalized["sku"] = normalized.get("sku") or f"{name.lower().replace(' ', '-')}-{user_id}"
+
+    try:
+        price = Decimal(str(normalized["price"])) if normalized.get("price") is not None else Decimal("0.00")
+        units_in_stock = int(normalized["units_in_stock"]) if normalized.get("units_in_stock") is not None else 0
+    except (ArithmeticError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid numeric value for product '{name}': {e}")
+
+    row = {k: v for k, v in normalized.items() if k in ALLOWED_FIELDS}
+    update_columns = upsert_update_columns(frozenset(row))
+    row["price"] = price
+    row["units_in_stock"] = units_in_stock
+    row.setdefault("description", None)
+    row.setdefault("discontinued", False)
+    row.setdefault("available", True)
+    row.setdefault("quantity_per_unit", None)
+    row.setdefault("units_on_order", 0)
+    row.setdefault("category_id", None)
+    row["created_by_user_id"] = user_id
+    row["created_at"] = now
+    row["updated_at"] = now
+    row[UPDATE_COLUMNS_KEY] = update_columns
+    return row
+
+
+class IngestResult:
+    """Resultado por fila (en orden de llegada) de una llamada a `ProductIngestor.ingest`."""
+
+    def __init__(self):
+        self.rows: List[dict] = []
+        self._pending: Dict[str, dict] = {}
+
+    def track(self, rows: Iterable[dict], deduplicate: bool) -> Iterator[dict]:
+        """
+        Registra cada fila a medida que pasa hacia la base de datos. Con `deduplicate`
+        las repeticiones de un SKU dentro de la carga se descartan (gana la primera).
+        """
+        for row in rows:
+            entry = {"sku": row["sku"], "outcome": None}
+            self.rows.append(entry)
+            if deduplicate and row["sku"] in self._pending:
+                entry["outcome"] = DUPLICATE
+                continue
+            self._pending[row["sku"]] = entry
+            yield row
+
+    def resolve(self, written: Dict[str, str], default: str) -> None:
+        """`written`: SKU -> INSERTED/UPDATED de las filas escritas; el resto recibe `default`."""
+        for sku, entry in self._pending.items():
+            entry["outcome"] = written.get(sku, default)
+        self._pending = {}
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return dict(Counter(entry["outcome"] for entry in self.rows))
+
+    @property
+    def written(self) -> int:
+        counts = self.counts
+        return counts.get(INSERTED, 0) + counts.get(UPDATED, 0)
+
+    def to_dict(self) -> dict:
+        return {"counts": self.counts, "rows": self.rows}
+
+
+class ProductIngestor:
+    """
+    Interfaz común: escribe las filas normalizadas y devuelve el resultado por fila.
+
+    `_write` devuelve SKU -> INSERTED/UPDATED de las filas afectadas; con "error"
+    puede devolver un dict vacío (todas las filas se han insertado).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def ingest(self, rows: Iterable[dict], on_conflict: str = ON_CONFLICT_ERROR) -> IngestResult:
+        if on_conflict not in ON_CONFLICT_MODES:
+            raise ValueError(f"Invalid on_conflict '{on_conflict}'. Allowed: {', '.join(ON_CONFLICT_MODES)}")
+
+        result = IngestResult()
+        tracked = result.track(rows, deduplicate=on_conflict != ON_CONFLICT_ERROR)
+        try:
+            written = self._write(tracked, on_conflict)
+            self.db.commit()
+        except (IntegrityError, DataError) as e:
+            # Rechazo por los propios datos (SKU duplicado, valor fuera de rango): reintentar no sirve
+            self.db.rollback()
+            raise ValueError(f"Bulk ingestion rejected by the database: {e.orig}")
+        except SQLAlchemyError:
+            # Conexión perdida, deadlock, fallo de serialización...: se propaga para reintentar el lote
+            self.db.rollback()
+            raise
+
+        default = {ON_CONFLICT_ERROR: INSERTED, ON_CONFLICT_UPDATE: UNCHANGED, ON_CONFLICT_SKIP: SKIPPED}
+        result.resolve(written, default[on_conflict])
+        return result
+
+    def _write(self, rows: Iterable[dict], on_conflict: str) -> Dict[str, str]:
+        raise NotImplementedError
+
+
+def _group_by_update_columns(rows: Iterable[dict]) -> Dict[Tuple[str, ...], List[dict]]:
+    """Agrupa las filas por las columnas que reemplaza "update" (las filas sin la clave, todas)."""
+    groups: Dict[Tuple[str, ...], List[dict]] = {}
+    for row in rows:
+        groups.setdefault(row.get(UPDATE_COLUMNS_KEY, UPSERT_UPDATE_COLUMNS), []).append(row)
+    return groups
+
+
+def _chunks(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ExecutemanyProductIngestor(ProductIngestor):
+    """
+    Alternativa portable: INSERT de Core (executemany) por bloques, sin crear objetos ORM.
+    Los upserts usan el `ON CONFLICT` del dialecto (PostgreSQL o SQLite >= 3.35); con
+    "update" cada bloque se escribe con un INSERT por conjunto de columnas enviadas.
+    """
+
+    chunk_size = 5_000
+    upsert_dialects = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+    def _write(self, rows: Iterable[dict], on_conflict: str) -> Dict[str, str]:
+        table = ProductEntity.__table__
+        if on_conflict == ON_CONFLICT_ERROR:
+            for chunk in _chunks(rows, self.chunk_size):
+                self.db.execute(insert(table), chunk)
+            return {}
+
+        statements = {}
+        written = {}
+        for chunk in _chunks(rows, self.chunk_size):
+            existing = set(self.db.scalars(select(table.c.sku).where(table.c.sku.in_([row["sku"] for row in chunk]))))
+            groups = {(): chunk} if on_conflict == ON_CONFLICT_SKIP else _group_by_update_columns(chunk)
+            for update_columns, group in groups.items():
+                if update_columns not in statements:
+                    statements[update_columns] = self._upsert_statement(on_conflict, update_columns)
+                for sku in self.db.execute(statements[update_columns], group).scalars():
+                    written[sku] = UPDATED if sku in existing else INSERTED
+        return written
+
+    def _upsert_statement(self, on_conflict: str, update_columns: Tuple[str, ...] = UPSERT_UPDATE_COLUMNS):
+        dialect = self.db.get_bind().dialect.name
+        if dialect not in self.upsert_dialects:
+            raise ValueError(f"on_conflict '{on_conflict}' is not supported on {dialect}")
+
+        table = ProductEntity.__table__
+        statement = self.upsert_dialects[dialect](table)
+        if on_conflict == ON_CONFLICT_SKIP:
+            statement = statement.on_conflict_do_nothing(index_elements=[table.c.sku])
+        else:
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.sku],
+                set_={column: statement.excluded[column] for column in update_columns},
+                where=or_(*(
+                    table.c[column].is_distinct_from(statement.excluded[column])
+                    for column in update_columns if column in UPSERT_COMPARE_COLUMNS
+                )),
+            )
+        return statement.returning(table.c.sku)
+
+
+# Escapes del formato de texto de COPY (NULL es \N)
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class _CopyRowStream(io.RawIOBase):
+    """Fichero de sólo lectura que genera las líneas de COPY a medida que se consumen (sin cargarlas enteras)."""
+
+    def __init__(self, rows: Iterable[dict], columns=INGEST_COLUMNS):
+        self._rows = iter(rows)
+        self._columns = columns
+        self._pending = b""
+        self.rows_written = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_chunk(self, size: int) -> bytes:
+        lines, length = [], 0
+        for row in self._rows:
+            line = "\t".join(_copy_value(row[column]) for column in self._columns) + "\n"
+            lines.append(line)
+            length += len(line)
+            self.rows_written += 1
+            if length >= size:
+                break
+        return "".join(lines).encode("utf-8")
+
+    def readinto(self, target) -> int:
+        size = len(target)
+        if not self._pending:
+            self._pending = self._next_chunk(size)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        target[:len(data)] = data
+        return len(data)
+
+
+def _numbered_update_groups(rows: Iterable[dict], groups: Dict[Tuple[str, ...], int]) -> Iterator[dict]:
+    """Anota en cada fila (`update_group`) el número de su conjunto de columnas a reemplazar."""
+    for row in rows:
+        update_columns = row.get(UPDATE_COLUMNS_KEY, UPSERT_UPDATE_COLUMNS)
+        row["update_group"] = groups.setdefault(update_columns, len(groups))
+        yield row
+
+
+class PostgresCopyProductIngestor(ProductIngestor):
+    """
+    COPY a una tabla temporal (se borra con el commit) y un INSERT ... SELECT; con
+    "update", uno por conjunto de columnas enviadas (`update_group` en la tabla temporal).
+    """
+
+    staging_table = "products_staging"
+
+    def _write(self, rows: Iterable[dict], on_conflict: str) -> Dict[str, str]:
+        columns = ", ".join(INGEST_COLUMNS)
+        connection = self.db.connection()
+        connection.exec_driver_sql(
+            f"CREATE TEMP TABLE IF NOT EXISTS {self.staging_table} ON COMMIT DROP AS "
+            f"SELECT {columns}, 0 AS update_group FROM products WITH NO DATA"
+        )
+        groups: Dict[Tuple[str, ...], int] = {}
+        stream = _CopyRowStream(_numbered_update_groups(rows, groups), INGEST_COLUMNS + ("update_group",))
+        with connection.connection.driver_connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {self.staging_table} ({columns}, update_group) FROM STDIN",
+                io.BufferedReader(stream, buffer_size=1 << 16),
+            )
+        logger.debug("COPY de %s filas a %s", stream.rows_written, self.staging_table)
+
+        statement = f"INSERT INTO products ({columns}) SELECT {columns} FROM {self.staging_table}"
+        if on_conflict == ON_CONFLICT_ERROR:
+            connection.exec_driver_sql(statement)
+            return {}
+        if on_conflict == ON_CONFLICT_SKIP:
+            return {
+                sku: INSERTED
+                for sku, in connection.exec_driver_sql(f"{statement} ON CONFLICT (sku) DO NOTHING RETURNING sku")
+            }
+
+        written = {}
+        for update_columns, group in groups.items():
+            assignments = ", ".join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+            changed = " OR ".join(
+                f"products.{column} IS DISTINCT FROM EXCLUDED.{column}"
+                for column in update_columns if column in UPSERT_COMPARE_COLUMNS
+            )
+            # xmax = 0 sólo en las filas recién insertadas (las actualizadas tienen xmax)
+            result = connection.exec_driver_sql(
+                f"{statement} WHERE update_group = {group} "
+                f"ON CONFLICT (sku) DO UPDATE SET {assignments} WHERE {changed} RETURNING sku, (xmax = 0)"
+            )
+            written.update((sku, INSERTED if inserted else UPDATED) for sku, inserted in result)
+        return written
+
+
+# Ingestor por (dialecto, driver); lo que no esté aquí usa ExecutemanyProductIngestor
+PRODUCT_INGESTORS: Dict[tuple, Type[ProductIngestor]] = {
+    ("postgresql", "psycopg2"): PostgresCopyProductIngestor,
+}
+
+
+def get_product_ingestor(db: Session) -> ProductIngestor:
+    dialect = db.get_bind().dialect
+    ingestor_cls = PRODUCT_INGESTORS.get((dialect.name, dialect.driver), ExecutemanyProductIngestor)
+    return ingestor_cls(db)
+
+
+def normalize_rows(
+    products: Iterable[dict],
+    user_id: Optional[int],
+    on_error: Optional[Callable[[dict, ValueError], None]] = None,
+) -> Iterator[dict]:
+    """Normaliza en streaming; las filas inválidas se descartan (y se notifican a `on_error`)."""
+    now = datetime.utcnow()
+    for raw in products:
+        try:
+            yield normalize_product_row(raw, user_id, now)
+        except ValueError as e:
+            if on_error is not None:
+                on_error(raw, e)
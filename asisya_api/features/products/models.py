@@ -1,6 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List
+from enum import Enum
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -45,6 +46,7 @@ class ProductResponseDTO(BaseModel):
 
 class ProductBulkCreateDTO(BaseModel):
     name: str
+    sku: Optional[str] = Field(None, description="Si se omite se genera a partir del nombre y el usuario")
     slug: Optional[str] = None
     description: Optional[str] = None
     price: float
@@ -52,6 +54,51 @@ class ProductBulkCreateDTO(BaseModel):
     category_id: Optional[int] = None
 
 
+class BulkConflictMode(str, Enum):
+    """
+    Qué hacer con los productos cuyo SKU ya existe.
+    """
+    ERROR = "error"    # el lote entero se rechaza
+    UPDATE = "update"  # se actualizan los campos enviados (sólo si alguno ha cambiado)
+    SKIP = "skip"      # se dejan como están
+
+
+class ExportFormat(str, Enum):
+    """
+    Formato de la exportación del catálogo.
+    """
+    NDJSON = "ndjson"  # un producto JSON por línea
+    CSV = "csv"        # cabecera con los campos y un producto por fila
+
+
 class BulkProductsRequestDTO(BaseModel):
     products: List[ProductBulkCreateDTO]
     batch_size: int = Field(100, ge=1, le=200, description="Cantidad de productos por mensaje")
+    on_conflict: BulkConflictMode = Field(
+        BulkConflictMode.ERROR,
+        description=(
+            "`update` o `skip` hacen la carga idempotente: reenviar el mismo catálogo sólo toca lo que cambió. "
+            "`update` sólo reemplaza los campos enviados en cada producto; los omitidos conservan su valor"
+        ),
+    )
+
+
+class ImportJobResponseDTO(BaseModel):
+    """
+    Estado de una carga masiva. `total_rows` y `messages_total` son None mientras la
+    API sigue leyendo el fichero; `progress` es la fracción de mensajes procesados.
+    """
+    job_id: str
+    status: str
+    source: str
+    on_conflict: str
+    total_rows: Optional[int]
+    rejected_rows: int
+    messages_total: Optional[int]
+    messages_processed: int
+    progress: Optional[float]
+    counts: Dict[str, int] = Field(..., description="Filas por resultado: inserted, updated, unchanged, skipped, duplicate, failed")
+    error_count: int = Field(..., description="Filas en el informe de errores (`/products/bulk/{job_id}/errors`)")
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime]
@@ -0,0 +1,224 @@
+"""
+Normalización de cargas masivas por mensaje completo.
+
+`normalize_product_row` valida y completa un producto cada vez. Los normalizadores de
+este módulo reciben todos los productos de un mensaje (o de una carga síncrona en la
+API) y devuelven las filas listas para `ProductRepository.bulk_ingest`:
+
+  - `RowProductNormalizer`: aplica `normalize_product_row` fila a fila.
+  - `ColumnarProductNormalizer`: trabaja por columnas. Los alias se resuelven una vez
+    por conjunto de claves, cada columna se convierte con `map` (sólo los valores que
+    fallan pasan por Python), los SKU se generan sólo donde faltan y todas las filas
+    comparten la misma marca de tiempo.
+
+Ambos producen las mismas filas y los mismos errores; se elige con
+`settings.bulk_normalizer`.
+"""
+from datetime import datetime
+from decimal import Decimal
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Sequence, Type
+
+from asisya_api.core.config import settings
+from asisya_api.features.products.ingestion import (
+    ALLOWED_FIELDS,
+    FIELD_ALIASES,
+    INGEST_COLUMNS,
+    UPDATE_COLUMNS_KEY,
+    normalize_product_row,
+    upsert_update_columns,
+)
+
+OnError = Optional[Callable[[dict, ValueError], None]]
+
+# Valor de cada columna cuando el producto no la trae (price y units_in_stock se convierten después)
+COLUMN_DEFAULTS = {
+    "name": None,
+    "sku": None,
+    "description": None,
+    "quantity_per_unit": None,
+    "units_in_stock": None,
+    "units_on_order": 0,
+    "discontinued": False,
+    "price": None,
+    "available": True,
+    "category_id": None,
+}
+
+_NUMERIC_ERRORS = (ArithmeticError, ValueError, TypeError)
+
+# Columnas que vienen del producto, en el orden de INGEST_COLUMNS (el resto las pone el normalizador)
+_VALUE_COLUMNS = tuple(column for column in INGEST_COLUMNS if column in ALLOWED_FIELDS)
+
+
+class ProductNormalizer:
+    """
+    Interfaz común: normaliza los productos de un mensaje y devuelve las filas válidas
+    en el orden de llegada. Las inválidas se descartan y se notifican a `on_error`.
+    """
+
+    def normalize(
+        self,
+        products: Sequence[dict],
+        user_id: Optional[int],
+        on_error: OnError = None,
+        now: Optional[datetime] = None,
+    ) -> List[dict]:
+        raise NotImplementedError
+
+
+class RowProductNormalizer(ProductNormalizer):
+    """Un producto cada vez con `normalize_product_row`."""
+
+    def normalize(self, products, user_id, on_error=None, now=None):
+        now = now or datetime.utcnow()
+        rows = []
+        for raw in products:
+            try:
+                rows.append(normalize_product_row(raw, user_id, now))
+            except ValueError as e:
+                if on_error is not None:
+                    on_error(raw, e)
+        return rows
+
+
+def _to_price(value) -> Decimal:
+    return Decimal(str(value))
+
+
+class ColumnarProductNormalizer(ProductNormalizer):
+    """Por columnas: el mensaje se agrupa por conjunto de claves y cada grupo se convierte columna a columna."""
+
+    def normalize(self, products, user_id, on_error=None, now=None):
+        now = now or datetime.utcnow()
+        products = list(products)
+        if not products:
+            return []
+
+        # Los productos de un mismo origen (DTO, fichero) traen las mismas claves: un solo grupo
+        keys = list(map(tuple, products))
+        if keys.count(keys[0]) == len(keys):
+            rows, errors = self._normalize_group(keys[0], products, user_id, now)
+        else:
+            rows, errors = self._normalize_groups(keys, products, user_id, now)
+
+        if errors and on_error is not None:
+            for index in sorted(errors):
+                on_error(products[index], errors[index])
+        return [row for row in rows if row is not None] if errors else rows
+
+    def _normalize_groups(self, keys: List[tuple], products: List[dict], user_id, now):
+        groups: Dict[tuple, List[int]] = {}
+        for index, product_keys in enumerate(keys):
+            groups.setdefault(product_keys, []).append(index)
+
+        rows: List[Optional[dict]] = [None] * len(products)
+        errors: Dict[int, ValueError] = {}
+        for group_keys, indexes in groups.items():
+            group_rows, group_errors = self._normalize_group(group_keys, [products[i] for i in indexes], user_id, now)
+            for index, row in zip(indexes, group_rows):
+                rows[index] = row
+            for position, error in group_errors.items():
+                errors[indexes[position]] = error
+        return rows, errors
+
+    @staticmethod
+    def _normalize_group(keys: tuple, group: List[dict], user_id, now):
+        # Alias -> clave original; si dos claves dan la misma columna gana la última (como en el dict por fila)
+        sources = {FIELD_ALIASES.get(key, key): key for key in keys}
+        update_columns = upsert_update_columns(frozenset(sources).intersection(ALLOWED_FIELDS))
+        size = len(group)
+
+        def column(name: str) -> list:
+            source = sources.get(name)
+            if source is None:
+                return [COLUMN_DEFAULTS[name]] * size
+            return list(map(itemgetter(source), group))
+
+        columns = {name: column(name) for name in _VALUE_COLUMNS}
+        names = columns["name"]
+        errors: Dict[int, ValueError] = {
+            position: ValueError("Product name is required") for position, name in enumerate(names) if not name
+        }
+
+        columns["sku"] = [
+            sku or (name and f"{name.lower().replace(' ', '-')}-{user_id}")
+            for sku, name in zip(columns["sku"], names)
+        ]
+        # Columnas ausentes: directamente el valor por defecto, sin convertir None a None
+        if "price" in sources:
+            columns["price"] = _convert_prices(columns["price"], names, errors)
+        else:
+            columns["price"] = [Decimal("0.00")] * size
+        if "units_in_stock" in sources:
+            columns["units_in_stock"] = _convert(columns["units_in_stock"], int, 0, names, errors)
+        else:
+            columns["units_in_stock"] = [0] * size
+
+        # Un literal de dict por fila (más rápido que dict(zip(...))); mismas claves que normalize_product_row
+        rows = [
+            {
+                "name": name, "sku": sku, "description": description, "quantity_per_unit": quantity_per_unit,
+                "units_in_stock": units_in_stock, "units_on_order": units_on_order, "discontinued": discontinued,
+                "price": price, "available": available, "category_id": category_id,
+                "created_by_user_id": user_id, "created_at": now, "updated_at": now,
+                UPDATE_COLUMNS_KEY: update_columns,
+            }
+            for (
+                name, sku, description, quantity_per_unit, units_in_stock, units_on_order,
+                discontinued, price, available, category_id,
+            ) in zip(*(columns[name] for name in _VALUE_COLUMNS))
+        ]
+        for position in errors:
+            rows[position] = None
+        return rows, errors
+
+
+def _convert(values: list, convert, default, names: list, errors: Dict[int, ValueError]) -> list:
+    """
+    Convierte una columna con `map`. Si un valor falla se anota el error de su fila (o
+    se usa `default` si es None) y se sigue desde el siguiente: sin valores inválidos
+    la columna entera se convierte sin pasar por Python fila a fila.
+    """
+    converted = []
+    remaining = iter(values)
+    while True:
+        try:
+            converted.extend(map(convert, remaining))
+            return converted
+        except _NUMERIC_ERRORS as e:
+            # `extend` conserva lo convertido antes del fallo y `map` ya ha consumido el valor
+            # que falla: su posición es len(converted) y se sigue con el siguiente
+            position = len(converted)
+            if values[position] is None:
+                converted.append(default)
+            else:
+                converted.append(None)
+                errors.setdefault(
+                    position, ValueError(f"Invalid numeric value for product '{names[position]}': {e}")
+                )
+
+
+def _convert_prices(values: list, names: list, errors: Dict[int, ValueError]) -> list:
+    """`Decimal(str(v))` por columna, con las dos conversiones en C cuando los tipos lo permiten."""
+    types = set(map(type, values))
+    if types <= {str, int}:
+        # Decimal(v) da el mismo valor que Decimal(str(v)) para texto y enteros
+        return _convert(values, Decimal, Decimal("0.00"), names, errors)
+    if type(None) not in types:
+        return _convert(list(map(str, values)), Decimal, Decimal("0.00"), names, errors)
+    return _convert(values, _to_price, Decimal("0.00"), names, errors)
+
+
+# Normalizador por nombre (`settings.bulk_normalizer`)
+PRODUCT_NORMALIZERS: Dict[str, Type[ProductNormalizer]] = {
+    "row": RowProductNormalizer,
+    "columnar": ColumnarProductNormalizer,
+}
+
+
+def get_product_normalizer(name: Optional[str] = None) -> ProductNormalizer:
+    name = name or settings.bulk_normalizer
+    if name not in PRODUCT_NORMALIZERS:
+        raise ValueError(f"Unknown bulk normalizer '{name}'. Allowed: {', '.join(PRODUCT_NORMALIZERS)}")
+    return PRODUCT_NORMALIZERS[name]()
@@ -0,0 +1,72 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Tuple
+
+from asisya_api.domain.product import ProductEntity
+
+# Columnas por las que se puede ordenar/paginar. Cada una tiene un índice
+# compuesto (columna, id) para que el keyset sea un index range scan.
+SORT_COLUMNS = {
+    "id": ProductEntity.id,
+    "name": ProductEntity.name,
+    "price": ProductEntity.price,
+    "created_at": ProductEntity.created_at,
+}
+
+SORT_ORDERS = ("asc", "desc")
+
+
+def validate_sort(sort_by: str, sort_order: str) -> None:
+    if sort_by not in SORT_COLUMNS:
+        raise ValueError(f"Invalid sort_by '{sort_by}'. Allowed: {', '.join(SORT_COLUMNS)}")
+    if sort_order not in SORT_ORDERS:
+        raise ValueError(f"Invalid sort_order '{sort_order}'. Allowed: {', '.join(SORT_ORDERS)}")
+
+
+def _serialize_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _deserialize_value(sort_by: str, value: Any) -> Any:
+    if sort_by == "id":
+        return int(value)
+    if sort_by == "price":
+        return Decimal(str(value))
+    if sort_by == "created_at":
+        return datetime.fromisoformat(value)
+    return str(value)
+
+
+def encode_cursor(sort_by: str, sort_order: str, last_value: Any, last_id: int) -> str:
+    """
+    Genera un cursor opaco (base64 url-safe) con la posición del último
+    elemento devuelto: (valor de la columna de orden, id).
+    """
+    payload = {"s": sort_by, "o": sort_order, "v": _serialize_value(last_value), "id": last_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> Tuple[Any, int]:
+    """
+    Decodifica un cursor generado por `encode_cursor` y devuelve (valor, id).
+    Lanza ValueError si el cursor es inválido o no corresponde al orden pedido.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_sort, cursor_order = payload["s"], payload["o"]
+        value, last_id = _deserialize_value(cursor_sort, payload["v"]), int(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError, InvalidOperation):
+        raise ValueError("Invalid cursor")
+
+    if cursor_sort != sort_by or cursor_order != sort_order:
+        raise ValueError("Cursor does not match the requested sort")
+    return value, last_id
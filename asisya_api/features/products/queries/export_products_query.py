@@ -0,0 +1,100 @@
+import csv
+import io
+from decimal import Decimal
+from typing import AsyncIterator, Optional
+
+from mediatr import Mediator
+from sqlalchemy import and_, select
+
+from asisya_api.core.config import settings
+from asisya_api.crosscutting.logging import get_logger
+from asisya_api.crosscutting.responses import json_dumps
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.queries.get_products_query import PRODUCT_COLUMNS, build_product_filters
+from asisya_api.features.products.repository import AsyncProductRepository
+from asisya_api.features.products.search import get_product_search
+
+logger = get_logger(__name__)
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+
+class ExportProductsQuery:
+    """
+    Query para exportar todos los productos que cumplen los filtros (los mismos que
+    `GetProductsQuery`, sin paginación) como NDJSON o CSV, ordenados por id.
+    """
+    def __init__(
+        self,
+        export_format: str = "ndjson",
+        name: Optional[str] = None,
+        category_id: Optional[int] = None,
+        available: Optional[bool] = None,
+        discontinued: Optional[bool] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        search: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self.export_format = export_format
+        self.name = name
+        self.category_id = category_id
+        self.available = available
+        self.discontinued = discontinued
+        self.min_price = min_price
+        self.max_price = max_price
+        self.search = search.strip() if search and search.strip() else None
+        self.batch_size = batch_size or settings.product_export_batch_size
+
+
+@Mediator.handler
+class ExportProductsQueryHandler:
+    """
+    Devuelve un iterador async de bloques de bytes (uno por lote de `batch_size` filas)
+    para una `StreamingResponse`. La consulta se lee con un cursor de servidor
+    (`stream` + `yield_per`): en memoria sólo hay un lote a la vez, sin `count()` ni
+    OFFSET. La sesión es la de la unidad de trabajo de la petición, que sigue abierta
+    mientras se envía la respuesta.
+    """
+    def __init__(self):
+        self.repo = AsyncProductRepository.instance()
+
+    async def handle(self, request: ExportProductsQuery) -> AsyncIterator[bytes]:
+        # Se valida antes de empezar a enviar: después ya no se puede responder 400
+        if request.export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{request.export_format}'. Allowed: {', '.join(EXPORT_FORMATS)}")
+        if request.batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        logger.info("Exporting products with filters: %s", request.__dict__)
+
+        stmt = select(*PRODUCT_COLUMNS)
+        filters = build_product_filters(request)
+        if filters:
+            stmt = stmt.where(and_(*filters))
+        if request.search:
+            stmt, _ = await self.repo.db.run_sync(lambda db: get_product_search(db).apply(stmt, request.search))
+        stmt = stmt.order_by(ProductEntity.id).execution_options(yield_per=request.batch_size)
+
+        encode = _encode_ndjson if request.export_format == "ndjson" else _encode_csv
+        return self._stream(stmt, encode, request.export_format == "csv")
+
+    async def _stream(self, stmt, encode, header: bool) -> AsyncIterator[bytes]:
+        result = await self.repo.db.stream(stmt)
+        try:
+            if header:
+                yield _encode_csv([tuple(column.key for column in PRODUCT_COLUMNS)])
+            async for partition in result.partitions():
+                yield encode(partition)
+        finally:
+            # También si el cliente corta la descarga: libera el cursor
+            await result.close()
+
+
+def _encode_ndjson(rows) -> bytes:
+    return b"".join(json_dumps(row._asdict()) + b"\n" for row in rows)
+
+
+def _encode_csv(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
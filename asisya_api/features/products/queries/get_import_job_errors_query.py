@@ -0,0 +1,39 @@
+import csv
+import io
+from typing import Optional
+
+from mediatr import Mediator
+
+from asisya_api.features.products.repository import AsyncImportJobRepository
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+ERROR_REPORT_COLUMNS = ("line", "sku", "name", "error")
+
+
+class GetImportJobErrorsQuery:
+    """Query para el informe de errores (CSV) de una carga masiva del usuario."""
+    def __init__(self, job_id: str, user):
+        self.job_id = job_id
+        self.user = user
+
+
+@Mediator.handler
+class GetImportJobErrorsQueryHandler:
+    def __init__(self):
+        self.repo = AsyncImportJobRepository.instance()
+
+    async def handle(self, query: GetImportJobErrorsQuery) -> Optional[str]:
+        """CSV con una fila por error (`line` sólo en filas rechazadas al leer un fichero)."""
+        job = await self.repo.get_for_user(query.job_id, query.user.id)
+        if job is None:
+            return None
+
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(ERROR_REPORT_COLUMNS)
+        for error in await self.repo.get_errors(job.id):
+            # csv escribe None como celda vacía
+            writer.writerow([getattr(error, column) for column in ERROR_REPORT_COLUMNS])
+        return output.getvalue()
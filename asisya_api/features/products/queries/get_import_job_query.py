@@ -0,0 +1,50 @@
+from typing import Optional
+
+from mediatr import Mediator
+
+from asisya_api.features.products.models import ImportJobResponseDTO
+from asisya_api.features.products.repository import OUTCOME_COUNTERS, AsyncImportJobRepository
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class GetImportJobQuery:
+    """Query para el estado de una carga masiva del usuario."""
+    def __init__(self, job_id: str, user):
+        self.job_id = job_id
+        self.user = user
+
+
+@Mediator.handler
+class GetImportJobQueryHandler:
+    def __init__(self):
+        self.repo = AsyncImportJobRepository.instance()
+
+    async def handle(self, query: GetImportJobQuery) -> Optional[ImportJobResponseDTO]:
+        job = await self.repo.get_for_user(query.job_id, query.user.id)
+        if job is None:
+            return None
+
+        counts = {outcome: getattr(job, column.key) for outcome, column in OUTCOME_COUNTERS.items()}
+        counts["failed"] = job.failed_rows
+        progress = None
+        if job.messages_total is not None:
+            progress = round(job.messages_processed / job.messages_total, 4) if job.messages_total else 1.0
+
+        return ImportJobResponseDTO(
+            job_id=job.id,
+            status=job.status,
+            source=job.source,
+            on_conflict=job.on_conflict,
+            total_rows=job.total_rows,
+            rejected_rows=job.rejected_rows,
+            messages_total=job.messages_total,
+            messages_processed=job.messages_processed,
+            progress=min(progress, 1.0) if progress is not None else None,
+            counts=counts,
+            error_count=job.error_count,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            finished_at=job.finished_at,
+        )
@@ -1,19 +1,49 @@
 from typing import Optional, List
 from mediatr import Mediator
-from sqlalchemy import and_
-from sqlalchemy.orm import Query
+from sqlalchemy import Row, and_, literal, select, tuple_
 from decimal import Decimal
 
-from asisya_api.features.products.repository import ProductRepository
+from asisya_api.features.products.counting import ProductCountStrategy
+from asisya_api.features.products.repository import AsyncProductRepository
+from asisya_api.features.products.search import get_product_search
+from asisya_api.features.products.pagination import SORT_COLUMNS, decode_cursor, encode_cursor, validate_sort
+from asisya_api.domain.category import CategoryEntity
 from asisya_api.domain.product import ProductEntity
 from asisya_api.crosscutting.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Campos de cada item del listado (y de la exportación). Se seleccionan como columnas:
+# sin entidades ORM ni identity map, y sin los joins `lazy="joined"` de `category` y
+# `created_by_user` (que traerían también el hash de la contraseña del usuario)
+PRODUCT_COLUMNS = (
+    ProductEntity.id,
+    ProductEntity.name,
+    ProductEntity.sku,
+    ProductEntity.description,
+    ProductEntity.quantity_per_unit,
+    ProductEntity.units_in_stock,
+    ProductEntity.units_on_order,
+    ProductEntity.discontinued,
+    ProductEntity.price,
+    ProductEntity.available,
+    ProductEntity.category_id,
+    ProductEntity.created_by_user_id,
+    ProductEntity.created_at,
+    ProductEntity.updated_at,
+)
+
 
 class GetProductsQuery:
     """
     Query con filtros y paginación para productos.
+
+    Soporta dos modos:
+      - Por número de página (`page`): calcula totales, pero el coste crece con la página.
+      - Por cursor (`cursor`): keyset sobre (sort_by, id), coste constante en cualquier página.
+
+    `search` busca en name, sku y description y ordena por relevancia (sólo por número de página).
+    `include_category` añade a cada item el nombre de su categoría (`category_name`).
     """
     def __init__(
         self,
@@ -25,6 +55,11 @@ class GetProductsQuery:
         discontinued: Optional[bool] = None,
         min_price: Optional[Decimal] = None,
         max_price: Optional[Decimal] = None,
+        cursor: Optional[str] = None,
+        sort_by: str = "id",
+        sort_order: str = "asc",
+        search: Optional[str] = None,
+        include_category: bool = False,
     ):
         self.page = page
         self.per_page = per_page
@@ -34,45 +69,131 @@ class GetProductsQuery:
         self.discontinued = discontinued
         self.min_price = min_price
         self.max_price = max_price
+        self.cursor = cursor
+        self.sort_by = sort_by
+        self.sort_order = sort_order
+        self.search = search.strip() if search and search.strip() else None
+        self.include_category = include_category
 
 
-@Mediator.handler
-class GetProductsQueryHandler:
-    def __init__(self):
-        self.repo = ProductRepository.instance()
+def build_product_filters(request) -> List:
+    """
+    Condiciones WHERE de los filtros de producto (name, category_id, available,
+    discontinued, min_price, max_price) de `request`: `GetProductsQuery` o cualquier
+    query con esos atributos (p. ej. la exportación del catálogo).
+    """
+    filters = []
 
-    def handle(self, request: GetProductsQuery) -> dict:
-        logger.info("Fetching products with filters: %s", request.__dict__)
+    if request.name:
+        filters.append(ProductEntity.name.ilike(f"%{request.name}%"))
 
-        query: Query = self.repo.db.query(ProductEntity)
-        filters = []
+    if request.category_id:
+        filters.append(ProductEntity.category_id == request.category_id)
 
-        if request.name:
-            filters.append(ProductEntity.name.ilike(f"%{request.name}%"))
+    if request.available is not None:
+        filters.append(ProductEntity.available == request.available)
 
-        if request.category_id:
-            filters.append(ProductEntity.category_id == request.category_id)
+    if request.discontinued is not None:
+        filters.append(ProductEntity.discontinued == request.discontinued)
 
-        if request.available is not None:
-            filters.append(ProductEntity.available == request.available)
+    if request.min_price is not None:
+        filters.append(ProductEntity.price >= request.min_price)
 
-        if request.discontinued is not None:
-            filters.append(ProductEntity.discontinued == request.discontinued)
+    if request.max_price is not None:
+        filters.append(ProductEntity.price <= request.max_price)
 
-        if request.min_price is not None:
-            filters.append(ProductEntity.price >= request.min_price)
+    return filters
 
-        if request.max_price is not None:
-            filters.append(ProductEntity.price <= request.max_price)
 
-        if filters:
-            query = query.filter(and_(*filters))
+@Mediator.handler
+class GetProductsQueryHandler:
+    """
+    Handler async: las consultas usan la `AsyncSession` de la unidad de trabajo, de
+    modo que la espera de la base de datos no bloquea el event loop. El conteo y la
+    búsqueda son sync y se ejecutan con `run_sync` sobre la misma conexión async.
+    """
+    def __init__(self):
+        self.repo = AsyncProductRepository.instance()
 
-        total_items = query.count()
+    async def handle(self, request: GetProductsQuery) -> dict:
+        logger.info("Fetching products with filters: %s", request.__dict__)
+        validate_sort(request.sort_by, request.sort_order)
+
+        filters = self._build_filters(request)
+        if request.cursor is not None:
+            if request.search:
+                raise ValueError("Cursor pagination is not supported together with search")
+            return await self._handle_keyset(request, filters)
+        return await self._handle_page(request, filters)
+
+    def _build_filters(self, request: GetProductsQuery) -> List:
+        return build_product_filters(request)
+
+    def _count_cache_key(self, request: GetProductsQuery) -> tuple:
+        """Clave del total: sólo depende de los filtros (normalizados), no de la página ni del orden."""
+        return (
+            (request.search or "").lower() or None,
+            (request.name or "").strip().lower() or None,
+            request.category_id or None,
+            request.available,
+            request.discontinued,
+            str(Decimal(str(request.min_price)).normalize()) if request.min_price is not None else None,
+            str(Decimal(str(request.max_price)).normalize()) if request.max_price is not None else None,
+        )
+
+    async def _ordered_select(self, request: GetProductsQuery, filters: List):
+        sort_column = SORT_COLUMNS[request.sort_by]
+        if request.sort_order == "desc":
+            order_by = (sort_column.desc(), ProductEntity.id.desc())
+        else:
+            order_by = (sort_column.asc(), ProductEntity.id.asc())
+
+        stmt = select(*PRODUCT_COLUMNS)
+        if request.include_category:
+            # Un único LEFT JOIN explícito, sólo cuando se pide el nombre
+            stmt = stmt.add_columns(CategoryEntity.name.label("category_name")).outerjoin(
+                CategoryEntity, CategoryEntity.id == ProductEntity.category_id
+            )
+        if filters:
+            stmt = stmt.where(and_(*filters))
+        if request.search:
+            stmt, rank_order, _ = await self._apply_search(stmt, request.search)
+            order_by = (rank_order,) + order_by
+        return stmt.order_by(*order_by)
+
+    async def _apply_search(self, stmt, term: str):
+        """(consulta filtrada, orden por relevancia, límite de resultados de la búsqueda o None)"""
+        def apply(db):
+            search = get_product_search(db)
+            return (*search.apply(stmt, term), search.max_results)
+
+        return await self.repo.db.run_sync(apply)
+
+    async def _handle_page(self, request: GetProductsQuery, filters: List) -> dict:
+        filtered = select(ProductEntity.id)
+        if filters:
+            filtered = filtered.where(and_(*filters))
+        max_results = None
+        if request.search:
+            filtered, _, max_results = await self._apply_search(filtered, request.search)
+        cache_key = self._count_cache_key(request)
+        total_items, is_estimate = await self.repo.db.run_sync(
+            lambda db: ProductCountStrategy(db).count(cache_key, filtered)
+        )
+        if max_results is not None and total_items >= max_results:
+            # Búsqueda truncada (índice en memoria): puede haber más coincidencias
+            is_estimate = True
         total_pages = (total_items + request.per_page - 1) // request.per_page
 
-        query = query.offset((request.page - 1) * request.per_page).limit(request.per_page)
-        products = query.all()
+        stmt = (
+            (await self._ordered_select(request, filters))
+            .offset((request.page - 1) * request.per_page)
+            .limit(request.per_page + 1)
+        )
+        products = (await self.repo.db.execute(stmt)).all()
+        # El total puede ser estimado o venir de caché: la página siguiente se detecta con una fila extra
+        has_more = len(products) > request.per_page
+        products = products[:request.per_page]
 
         if not products:
             return {
@@ -80,33 +201,54 @@ class GetProductsQueryHandler:
                 "page": request.page,
                 "per_page": request.per_page,
                 "total_items": 0,
+                "total_items_is_estimate": False,
                 "total_pages": 0,
+                "next_cursor": None,
             }
 
-        items = [
-            {
-                "id": p.id,
-                "name": p.name,
-                "sku": p.sku,
-                "description": p.description,
-                "quantity_per_unit": p.quantity_per_unit,
-                "units_in_stock": p.units_in_stock,
-                "units_on_order": p.units_on_order,
-                "discontinued": p.discontinued,
-                "price": float(p.price),
-                "available": p.available,
-                "category_id": p.category_id,
-                "created_by_user_id": p.created_by_user_id,
-                "created_at": p.created_at,
-                "updated_at": p.updated_at,
-            }
-            for p in products
-        ]
-
         return {
-            "items": items,
+            "items": self._to_items(products),
             "page": request.page,
             "per_page": request.per_page,
             "total_items": total_items,
+            "total_items_is_estimate": is_estimate,
             "total_pages": total_pages,
+            # La búsqueda sólo pagina por número de página: un cursor no se podría usar
+            "next_cursor": self._next_cursor(request, products) if has_more and not request.search else None,
         }
+
+    async def _handle_keyset(self, request: GetProductsQuery, filters: List) -> dict:
+        stmt = await self._ordered_select(request, filters)
+
+        if request.cursor:
+            last_value, last_id = decode_cursor(request.cursor, request.sort_by, request.sort_order)
+            sort_column = SORT_COLUMNS[request.sort_by]
+            if request.sort_by == "id":
+                seek = ProductEntity.id < last_id if request.sort_order == "desc" else ProductEntity.id > last_id
+            else:
+                # Comparación de tuplas (row values): permite usar el índice (columna, id) como rango
+                position = tuple_(literal(last_value, sort_column.type), literal(last_id, ProductEntity.id.type))
+                if request.sort_order == "desc":
+                    seek = tuple_(sort_column, ProductEntity.id) < position
+                else:
+                    seek = tuple_(sort_column, ProductEntity.id) > position
+            stmt = stmt.where(seek)
+
+        # Se pide un elemento extra para saber si existe una página siguiente sin hacer count().
+        products = (await self.repo.db.execute(stmt.limit(request.per_page + 1))).all()
+        has_more = len(products) > request.per_page
+        products = products[:request.per_page]
+
+        return {
+            "items": self._to_items(products),
+            "per_page": request.per_page,
+            "next_cursor": self._next_cursor(request, products) if has_more else None,
+        }
+
+    def _next_cursor(self, request: GetProductsQuery, products: List[Row]) -> str:
+        last = products[-1]
+        return encode_cursor(request.sort_by, request.sort_order, getattr(last, request.sort_by), last.id)
+
+    def _to_items(self, products: List[Row]) -> List[dict]:
+        # Las filas ya traen exactamente los campos del item; sólo el precio cambia de tipo
+        return [{**product._mapping, "price": float(product.price)} for product in products]
@@ -1,7 +1,75 @@
-from asisya_api.core.base_repository import BaseRepository
-from asisya_api.core.database import get_db
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import case, func, insert, literal, select, update
+
+from asisya_api.core.base_repository import AsyncBaseRepository, BaseRepository
+from asisya_api.core.unit_of_work import current_async_session, current_session
+from asisya_api.domain.import_job import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_PROCESSING,
+    JOB_QUEUED,
+    ImportJobEntity,
+    ImportJobErrorEntity,
+)
 from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.ingestion import (
+    DUPLICATE,
+    INSERTED,
+    ON_CONFLICT_ERROR,
+    SKIPPED,
+    UNCHANGED,
+    UPDATED,
+    IngestResult,
+    get_product_ingestor,
+)
+
+# Filas que se guardan como mucho en el informe de errores de un job (el resto sólo se cuentan)
+MAX_JOB_ERRORS = 1000
+
+# Resultado de fila (`IngestResult.counts`) -> contador del job
+OUTCOME_COUNTERS = {
+    INSERTED: ImportJobEntity.inserted_rows,
+    UPDATED: ImportJobEntity.updated_rows,
+    UNCHANGED: ImportJobEntity.unchanged_rows,
+    SKIPPED: ImportJobEntity.skipped_rows,
+    DUPLICATE: ImportJobEntity.duplicate_rows,
+}
+
 
+def _progress_values(messages_processed, messages_total, active_status) -> dict:
+    """
+    `status` y `finished_at` calculados dentro del propio UPDATE: la API (al terminar
+    de encolar) y los workers (por mensaje) actualizan el mismo job sin leerlo antes,
+    y el último en llegar es el que lo da por terminado.
+    """
+    done = messages_total.isnot(None) & (messages_processed >= messages_total)
+    return {
+        "status": case(
+            (ImportJobEntity.status == JOB_FAILED, JOB_FAILED),
+            (done, JOB_COMPLETED),
+            else_=active_status,
+        ),
+        "finished_at": case(
+            (ImportJobEntity.finished_at.isnot(None), ImportJobEntity.finished_at),
+            (done, func.now()),
+            else_=None,
+        ),
+        "updated_at": func.now(),
+    }
+
+
+def _error_rows(job_id: str, errors: Iterable[dict]) -> List[dict]:
+    return [
+        {
+            "job_id": job_id,
+            "line": error.get("line"),
+            "sku": error.get("sku"),
+            "name": error.get("name"),
+            "error": str(error["error"]),
+        }
+        for error in errors
+    ]
 
 
 class ProductRepository(BaseRepository[ProductEntity]):
@@ -10,13 +78,164 @@ class ProductRepository(BaseRepository[ProductEntity]):
 
     @classmethod
     def instance(cls):
-        if cls._instance is None:
-            db = next(get_db())
-            cls._instance = cls(db)
-        return cls._instance
+        # Repositorio ligado a la sesión de la unidad de trabajo actual (petición o mensaje)
+        return cls(current_session())
 
     def get_by_name(self, name: str):
         return self.db.query(ProductEntity).filter(ProductEntity.name == name).first()
 
     def get_by_category(self, category_id: int):
         return self.db.query(ProductEntity).filter(ProductEntity.category_id == category_id).all()
+
+    def bulk_ingest(self, rows, on_conflict: str = ON_CONFLICT_ERROR) -> IngestResult:
+        """
+        Inserta filas ya normalizadas (ver `ingestion.normalize_product_row`) en una sola
+        transacción, con COPY en PostgreSQL. `on_conflict` decide qué hacer con los SKU
+        existentes ("error", "update" o "skip"). Lanza ValueError si la base de datos las rechaza;
+        los errores transitorios (conexión, deadlock) se propagan sin convertir.
+        """
+        return get_product_ingestor(self.db).ingest(rows, on_conflict)
+
+
+class AsyncProductRepository(AsyncBaseRepository[ProductEntity]):
+    def __init__(self, db):
+        super().__init__(ProductEntity, db)
+
+    @classmethod
+    def instance(cls):
+        # Repositorio ligado a la sesión async de la unidad de trabajo actual
+        return cls(current_async_session())
+
+
+class ImportJobRepository(BaseRepository[ImportJobEntity]):
+    """Lado del worker: suma el resultado de cada mensaje a su job."""
+
+    def __init__(self, db):
+        super().__init__(ImportJobEntity, db)
+
+    @classmethod
+    def instance(cls):
+        return cls(current_session())
+
+    def record_batch(
+        self, job_id: str, counts: Dict[str, int], failed_rows: int = 0, errors: Iterable[dict] = ()
+    ) -> None:
+        """
+        Un UPDATE por mensaje (no por fila) con los contadores de `IngestResult.counts`
+        y las filas fallidas, más los errores que aún quepan en el informe.
+
+        SQS entrega al menos una vez: un mensaje reentregado vuelve a sumarse (con
+        `on_conflict` "update" o "skip" sus filas cuentan como unchanged/skipped).
+        """
+        # Bloquea la fila del job: los workers de un mismo job se serializan aquí
+        error_count = self.db.execute(
+            select(ImportJobEntity.error_count).where(ImportJobEntity.id == job_id).with_for_update()
+        ).scalar_one_or_none()
+        if error_count is None:
+            self.db.rollback()
+            return
+
+        stored = _error_rows(job_id, errors)[:max(0, MAX_JOB_ERRORS - error_count)]
+        if stored:
+            self.db.execute(insert(ImportJobErrorEntity), stored)
+
+        messages_processed = ImportJobEntity.messages_processed + 1
+        values = {column.key: column + counts.get(outcome, 0) for outcome, column in OUTCOME_COUNTERS.items()}
+        self.db.execute(
+            update(ImportJobEntity)
+            .where(ImportJobEntity.id == job_id)
+            .values(
+                **values,
+                failed_rows=ImportJobEntity.failed_rows + failed_rows,
+                error_count=ImportJobEntity.error_count + len(stored),
+                messages_processed=messages_processed,
+                **_progress_values(messages_processed, ImportJobEntity.messages_total, JOB_PROCESSING),
+            )
+        )
+        self.db.commit()
+
+
+class AsyncImportJobRepository(AsyncBaseRepository[ImportJobEntity]):
+    """Lado de la API: crea el job, fija sus totales y lo consulta."""
+
+    def __init__(self, db):
+        super().__init__(ImportJobEntity, db)
+
+    @classmethod
+    def instance(cls):
+        return cls(current_async_session())
+
+    async def start(
+        self,
+        job_id: str,
+        user_id: Optional[int],
+        source: str,
+        on_conflict: str,
+        total_rows: Optional[int] = None,
+        messages_total: Optional[int] = None,
+    ) -> ImportJobEntity:
+        """
+        Crea el job antes de encolar nada (los workers lo buscan por id). Los totales
+        se pueden dejar en None y fijarlos después con `finish_enqueue`.
+        """
+        completed = messages_total == 0
+        return await self.create(ImportJobEntity(
+            id=job_id,
+            user_id=user_id,
+            source=source,
+            on_conflict=on_conflict,
+            status=JOB_COMPLETED if completed else JOB_QUEUED,
+            total_rows=total_rows,
+            rejected_rows=0,
+            messages_total=messages_total,
+            messages_processed=0,
+            inserted_rows=0,
+            updated_rows=0,
+            unchanged_rows=0,
+            skipped_rows=0,
+            duplicate_rows=0,
+            failed_rows=0,
+            error_count=0,
+            finished_at=func.now() if completed else None,
+        ))
+
+    async def finish_enqueue(
+        self, job_id: str, total_rows: int, rejected_rows: int, messages_total: int, errors: Iterable[dict] = ()
+    ) -> None:
+        """Totales del lado de la API una vez encolado todo, con las filas que rechazó al validar."""
+        stored = _error_rows(job_id, errors)[:MAX_JOB_ERRORS]
+        if stored:
+            await self.db.execute(insert(ImportJobErrorEntity), stored)
+        await self.db.execute(
+            update(ImportJobEntity)
+            .where(ImportJobEntity.id == job_id)
+            .values(
+                total_rows=total_rows,
+                rejected_rows=rejected_rows,
+                messages_total=messages_total,
+                error_count=ImportJobEntity.error_count + len(stored),
+                **_progress_values(ImportJobEntity.messages_processed, literal(messages_total), ImportJobEntity.status),
+            )
+        )
+        await self.db.commit()
+
+    async def mark_failed(self, job_id: str) -> None:
+        """No se pudo encolar todo: lo ya encolado se procesa, pero el job no se completará."""
+        await self.db.execute(
+            update(ImportJobEntity)
+            .where(ImportJobEntity.id == job_id)
+            .values(status=JOB_FAILED, finished_at=func.now(), updated_at=func.now())
+        )
+        await self.db.commit()
+
+    async def get_for_user(self, job_id: str, user_id: int) -> Optional[ImportJobEntity]:
+        result = await self.db.execute(
+            select(ImportJobEntity).where(ImportJobEntity.id == job_id, ImportJobEntity.user_id == user_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_errors(self, job_id: str) -> List[ImportJobErrorEntity]:
+        result = await self.db.execute(
+            select(ImportJobErrorEntity).where(ImportJobErrorEntity.job_id == job_id).order_by(ImportJobErrorEntity.id)
+        )
+        return list(result.scalars().all())
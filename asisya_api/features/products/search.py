@@ -0,0 +1,184 @@
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, literal_column, or_, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+
+from asisya_api.domain.product import ProductEntity
+from asisya_api.crosscutting.cache import TTLCache
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Documento de búsqueda. Debe coincidir EXACTAMENTE con la expresión del índice GIN
+# `ix_products_search_document` (migración 8c3d2e4f6a10) para que PostgreSQL lo use.
+SEARCH_DOCUMENT_SQL = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(products.name, '') || ' ' || coalesce(products.sku, '') || ' ' || coalesce(products.description, ''))"
+)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class PostgresProductSearch:
+    """
+    Búsqueda sobre name, sku y description usando los índices de PostgreSQL:
+      - tsvector (GIN) para coincidencias por palabra completa,
+      - pg_trgm (GIN) sobre name/sku para coincidencias parciales mientras se escribe.
+    El ranking combina ts_rank y la similitud por trigramas del nombre.
+    """
+
+    # Sin límite: todas las coincidencias cuentan y se pueden recorrer
+    max_results: Optional[int] = None
+
+    def apply(self, stmt: Select, term: str) -> Tuple[Select, ColumnElement]:
+        document = literal_column(SEARCH_DOCUMENT_SQL)
+        ts_query = func.plainto_tsquery(literal_column("'simple'::regconfig"), term)
+        stmt = stmt.where(or_(
+            document.op("@@")(ts_query),
+            ProductEntity.name.ilike(f"%{term}%"),
+            ProductEntity.sku.ilike(f"%{term}%"),
+        ))
+        rank = func.ts_rank(document, ts_query) + func.similarity(ProductEntity.name, term)
+        return stmt, rank.desc()
+
+
+class InMemoryProductSearchIndex:
+    """
+    Índice invertido en memoria para motores sin búsqueda de texto (SQLite en tests
+    y desarrollo local). Se construye perezosamente desde la tabla de productos y se
+    invalida cuando se escriben productos.
+
+    Cada token de la consulta debe aparecer en name, sku o description (el último
+    también como prefijo de palabra); las coincidencias en name/sku puntúan más.
+
+    Sólo se devuelven los `MAX_RESULTS` productos más relevantes: con más coincidencias,
+    el total del listado y la exportación con `search` se quedan en ese límite.
+    """
+
+    NAME_WEIGHT = 3
+    SKU_WEIGHT = 2
+    DESCRIPTION_WEIGHT = 1
+    MAX_RESULTS = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings: Optional[Dict[str, Dict[int, int]]] = None
+        self._tokens: List[str] = []
+        self._generation = 0
+        self._results = TTLCache(max_size=256, ttl_seconds=300)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._postings = None
+            self._tokens = []
+            self._generation += 1
+            self._results.clear()
+
+    def _build(self, db: Session) -> Tuple[Dict[str, Dict[int, int]], List[str]]:
+        generation = self._generation
+        postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        rows = db.execute(
+            select(ProductEntity.id, ProductEntity.name, ProductEntity.sku, ProductEntity.description)
+        )
+        for product_id, name, sku, description in rows:
+            for text, weight in (
+                (name, self.NAME_WEIGHT),
+                (sku, self.SKU_WEIGHT),
+                (description, self.DESCRIPTION_WEIGHT),
+            ):
+                for token in tokenize(text):
+                    scores = postings[token]
+                    scores[product_id] = max(scores.get(product_id, 0), weight)
+        postings = dict(postings)
+        tokens = sorted(postings)
+        with self._lock:
+            # Si se invalidó mientras se leía la tabla, el índice ya nace viejo: no se publica
+            if self._generation == generation:
+                self._postings, self._tokens = postings, tokens
+        logger.debug("Índice de búsqueda en memoria construido con %s términos", len(tokens))
+        return postings, tokens
+
+    def _prefix_matches(self, postings: Dict[str, Dict[int, int]], tokens: List[str], query_token: str) -> Dict[int, int]:
+        """Productos que contienen algún término que empieza por `query_token`."""
+        scores: Dict[int, int] = {}
+        for position in range(bisect_left(tokens, query_token), len(tokens)):
+            token = tokens[position]
+            if not token.startswith(query_token):
+                break
+            exact_bonus = 1 if token == query_token else 0
+            for product_id, weight in postings[token].items():
+                scores[product_id] = max(scores.get(product_id, 0), weight + exact_bonus)
+        return scores
+
+    def search(self, db: Session, term: str) -> List[int]:
+        """Ids de productos ordenados por relevancia descendente."""
+        query_tokens = tokenize(term)
+        if not query_tokens:
+            return []
+        cache_key = tuple(query_tokens)
+        cached = self._results.get(cache_key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            postings, tokens = self._postings, self._tokens
+        if postings is None:
+            # La lectura de la tabla se hace fuera del lock: con una sesión async (run_sync)
+            # la consulta cede el event loop y otra petición podría querer el lock.
+            postings, tokens = self._build(db)
+
+        # Sólo el último token se trata como prefijo (el usuario aún lo está escribiendo)
+        matches = [postings.get(token, {}) for token in query_tokens[:-1]]
+        matches.append(self._prefix_matches(postings, tokens, query_tokens[-1]))
+        matches.sort(key=len)
+        ranked = {}
+        for product_id, score in matches[0].items():
+            total = score
+            for other in matches[1:]:
+                other_score = other.get(product_id)
+                if other_score is None:
+                    break
+                total += other_score
+            else:
+                ranked[product_id] = total
+        ordered = sorted(ranked.items(), key=lambda item: (-item[1], item[0]))
+        result = [product_id for product_id, _ in ordered[:self.MAX_RESULTS]]
+        self._results.set(cache_key, result)
+        return result
+
+
+class InMemoryProductSearch:
+    """Adaptador del índice en memoria con la misma interfaz que `PostgresProductSearch`."""
+
+    def __init__(self, db: Session, index: InMemoryProductSearchIndex):
+        self.db = db
+        self.index = index
+
+    @property
+    def max_results(self) -> Optional[int]:
+        return self.index.MAX_RESULTS
+
+    def apply(self, stmt: Select, term: str) -> Tuple[Select, ColumnElement]:
+        ids = self.index.search(self.db, term)
+        if not ids:
+            return stmt.where(ProductEntity.id.in_([])), ProductEntity.id.asc()
+        positions = {product_id: position for position, product_id in enumerate(ids)}
+        return stmt.where(ProductEntity.id.in_(ids)), case(positions, value=ProductEntity.id).asc()
+
+
+# Índice compartido por el proceso (sólo se usa fuera de PostgreSQL)
+product_search_index = InMemoryProductSearchIndex()
+
+
+def get_product_search(db: Session):
+    if db.get_bind().dialect.name == "postgresql":
+        return PostgresProductSearch()
+    return InMemoryProductSearch(db, product_search_index)
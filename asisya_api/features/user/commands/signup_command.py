@@ -26,7 +26,7 @@ class SignupCommandHandler():
             username=request.user.username,
             email=request.user.email,
             full_name=request.user.full_name,
-            hashed_password=AuthService.get_password_hash(request.user.password),
+            hashed_password=await AuthService.get_password_hash_async(request.user.password),
             disabled=True
         )
         user.set_roles([Role.USER])
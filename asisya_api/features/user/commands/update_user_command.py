@@ -1,5 +1,6 @@
 from mediatr import Mediator
 from asisya_api.features.auth.auth_service import AuthService
+from asisya_api.crosscutting.authorization import invalidate_authenticated_user
 from asisya_api.crosscutting.logging import get_logger
 from asisya_api.domain.role import Role
 from asisya_api.domain.user import UserEntity
@@ -19,7 +20,7 @@ class UpdateUserCommandHandler():
     def __init__(self):
         self.user_repository = UserRepository.instance()
 
-    def handle(self, request: UpdateUserCommand) -> UserEntity:     
+    async def handle(self, request: UpdateUserCommand) -> UserEntity:     
         logger.info(f"Updating user: {request.user_to_update_id}")
         current_user = self.user_repository.get(request.current_user_id)        
 
@@ -34,6 +35,7 @@ class UpdateUserCommandHandler():
         if not user_to_update:
             logger.error("User to update not found")
             raise ValueError("User to update not found")
+        previous_username = user_to_update.username
 
         if request.user_updates.username and request.user_updates.username != user_to_update.username:
             user_to_update.username = request.user_updates.username
@@ -44,12 +46,14 @@ class UpdateUserCommandHandler():
         if request.user_updates.disabled is not None and request.user_updates.disabled != user_to_update.disabled:
             user_to_update.disabled = request.user_updates.disabled
         if request.user_updates.password:
-            new_hashed_password = AuthService.get_password_hash(request.user_updates.password)
+            new_hashed_password = await AuthService.get_password_hash_async(request.user_updates.password)
             if new_hashed_password != user_to_update.hashed_password:
                 user_to_update.hashed_password = new_hashed_password
 
         try:
-            return self.user_repository.update(user_to_update)
+            updated_user = self.user_repository.update(user_to_update)
+            invalidate_authenticated_user(previous_username, updated_user.username)
+            return updated_user
         except ValueError as e:
             logger.error(f"Error updating user: {str(e)}")
             raise ValueError(f"Error updating user: {str(e)}")
\ No newline at end of file
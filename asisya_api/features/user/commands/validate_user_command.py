@@ -1,6 +1,7 @@
 from mediatr import Mediator
 from fastapi import HTTPException, status
 from asisya_api.features.auth.auth_service import AuthService
+from asisya_api.crosscutting.authorization import invalidate_authenticated_user
 from asisya_api.features.user.repository import UserRepository
 from asisya_api.features.user.models import User
 
@@ -27,6 +28,7 @@ class ValidateUserCommandHandler:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
             user.disabled = False
             self.user_repository.update(user)
+            invalidate_authenticated_user(user.username)
             return user
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
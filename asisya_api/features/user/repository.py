@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 from asisya_api.core.base_repository import BaseRepository
 from asisya_api.domain.user import UserEntity
-from asisya_api.core.database import get_db
+from asisya_api.core.unit_of_work import current_session
 
 class UserRepository(BaseRepository[UserEntity]):
     def __init__(self, db: Session):
@@ -9,10 +9,8 @@ class UserRepository(BaseRepository[UserEntity]):
 
     @classmethod
     def instance(cls):
-        if cls._instance is None:
-            db = next(get_db())
-            cls._instance = cls(db)
-        return cls._instance
+        # Repositorio ligado a la sesión de la unidad de trabajo actual (petición o mensaje)
+        return cls(current_session())
     
     def get_by_username(self, username: str) -> UserEntity:
         return self.db.query(UserEntity).filter(UserEntity.username == username).first()
\ No newline at end of file
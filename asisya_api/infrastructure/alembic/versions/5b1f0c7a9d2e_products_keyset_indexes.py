@@ -0,0 +1,36 @@
+"""products keyset pagination indexes
+
+Revision ID: 5b1f0c7a9d2e
+Revises: 24753577381d
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1f0c7a9d2e'
+down_revision: Union[str, Sequence[str], None] = '24753577381d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY (fuera de transacción): no bloquea las escrituras en products mientras se construyen
+    with op.get_context().autocommit_block():
+        op.create_index('ix_products_name_id', 'products', ['name', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_products_price_id', 'products', ['price', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index(
+            'ix_products_created_at_id', 'products', ['created_at', 'id'], unique=False, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_products_created_at_id', table_name='products', postgresql_concurrently=True)
+        op.drop_index('ix_products_price_id', table_name='products', postgresql_concurrently=True)
+        op.drop_index('ix_products_name_id', table_name='products', postgresql_concurrently=True)
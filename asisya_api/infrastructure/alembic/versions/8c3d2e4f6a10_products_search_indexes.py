@@ -0,0 +1,47 @@
+"""products full-text and trigram search indexes
+
+Revision ID: 8c3d2e4f6a10
+Revises: 5b1f0c7a9d2e
+Create Date: 2026-10-18 11:40:03.552917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3d2e4f6a10'
+down_revision: Union[str, Sequence[str], None] = '5b1f0c7a9d2e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Debe coincidir con asisya_api.features.products.search.SEARCH_DOCUMENT_SQL
+SEARCH_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(name, '') || ' ' || coalesce(sku, '') || ' ' || coalesce(description, ''))"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Índices específicos de PostgreSQL; en otros motores se usa el índice en memoria.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY (fuera de transacción): construir un GIN sobre products tarda y no debe
+    # bloquear las escrituras (cargas masivas) mientras tanto
+    with op.get_context().autocommit_block():
+        op.execute(f"CREATE INDEX CONCURRENTLY ix_products_search_document ON products USING gin ({SEARCH_DOCUMENT})")
+        op.execute("CREATE INDEX CONCURRENTLY ix_products_name_trgm ON products USING gin (name gin_trgm_ops)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_products_sku_trgm ON products USING gin (sku gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_sku_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_name_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_search_document")
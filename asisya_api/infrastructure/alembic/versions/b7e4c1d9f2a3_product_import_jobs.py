@@ -0,0 +1,65 @@
+"""product import jobs and error reports
+
+Revision ID: b7e4c1d9f2a3
+Revises: 8c3d2e4f6a10
+Create Date: 2026-10-18 15:22:47.104316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c1d9f2a3'
+down_revision: Union[str, Sequence[str], None] = '8c3d2e4f6a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('product_import_jobs',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('on_conflict', sa.String(length=10), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('total_rows', sa.Integer(), nullable=True),
+    sa.Column('rejected_rows', sa.Integer(), nullable=False),
+    sa.Column('messages_total', sa.Integer(), nullable=True),
+    sa.Column('messages_processed', sa.Integer(), nullable=False),
+    sa.Column('inserted_rows', sa.Integer(), nullable=False),
+    sa.Column('updated_rows', sa.Integer(), nullable=False),
+    sa.Column('unchanged_rows', sa.Integer(), nullable=False),
+    sa.Column('skipped_rows', sa.Integer(), nullable=False),
+    sa.Column('duplicate_rows', sa.Integer(), nullable=False),
+    sa.Column('failed_rows', sa.Integer(), nullable=False),
+    sa.Column('error_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_product_import_jobs_user_id'), 'product_import_jobs', ['user_id'], unique=False)
+    op.create_table('product_import_job_errors',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.String(length=32), nullable=False),
+    sa.Column('line', sa.Integer(), nullable=True),
+    sa.Column('sku', sa.String(length=100), nullable=True),
+    sa.Column('name', sa.String(length=255), nullable=True),
+    sa.Column('error', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['product_import_jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_product_import_job_errors_job_id'), 'product_import_job_errors', ['job_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_product_import_job_errors_job_id'), table_name='product_import_job_errors')
+    op.drop_table('product_import_job_errors')
+    op.drop_index(op.f('ix_product_import_jobs_user_id'), table_name='product_import_jobs')
+    op.drop_table('product_import_jobs')
@@ -0,0 +1,50 @@
+"""products composite and partial indexes for listing filters
+
+Revision ID: d4a8e2f1c3b5
+Revises: b7e4c1d9f2a3
+Create Date: 2026-10-18 15:22:07.481935
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8e2f1c3b5'
+down_revision: Union[str, Sequence[str], None] = 'b7e4c1d9f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY (fuera de transacción): no bloquea las escrituras en products (cargas
+    # masivas incluidas) mientras se construyen
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_products_category_available_price_id', 'products',
+            ['category_id', 'available', 'price', 'id'], unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_products_active_category_id', 'products', ['category_id', 'id'], unique=False,
+            postgresql_where=sa.text('discontinued = false'), sqlite_where=sa.text('discontinued = 0'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_products_active_price_id', 'products', ['price', 'id'], unique=False,
+            postgresql_where=sa.text('discontinued = false'), sqlite_where=sa.text('discontinued = 0'),
+            postgresql_concurrently=True,
+        )
+        # Redundante: el nuevo índice compuesto empieza por category_id
+        op.drop_index('ix_products_category_id', table_name='products', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_products_category_id', 'products', ['category_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_products_active_price_id', table_name='products', postgresql_concurrently=True)
+        op.drop_index('ix_products_active_category_id', table_name='products', postgresql_concurrently=True)
+        op.drop_index('ix_products_category_available_price_id', table_name='products', postgresql_concurrently=True)
@@ -0,0 +1,81 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+
+class InMemoryRedisClient:
+    """
+    Sustituto en memoria del cliente de redis-py (el subconjunto que usa
+    `RedisCacheBackend`) para tests y benchmarks sin un servidor Redis. Como Redis,
+    guarda bytes y expira las claves con `ex` (segundos) o `px` (milisegundos).
+
+    Interfaz:
+      - get(name) -> Optional[bytes]
+      - set(name, value, ex=None, px=None) -> True
+      - delete(*names) -> int  # claves borradas
+      - exists(*names) -> int
+      - ttl(name) -> int  # -2 si no existe, -1 si no expira
+      - flushdb()
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, method: str) -> None:
+        self.calls[method] = self.calls.get(method, 0) + 1
+
+    @staticmethod
+    def _encode(value: Union[bytes, str, int, float]) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    def _live(self, name: str) -> Optional[Tuple[Optional[float], bytes]]:
+        entry = self._data.get(name)
+        if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+            del self._data[name]
+            return None
+        return entry
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            self._count("get")
+            entry = self._live(name)
+            return entry[1] if entry is not None else None
+
+    def set(self, name: str, value, ex: Optional[int] = None, px: Optional[int] = None) -> bool:
+        with self._lock:
+            self._count("set")
+            expires_at = None
+            if ex is not None:
+                expires_at = time.monotonic() + ex
+            elif px is not None:
+                expires_at = time.monotonic() + px / 1000
+            self._data[name] = (expires_at, self._encode(value))
+            return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            self._count("delete")
+            return sum(1 for name in names if self._live(name) is not None and self._data.pop(name))
+
+    def exists(self, *names: str) -> int:
+        with self._lock:
+            self._count("exists")
+            return sum(1 for name in names if self._live(name) is not None)
+
+    def ttl(self, name: str) -> int:
+        with self._lock:
+            entry = self._live(name)
+            if entry is None:
+                return -2
+            if entry[0] is None:
+                return -1
+            return max(0, round(entry[0] - time.monotonic()))
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            self._data.clear()
+            return True
@@ -0,0 +1,134 @@
+import threading
+import time
+import uuid
+
+from botocore.exceptions import ClientError
+
+from asisya_api.infrastructure.storage_service import S3_MIN_PART_SIZE
+
+
+class InMemoryS3Client:
+    """
+    Sustituto en memoria del cliente S3 de boto3 (mismo subconjunto de métodos y
+    respuestas) para tests y benchmarks sin LocalStack. Aplica las reglas de las subidas
+    multipart: partes numeradas, 5 MB mínimo salvo la última y ETags en el orden de
+    las partes al completar.
+
+    `latency_seconds` simula el tiempo de red de cada llamada (bloquea el hilo que la
+    hace, como el cliente real).
+
+    Interfaz:
+      - put_object(Bucket, Key, Body, **kwargs) -> {"ETag"}
+      - create_multipart_upload(Bucket, Key, **kwargs) -> {"UploadId"}
+      - upload_part(Bucket, Key, UploadId, PartNumber, Body) -> {"ETag"}
+      - complete_multipart_upload(Bucket, Key, UploadId, MultipartUpload) -> {"Key"}
+      - abort_multipart_upload(Bucket, Key, UploadId)
+      - head_object(Bucket, Key) -> {"ContentLength"}
+      - delete_object(Bucket, Key)
+      - objects(Bucket) -> Dict[str, bytes]  # contenido guardado (inspección)
+      - pending_uploads() -> int  # subidas multipart sin completar ni abortar
+    """
+
+    exceptions = type("Exceptions", (), {"ClientError": ClientError})
+
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self._objects = {}  # (bucket, key) -> bytes
+        self._uploads = {}  # upload id -> {"bucket", "key", "parts": {número: (etag, bytes)}}
+        self._lock = threading.Lock()
+        self.calls = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _call(self, operation: str) -> None:
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency_seconds:
+                time.sleep(self.latency_seconds)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    @staticmethod
+    def _error(code: str, message: str, operation: str) -> ClientError:
+        return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+    def _upload(self, upload_id: str, operation: str) -> dict:
+        upload = self._uploads.get(upload_id)
+        if upload is None:
+            raise self._error("NoSuchUpload", "The specified upload does not exist", operation)
+        return upload
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs) -> dict:
+        self._call("PutObject")
+        body = Body if isinstance(Body, bytes) else Body.read()
+        with self._lock:
+            self._objects[(Bucket, Key)] = body
+        return {"ETag": f'"{uuid.uuid4().hex}"'}
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs) -> dict:
+        self._call("CreateMultipartUpload")
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = {"bucket": Bucket, "key": Key, "parts": {}}
+        return {"Bucket": Bucket, "Key": Key, "UploadId": upload_id}
+
+    def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes) -> dict:
+        self._call("UploadPart")
+        if not 1 <= PartNumber <= 10_000:
+            raise self._error("InvalidArgument", "Part number must be between 1 and 10000", "UploadPart")
+        etag = f'"{uuid.uuid4().hex}"'
+        with self._lock:
+            self._upload(UploadId, "UploadPart")["parts"][PartNumber] = (etag, bytes(Body))
+        return {"ETag": etag}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict) -> dict:
+        self._call("CompleteMultipartUpload")
+        with self._lock:
+            upload = self._upload(UploadId, "CompleteMultipartUpload")
+            requested = MultipartUpload["Parts"]
+            numbers = [part["PartNumber"] for part in requested]
+            if numbers != sorted(numbers):
+                raise self._error("InvalidPartOrder", "Parts must be in ascending order", "CompleteMultipartUpload")
+            chunks = []
+            for index, part in enumerate(requested):
+                etag, body = upload["parts"].get(part["PartNumber"], (None, None))
+                if etag is None or etag != part["ETag"]:
+                    raise self._error("InvalidPart", f"Part {part['PartNumber']} not found", "CompleteMultipartUpload")
+                if index < len(requested) - 1 and len(body) < S3_MIN_PART_SIZE:
+                    raise self._error("EntityTooSmall", "Part is smaller than the minimum", "CompleteMultipartUpload")
+                chunks.append(body)
+            self._objects[(Bucket, Key)] = b"".join(chunks)
+            del self._uploads[UploadId]
+        return {"Bucket": Bucket, "Key": Key}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> dict:
+        self._call("AbortMultipartUpload")
+        with self._lock:
+            self._uploads.pop(UploadId, None)
+        return {}
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        self._call("HeadObject")
+        with self._lock:
+            body = self._objects.get((Bucket, Key))
+        if body is None:
+            raise self._error("404", "Not Found", "HeadObject")
+        return {"ContentLength": len(body)}
+
+    def delete_object(self, Bucket: str, Key: str) -> dict:
+        self._call("DeleteObject")
+        with self._lock:
+            self._objects.pop((Bucket, Key), None)
+        return {}
+
+    def objects(self, Bucket: str) -> dict:
+        with self._lock:
+            return {key: body for (bucket, key), body in self._objects.items() if bucket == Bucket}
+
+    def pending_uploads(self) -> int:
+        with self._lock:
+            return len(self._uploads)
@@ -0,0 +1,196 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import List
+
+from botocore.exceptions import ClientError
+
+from asisya_api.infrastructure.sqs_batch_sender import MAX_BATCH_ENTRIES, MAX_PAYLOAD_BYTES
+
+DEFAULT_VISIBILITY_TIMEOUT = 30
+
+
+class InMemorySqsClient:
+    """
+    Sustituto en memoria del cliente SQS de boto3 (mismo subconjunto de métodos y
+    respuestas) para tests y benchmarks sin LocalStack. Aplica los límites de SQS:
+    10 entradas por lote, Ids únicos y 256 KB por mensaje y por llamada.
+
+    Los mensajes recibidos quedan invisibles durante su visibility timeout y vuelven a
+    la cola si no se borran a tiempo; `WaitTimeSeconds` espera a que llegue alguno
+    (long polling).
+
+    Interfaz:
+      - send_message(QueueUrl, MessageBody) -> {"MessageId"}
+      - send_message_batch(QueueUrl, Entries) -> {"Successful", "Failed"}
+      - receive_message(QueueUrl, MaxNumberOfMessages, WaitTimeSeconds, VisibilityTimeout) -> {"Messages"}
+      - delete_message(QueueUrl, ReceiptHandle)
+      - delete_message_batch(QueueUrl, Entries) -> {"Successful", "Failed"}
+      - change_message_visibility(QueueUrl, ReceiptHandle, VisibilityTimeout)
+      - change_message_visibility_batch(QueueUrl, Entries) -> {"Successful", "Failed"}
+      - messages(QueueUrl) -> List[str]  # cuerpos pendientes de borrar (inspección)
+    """
+
+    def __init__(self, visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT):
+        self.visibility_timeout = visibility_timeout
+        self._queues = {}
+        self._receipts = {}  # receipt handle -> (queue_url, message_id)
+        self._condition = threading.Condition()
+        self.calls = {}
+
+    def _queue(self, queue_url: str) -> OrderedDict:
+        return self._queues.setdefault(queue_url, OrderedDict())
+
+    def _count(self, operation: str) -> None:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    @staticmethod
+    def _error(code: str, message: str, operation: str) -> ClientError:
+        return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+    def _enqueue(self, queue_url: str, body: str) -> str:
+        message_id = str(uuid.uuid4())
+        self._queue(queue_url)[message_id] = {
+            "MessageId": message_id, "Body": body, "visible_at": 0.0, "receive_count": 0,
+        }
+        return message_id
+
+    def _check_batch(self, entries: List[dict], operation: str) -> None:
+        if not entries:
+            raise self._error("AWS.SimpleQueueService.EmptyBatchRequest", "No entries", operation)
+        if len(entries) > MAX_BATCH_ENTRIES:
+            raise self._error("AWS.SimpleQueueService.TooManyEntriesInBatchRequest", "Too many entries", operation)
+        if len({entry["Id"] for entry in entries}) != len(entries):
+            raise self._error("AWS.SimpleQueueService.BatchEntryIdsNotDistinct", "Ids not distinct", operation)
+
+    def send_message(self, QueueUrl: str, MessageBody: str, **kwargs) -> dict:
+        if len(MessageBody.encode("utf-8")) > MAX_PAYLOAD_BYTES:
+            raise self._error("InvalidParameterValue", "Message must be shorter than 262144 bytes.", "SendMessage")
+        with self._condition:
+            self._count("send_message")
+            message_id = self._enqueue(QueueUrl, MessageBody)
+            self._condition.notify_all()
+        return {"MessageId": message_id}
+
+    def send_message_batch(self, QueueUrl: str, Entries: List[dict], **kwargs) -> dict:
+        operation = "SendMessageBatch"
+        self._check_batch(Entries, operation)
+        if sum(len(entry["MessageBody"].encode("utf-8")) for entry in Entries) > MAX_PAYLOAD_BYTES:
+            raise self._error("AWS.SimpleQueueService.BatchRequestTooLong", "Batch requests too long", operation)
+
+        with self._condition:
+            self._count("send_message_batch")
+            successful = [
+                {"Id": entry["Id"], "MessageId": self._enqueue(QueueUrl, entry["MessageBody"])}
+                for entry in Entries
+            ]
+            self._condition.notify_all()
+        return {"Successful": successful, "Failed": []}
+
+    def receive_message(
+        self,
+        QueueUrl: str,
+        MaxNumberOfMessages: int = 1,
+        WaitTimeSeconds: float = 0,
+        VisibilityTimeout: float = None,
+        **kwargs,
+    ) -> dict:
+        if not 1 <= MaxNumberOfMessages <= MAX_BATCH_ENTRIES:
+            raise self._error("InvalidParameterValue", "MaxNumberOfMessages must be 1..10", "ReceiveMessage")
+        visibility = self.visibility_timeout if VisibilityTimeout is None else VisibilityTimeout
+        deadline = time.monotonic() + WaitTimeSeconds
+
+        with self._condition:
+            self._count("receive_message")
+            while True:
+                now = time.monotonic()
+                queue = self._queue(QueueUrl)
+                received = []
+                for message in queue.values():
+                    if message["visible_at"] <= now:
+                        received.append(message)
+                        if len(received) >= MaxNumberOfMessages:
+                            break
+                if received or now >= deadline:
+                    break
+                # Despierta al llegar mensajes nuevos o al expirar la visibilidad de alguno
+                next_visible = min((m["visible_at"] for m in queue.values()), default=deadline)
+                self._condition.wait(max(0.0, min(deadline, next_visible) - now))
+
+            messages = []
+            for message in received:
+                message["visible_at"] = now + visibility
+                message["receive_count"] += 1
+                receipt_handle = str(uuid.uuid4())
+                self._receipts[receipt_handle] = (QueueUrl, message["MessageId"])
+                messages.append({
+                    "MessageId": message["MessageId"],
+                    "ReceiptHandle": receipt_handle,
+                    "Body": message["Body"],
+                    "Attributes": {"ApproximateReceiveCount": str(message["receive_count"])},
+                })
+        return {"Messages": messages} if messages else {}
+
+    def _message_for(self, queue_url: str, receipt_handle: str):
+        target = self._receipts.get(receipt_handle)
+        if target is None or target[0] != queue_url:
+            return None
+        return self._queue(queue_url).get(target[1])
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str, **kwargs) -> dict:
+        with self._condition:
+            self._count("delete_message")
+            self._delete(QueueUrl, ReceiptHandle)
+        return {}
+
+    def _delete(self, queue_url: str, receipt_handle: str) -> bool:
+        message = self._message_for(queue_url, receipt_handle)
+        self._receipts.pop(receipt_handle, None)
+        if message is None:
+            return False
+        del self._queue(queue_url)[message["MessageId"]]
+        return True
+
+    def delete_message_batch(self, QueueUrl: str, Entries: List[dict], **kwargs) -> dict:
+        self._check_batch(Entries, "DeleteMessageBatch")
+        successful, failed = [], []
+        with self._condition:
+            self._count("delete_message_batch")
+            for entry in Entries:
+                if self._delete(QueueUrl, entry["ReceiptHandle"]):
+                    successful.append({"Id": entry["Id"]})
+                else:
+                    failed.append({"Id": entry["Id"], "SenderFault": True, "Code": "ReceiptHandleIsInvalid"})
+        return {"Successful": successful, "Failed": failed}
+
+    def change_message_visibility(self, QueueUrl: str, ReceiptHandle: str, VisibilityTimeout: float, **kwargs) -> dict:
+        with self._condition:
+            self._count("change_message_visibility")
+            if not self._change_visibility(QueueUrl, ReceiptHandle, VisibilityTimeout):
+                raise self._error("ReceiptHandleIsInvalid", "Invalid receipt handle", "ChangeMessageVisibility")
+        return {}
+
+    def _change_visibility(self, queue_url: str, receipt_handle: str, timeout: float) -> bool:
+        message = self._message_for(queue_url, receipt_handle)
+        if message is None:
+            return False
+        message["visible_at"] = time.monotonic() + timeout
+        self._condition.notify_all()
+        return True
+
+    def change_message_visibility_batch(self, QueueUrl: str, Entries: List[dict], **kwargs) -> dict:
+        self._check_batch(Entries, "ChangeMessageVisibilityBatch")
+        successful, failed = [], []
+        with self._condition:
+            self._count("change_message_visibility_batch")
+            for entry in Entries:
+                if self._change_visibility(QueueUrl, entry["ReceiptHandle"], entry["VisibilityTimeout"]):
+                    successful.append({"Id": entry["Id"]})
+                else:
+                    failed.append({"Id": entry["Id"], "SenderFault": True, "Code": "ReceiptHandleIsInvalid"})
+        return {"Successful": successful, "Failed": failed}
+
+    def messages(self, queue_url: str) -> List[str]:
+        with self._condition:
+            return [message["Body"] for message in self._queue(queue_url).values()]
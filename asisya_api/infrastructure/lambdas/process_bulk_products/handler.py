@@ -1,16 +1,15 @@
 import os
 import json
-import time
 import boto3
 import logging
-from decimal import Decimal
-from datetime import datetime
-from sqlalchemy.exc import IntegrityError
 
-from asisya_api.core.database import SessionLocal
+from asisya_api.core.config import settings
+from asisya_api.core.unit_of_work import current_session, unit_of_work
 # Importa desde tu proyecto
-from asisya_api.domain.product import ProductEntity
-from asisya_api.features.products.repository import ProductRepository
+from asisya_api.features.products.bulk_load import invalidate_product_caches, load_product_batch
+from asisya_api.features.products.ingestion import ON_CONFLICT_ERROR
+from asisya_api.features.products.normalization import get_product_normalizer
+from asisya_api.infrastructure.sqs_consumer import SqsConsumer
  # ✅ usa tu configuración centralizada
 
 # -------------------------------
@@ -35,96 +34,79 @@ QUEUE_URL = os.getenv(
     "http://sqs.us-west-2.localhost.localstack.cloud:4566/000000000000/bulk-products-queue"
 )
 
-# -------------------------------
-# Alias de campos
-# -------------------------------
-FIELD_ALIASES = {
-    "stock": "units_in_stock",
-    "qty": "units_in_stock",
-    "quantity": "units_in_stock",
-    "price_value": "price",
-}
-
-# Campos válidos según la tabla
-ALLOWED_FIELDS = {
-    "name", "sku", "description", "price", "units_in_stock",
-    "discontinued", "available", "quantity_per_unit", "units_on_order", "category_id"
-}
-
-
 # -------------------------------
 # Lambda handler
 # -------------------------------
 def lambda_handler(event, context):
-    repo = ProductRepository.instance()  # ✅ instancia singleton con sesión interna
-
-    try:
-        records = event.get("Records", [])
-        for record in records:
-            message = json.loads(record["Body"])
-            user_id = message.get("user_id")
-            products = message.get("products", [])
-
-            logger.info(f"Procesando {len(products)} productos del usuario {user_id}")
-
-            product_entities = []
-            for p in products:
-                try:
-                    normalized = {FIELD_ALIASES.get(k, k): v for k, v in p.items()}
-                    sku = normalized.get("sku") or f"{normalized['name'].lower().replace(' ', '-')}-{user_id}"
-                    normalized["sku"] = sku
-
-                    if "price" in normalized:
-                        normalized["price"] = Decimal(str(normalized["price"]))
-                    if "units_in_stock" in normalized:
-                        normalized["units_in_stock"] = int(normalized["units_in_stock"])
-
-                    product_data = {k: v for k, v in normalized.items() if k in ALLOWED_FIELDS}
-                    product_data.setdefault("discontinued", False)
-                    product_data.setdefault("available", True)
-                    product_data.setdefault("quantity_per_unit", None)
-                    product_data.setdefault("units_on_order", 0)
-                    product_data.setdefault("units_in_stock", 0)
-                    product_data.setdefault("category_id", normalized.get("category_id"))
-                    product_data["created_by_user_id"] = user_id
-                    product_data["created_at"] = datetime.utcnow()
-                    product_data["updated_at"] = datetime.utcnow()
-
-                    product_entities.append(ProductEntity(**product_data))
-
-                except Exception as ex:
-                    logger.error(f"❌ Error normalizando producto {p.get('name')}: {str(ex)}", exc_info=True)
-                    continue
-
-            if product_entities:
-                try:
-                    repo.bulk_create(product_entities)
-                    logger.info(f"✅ Batch insertado: {len(product_entities)} productos")
-                except ValueError as e:
-                    logger.warning(f"⚠️ Error en bulk_create: {str(e)}")
-                    continue
-
-    except Exception as e:
-        logger.exception(f"❌ Error procesando batch: {str(e)}")
-
+    """
+    Trigger de SQS con `ReportBatchItemFailures` activado: cada mensaje se confirma por
+    separado y sólo los que fallan (`batchItemFailures`) vuelven a la cola. Así los
+    mensajes ya cargados de un lote no se reprocesan (ni se suman dos veces al job).
+    """
+    # ✅ una sesión por invocación (unidad de trabajo), cerrada al terminar
+    with unit_of_work():
+        return _process_records(event)
+
+
+def _process_record(record, normalizer) -> dict:
+    """Carga un mensaje y devuelve el resultado de cada fila; los errores que no son de los datos se propagan."""
+    message = json.loads(record.get("body", record.get("Body")))
+    user_id = message.get("user_id")
+    job_id = message.get("job_id")
+    products = message.get("products", [])
+    on_conflict = message.get("on_conflict", ON_CONFLICT_ERROR)
+
+    logger.info(f"Procesando {len(products)} productos del usuario {user_id} (job {job_id})")
+    return load_product_batch(products, user_id, on_conflict, job_id, normalizer)
+
+
+def _process_records(event) -> dict:
+    """
+    Procesa cada mensaje del evento. Sólo los rechazos por los datos (filas inválidas,
+    SKU duplicados) se registran en el job y se dan por procesados. Cualquier otro error
+    (base de datos caída, conexión perdida, un fallo inesperado) deja el mensaje en
+    `batchItemFailures` para que SQS lo reentregue; el resto del lote sigue.
+    """
+    normalizer = get_product_normalizer()
+    batches, failures = [], []
+    for record in event.get("Records", []):
+        try:
+            batches.append(_process_record(record, normalizer))
+        except Exception as e:
+            logger.exception(f"❌ Error procesando mensaje, se reintentará: {str(e)}")
+            # La sesión puede haber quedado a medias: el siguiente mensaje empieza limpio
+            current_session().rollback()
+            failures.append({"itemIdentifier": record.get("messageId", record.get("MessageId"))})
+
+    if batches:
+        invalidate_product_caches()
+    return {"batches": batches, "batchItemFailures": failures}
+
+
+def process_message(message):
+    """
+    Un mensaje de SQS tal como lo devuelve receive_message (lo usa el consumidor).
+    Si lanza una excepción el consumidor no borra el mensaje.
+    """
+    with unit_of_work():
+        result = _process_record(message, get_product_normalizer())
+    invalidate_product_caches()
+    return result
 
 
 # -------------------------------
-# Poller local (para probar con LocalStack)
+# Consumidor (servicio de larga duración, p. ej. contra LocalStack)
 # -------------------------------
 if __name__ == "__main__":
-    logger.info("🚀 Iniciando poller local de SQS...")
-    while True:
-        resp = sqs_client.receive_message(
-            QueueUrl=QUEUE_URL,
-            MaxNumberOfMessages=10,
-            WaitTimeSeconds=5
-        )
-        messages = resp.get("Messages", [])
-        for msg in messages:
-            lambda_handler({"Records": [msg]}, None)
-            sqs_client.delete_message(
-                QueueUrl=QUEUE_URL,
-                ReceiptHandle=msg["ReceiptHandle"]
-            )
-        time.sleep(1)
+    logger.info("🚀 Iniciando consumidor de SQS...")
+    consumer = SqsConsumer(
+        sqs_client,
+        QUEUE_URL,
+        process_message,
+        concurrency=settings.bulk_consumer_concurrency,
+        use_processes=settings.bulk_consumer_use_processes,
+        wait_time_seconds=settings.bulk_consumer_wait_time_seconds,
+        visibility_timeout=settings.bulk_consumer_visibility_timeout,
+    )
+    consumer.install_signal_handlers()
+    consumer.run()
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from asisya_api.crosscutting.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Límites de SQS
+MAX_BATCH_ENTRIES = 10
+MAX_PAYLOAD_BYTES = 256 * 1024  # por mensaje y por llamada a send_message_batch (suma de mensajes)
+
+
+class QueueSendError(RuntimeError):
+    """Algunos mensajes no se han podido encolar tras agotar los reintentos."""
+
+    def __init__(self, sent: int, failed: List[dict]):
+        super().__init__(f"{len(failed)} messages could not be queued ({sent} sent)")
+        self.sent = sent
+        self.failed = failed
+
+
+class SendResult:
+    def __init__(self):
+        self.sent = 0
+        self.calls = 0
+        self.failed: List[dict] = []
+
+    def merge(self, other: "SendResult") -> None:
+        self.sent += other.sent
+        self.calls += other.calls
+        self.failed.extend(other.failed)
+
+
+def chunk_messages(
+    items: Iterable[dict],
+    envelope: dict,
+    max_items: int,
+    max_bytes: int = MAX_PAYLOAD_BYTES,
+) -> Iterator[str]:
+    """
+    Agrupa `items` en cuerpos JSON `{**envelope, "products": [...]}` de como mucho
+    `max_items` elementos y `max_bytes` bytes. Cada elemento se serializa una sola vez.
+    """
+    prefix = json.dumps({**envelope, "products": []})[:-2]  # '{..., "products": ['
+    suffix = "]}"
+    overhead = len(prefix) + len(suffix)
+
+    parts: List[str] = []
+    size = overhead
+    for item in items:
+        part = json.dumps(item)  # ensure_ascii: longitud en caracteres == bytes
+        if overhead + len(part) > max_bytes:
+            raise ValueError(f"Product too large for a queue message ({len(part)} bytes)")
+        separator = 2 if parts else 0  # ", "
+        if parts and (len(parts) >= max_items or size + separator + len(part) > max_bytes):
+            yield prefix + ", ".join(parts) + suffix
+            parts, size, separator = [], overhead, 0
+        parts.append(part)
+        size += separator + len(part)
+    if parts:
+        yield prefix + ", ".join(parts) + suffix
+
+
+def group_entries(bodies: Sequence[str], max_bytes: int = MAX_PAYLOAD_BYTES) -> Iterator[List[dict]]:
+    """Entradas de send_message_batch: hasta 10 por llamada y sin superar 256 KB en total."""
+    batch: List[dict] = []
+    size = 0
+    for index, body in enumerate(bodies):
+        if batch and (len(batch) >= MAX_BATCH_ENTRIES or size + len(body) > max_bytes):
+            yield batch
+            batch, size = [], 0
+        batch.append({"Id": str(index), "MessageBody": body})
+        size += len(body)
+    if batch:
+        yield batch
+
+
+class SqsBatchSender:
+    """
+    Envía mensajes a una cola SQS con `send_message_batch`, varias llamadas en paralelo
+    (el cliente de boto3 es thread-safe) y reintentando sólo las entradas que fallan.
+
+    Los fallos atribuidos al emisor (`SenderFault`, p. ej. un mensaje inválido) no se
+    reintentan; los del servicio (throttling, errores internos) y los de red sí, con
+    espera exponencial.
+    """
+
+    def __init__(
+        self,
+        sqs_client,
+        queue_url: str,
+        max_workers: int = 8,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.2,
+    ):
+        self.sqs_client = sqs_client
+        self.queue_url = queue_url
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sqs-send")
+
+    def send(self, bodies: Sequence[str]) -> SendResult:
+        futures = [self._executor.submit(self._send_batch, entries) for entries in group_entries(bodies)]
+        result = SendResult()
+        for future in futures:
+            result.merge(future.result())
+        return result
+
+    async def send_async(self, bodies: Sequence[str]) -> SendResult:
+        """Como `send`, sin bloquear el event loop mientras se espera a SQS."""
+        loop = asyncio.get_running_loop()
+        partials = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, self._send_batch, entries)
+            for entries in group_entries(bodies)
+        ))
+        result = SendResult()
+        for partial in partials:
+            result.merge(partial)
+        return result
+
+    def _send_batch(self, entries: List[dict]) -> SendResult:
+        result = SendResult()
+        pending = entries
+        last_error: Optional[dict] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_backoff_seconds * 2 ** (attempt - 1))
+            result.calls += 1
+            try:
+                response = self.sqs_client.send_message_batch(QueueUrl=self.queue_url, Entries=pending)
+            except (BotoCoreError, ClientError) as e:
+                logger.warning(f"send_message_batch falló (intento {attempt + 1}): {e}")
+                last_error = {"Code": type(e).__name__, "Message": str(e)}
+                continue
+
+            result.sent += len(response.get("Successful", []))
+            by_id = {entry["Id"]: entry for entry in pending}
+            retry = []
+            for failure in response.get("Failed", []):
+                if failure.get("SenderFault"):
+                    result.failed.append(failure)
+                else:
+                    retry.append(by_id[failure["Id"]])
+                    last_error = failure
+            pending = retry
+            if not pending:
+                return result
+
+        result.failed.extend(
+            {"Id": entry["Id"], "Code": last_error.get("Code"), "Message": last_error.get("Message")}
+            for entry in pending
+        )
+        logger.error(f"{len(pending)} mensajes sin encolar tras {self.max_retries} reintentos")
+        return result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,164 @@
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from asisya_api.crosscutting.logging import get_logger
+from asisya_api.infrastructure.sqs_batch_sender import MAX_BATCH_ENTRIES
+
+logger = get_logger(__name__)
+
+# Espera máxima de long polling que admite SQS
+MAX_WAIT_TIME_SECONDS = 20
+
+
+class SqsConsumer:
+    """
+    Consumidor de una cola SQS con un pool de workers.
+
+      - Long polling (`WaitTimeSeconds`) en lugar de dormir entre recepciones. Mientras
+        hay trabajo en curso se consulta sin esperar y, si no hay mensajes, se espera a
+        que termine alguno (como mucho 1 s) para borrarlo y renovar visibilidades.
+      - Sólo se reciben tantos mensajes como workers libres (back-pressure).
+      - Los mensajes procesados se borran con `delete_message_batch`; los que fallan no
+        se borran y SQS los vuelve a entregar al expirar su visibilidad.
+      - Se amplía el visibility timeout de los mensajes que llevan procesándose más de
+        la mitad del plazo, para que SQS no se los entregue a otro consumidor.
+      - `stop()` (SIGTERM/SIGINT con `install_signal_handlers`) deja de recibir, espera
+        a que terminen los mensajes en curso, los borra y sale.
+
+    `process(message)` recibe el mensaje tal como lo devuelve `receive_message`; con
+    `use_processes` se ejecuta en un pool de procesos y debe poder serializarse con
+    pickle (una función a nivel de módulo).
+    """
+
+    def __init__(
+        self,
+        sqs_client,
+        queue_url: str,
+        process: Callable[[dict], object],
+        concurrency: int = 4,
+        use_processes: bool = False,
+        wait_time_seconds: int = MAX_WAIT_TIME_SECONDS,
+        visibility_timeout: int = 60,
+    ):
+        self.sqs_client = sqs_client
+        self.queue_url = queue_url
+        self.process = process
+        self.concurrency = concurrency
+        self.use_processes = use_processes
+        self.wait_time_seconds = wait_time_seconds
+        self.visibility_timeout = visibility_timeout
+        self._stop = threading.Event()
+        self._in_flight: Dict[Future, dict] = {}
+        self._to_delete: List[dict] = []
+        self.stats = {"received": 0, "processed": 0, "failed": 0, "deleted": 0, "extended": 0}
+
+    def stop(self, *_args) -> None:
+        if not self._stop.is_set():
+            logger.info(f"Parando consumidor: {len(self._in_flight)} mensajes en curso")
+        self._stop.set()
+
+    def install_signal_handlers(self) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    def _make_executor(self) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.concurrency)
+        return ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="sqs-consumer")
+
+    def run(self) -> dict:
+        logger.info(f"Consumidor SQS iniciado ({self.concurrency} workers, {'procesos' if self.use_processes else 'hilos'})")
+        executor = self._make_executor()
+        try:
+            while not self._stop.is_set():
+                self._receive(executor)
+                self._collect()
+            # Parada ordenada: terminar y borrar lo que ya se había recibido
+            while self._in_flight:
+                wait(list(self._in_flight), timeout=1, return_when=FIRST_COMPLETED)
+                self._collect()
+        finally:
+            executor.shutdown(wait=True)
+            self._flush_deletes()
+        logger.info(f"Consumidor SQS detenido: {self.stats}")
+        return self.stats
+
+    def _receive(self, executor: Executor) -> None:
+        free = self.concurrency - len(self._in_flight)
+        if free <= 0:
+            wait(list(self._in_flight), timeout=1, return_when=FIRST_COMPLETED)
+            return
+        try:
+            response = self.sqs_client.receive_message(
+                QueueUrl=self.queue_url,
+                MaxNumberOfMessages=min(MAX_BATCH_ENTRIES, free),
+                WaitTimeSeconds=0 if self._in_flight else self.wait_time_seconds,
+                VisibilityTimeout=self.visibility_timeout,
+            )
+        except (BotoCoreError, ClientError) as e:
+            logger.warning(f"receive_message falló: {e}")
+            self._stop.wait(1)
+            return
+
+        messages = response.get("Messages", [])
+        if not messages and self._in_flight:
+            wait(list(self._in_flight), timeout=1, return_when=FIRST_COMPLETED)
+
+        now = time.monotonic()
+        for message in messages:
+            self.stats["received"] += 1
+            future = executor.submit(self.process, message)
+            self._in_flight[future] = {"message": message, "lease_until": now + self.visibility_timeout}
+
+    def _collect(self) -> None:
+        for future in [f for f in self._in_flight if f.done()]:
+            message = self._in_flight.pop(future)["message"]
+            error = future.exception()
+            if error is None:
+                self.stats["processed"] += 1
+                self._to_delete.append(message)
+            else:
+                self.stats["failed"] += 1
+                logger.error(f"Error procesando el mensaje {message['MessageId']}: {error}")
+        self._flush_deletes()
+        self._extend_visibility()
+
+    def _flush_deletes(self) -> None:
+        while self._to_delete:
+            batch, self._to_delete = self._to_delete[:MAX_BATCH_ENTRIES], self._to_delete[MAX_BATCH_ENTRIES:]
+            entries = [{"Id": str(i), "ReceiptHandle": m["ReceiptHandle"]} for i, m in enumerate(batch)]
+            try:
+                response = self.sqs_client.delete_message_batch(QueueUrl=self.queue_url, Entries=entries)
+            except (BotoCoreError, ClientError) as e:
+                # Sin borrar, SQS los volverá a entregar: el worker es idempotente con on_conflict
+                logger.warning(f"delete_message_batch falló para {len(entries)} mensajes: {e}")
+                continue
+            self.stats["deleted"] += len(response.get("Successful", []))
+            for failure in response.get("Failed", []):
+                logger.warning(f"No se pudo borrar un mensaje: {failure}")
+
+    def _extend_visibility(self) -> None:
+        now = time.monotonic()
+        expiring = [
+            lease for lease in self._in_flight.values()
+            if lease["lease_until"] - now < self.visibility_timeout / 2
+        ]
+        for start in range(0, len(expiring), MAX_BATCH_ENTRIES):
+            batch = expiring[start:start + MAX_BATCH_ENTRIES]
+            entries = [
+                {"Id": str(i), "ReceiptHandle": lease["message"]["ReceiptHandle"], "VisibilityTimeout": self.visibility_timeout}
+                for i, lease in enumerate(batch)
+            ]
+            try:
+                self.sqs_client.change_message_visibility_batch(QueueUrl=self.queue_url, Entries=entries)
+            except (BotoCoreError, ClientError) as e:
+                logger.warning(f"change_message_visibility_batch falló: {e}")
+                continue
+            for lease in batch:
+                lease["lease_until"] = now + self.visibility_timeout
+            self.stats["extended"] += len(batch)
@@ -1,15 +1,21 @@
 # asisya_api/infrastructure/storage/local_storage.py
 import os
 import uuid
+from functools import partial
 from pathlib import Path
 from typing import BinaryIO, Optional
+import anyio
 import boto3
+from anyio import to_thread
 from fastapi import UploadFile
 from asisya_api.crosscutting.logging import get_logger
 from asisya_api.core.config import settings  # asume que tienes BaseSettings con MEDIA_ROOT, MEDIA_URL
 
 logger = get_logger(__name__)
 
+# Tamaño mínimo de cada parte de una subida multipart a S3 (salvo la última)
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
 
 class LocalStorage:
     """
@@ -20,6 +26,7 @@ class LocalStorage:
       - get_url(key: str) -> str  # URL pública (MEDIA_URL + key)
       - delete(key: str) -> None
       - exists(key: str) -> bool
+      - save_async / delete_async / exists_async: lo mismo sin bloquear el event loop
     """
 
     def __init__(self, media_root: str = None, media_url: str = None):
@@ -64,6 +71,26 @@ class LocalStorage:
             pass
         return key
 
+    async def save_async(self, upload_file: UploadFile, prefix: Optional[str] = None) -> str:
+        """
+        Como `save`, sin bloquear el event loop: el UploadFile se lee con su API async y
+        cada bloque (`STORAGE_CHUNK_SIZE`) se escribe desde un hilo (`anyio.open_file`).
+        """
+        key = self._make_key(prefix, upload_file.filename or "file")
+        dest_path = self.media_root / key
+        await anyio.Path(dest_path.parent).mkdir(parents=True, exist_ok=True)
+
+        try:
+            async with await anyio.open_file(dest_path, "wb") as out_file:
+                while chunk := await upload_file.read(settings.storage_chunk_size):
+                    await out_file.write(chunk)
+        except Exception:
+            # No dejar un fichero a medias
+            await self.delete_async(key)
+            raise
+        await upload_file.seek(0)
+        return key
+
     def get_path(self, key: str) -> str:
         return str(self.media_root / key)
 
@@ -83,22 +110,42 @@ class LocalStorage:
     def exists(self, key: str) -> bool:
         return (self.media_root / key).exists()
 
+    async def delete_async(self, key: str) -> None:
+        await to_thread.run_sync(self.delete, key)
+
+    async def exists_async(self, key: str) -> bool:
+        return await anyio.Path(self.media_root / key).exists()
+
 
 class S3Storage:
     """
     Implementación compatible con LocalStorage, pero usando Amazon S3.
-    Mantiene la misma interfaz (save, get_url, delete, exists).
+    Mantiene la misma interfaz (save, get_url, delete, exists y sus variantes async).
+
+    `save_async` sube los ficheros grandes por partes (multipart upload): partes de
+    `S3_MULTIPART_PART_SIZE` bytes, hasta `S3_MULTIPART_CONCURRENCY` en paralelo, cada
+    llamada de boto3 en un hilo. En memoria hay como mucho una parte más que subidas
+    en curso.
     """
 
-    def __init__(self, bucket_name: str = None, region: str = None):
-        self.bucket = bucket_name or settings.AWS_S3_BUCKET
-        self.region = region or settings.AWS_REGION
-        self.s3 = boto3.client(
+    def __init__(
+        self,
+        bucket_name: str = None,
+        region: str = None,
+        client=None,
+        part_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.bucket = bucket_name or settings.aws_s3_bucket
+        self.region = region or settings.aws_region
+        self.s3 = client or boto3.client(
             "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            aws_access_key_id=settings.aws_access_key_id,
+            aws_secret_access_key=settings.aws_secret_access_key,
             region_name=self.region,
         )
+        self.part_size = max(part_size or settings.s3_multipart_part_size, S3_MIN_PART_SIZE)
+        self.concurrency = max(1, concurrency or settings.s3_multipart_concurrency)
 
     def _sanitize_filename(self, filename: str) -> str:
         ext = filename.split(".")[-1] if "." in filename else ""
@@ -117,6 +164,61 @@ class S3Storage:
         logger.info(f"Archivo subido a S3: s3://{self.bucket}/{key}")
         return key
 
+    async def save_async(self, upload_file: UploadFile, prefix: Optional[str] = None) -> str:
+        key = self._make_key(prefix, upload_file.filename or "file")
+        first_part = await upload_file.read(self.part_size)
+        if len(first_part) < self.part_size:
+            # Cabe en una parte: una sola llamada
+            await to_thread.run_sync(partial(
+                self.s3.put_object, Bucket=self.bucket, Key=key, Body=first_part, ACL="public-read",
+            ))
+        else:
+            await self._multipart_upload(key, upload_file, first_part)
+        await upload_file.seek(0)
+        logger.info(f"Archivo subido a S3: s3://{self.bucket}/{key}")
+        return key
+
+    async def _multipart_upload(self, key: str, upload_file: UploadFile, first_part: bytes) -> None:
+        upload = await to_thread.run_sync(partial(
+            self.s3.create_multipart_upload, Bucket=self.bucket, Key=key, ACL="public-read",
+        ))
+        upload_id = upload["UploadId"]
+        etags = {}
+        slots = anyio.Semaphore(self.concurrency)
+
+        async def upload_part(number: int, body: bytes) -> None:
+            try:
+                response = await to_thread.run_sync(partial(
+                    self.s3.upload_part, Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=body,
+                ))
+                etags[number] = response["ETag"]
+            finally:
+                slots.release()
+
+        try:
+            async with anyio.create_task_group() as tasks:
+                number, body = 1, first_part
+                while body:
+                    # No se lee la parte siguiente hasta que haya un hueco para subirla
+                    await slots.acquire()
+                    tasks.start_soon(upload_part, number, body)
+                    number, body = number + 1, await upload_file.read(self.part_size)
+            parts = [{"PartNumber": number, "ETag": etags[number]} for number in sorted(etags)]
+            await to_thread.run_sync(partial(
+                self.s3.complete_multipart_upload,
+                Bucket=self.bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts},
+            ))
+        except BaseException as e:
+            # Sin abortar, S3 guarda (y cobra) las partes subidas
+            with anyio.CancelScope(shield=True):
+                await to_thread.run_sync(partial(
+                    self.s3.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id,
+                ))
+            if isinstance(e, BaseExceptionGroup) and len(e.exceptions) == 1:
+                # Error de una sola parte: propagarlo tal cual (p. ej. ClientError)
+                raise e.exceptions[0] from None
+            raise
+
     def get_url(self, key: str) -> str:
         return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{key}"
 
@@ -132,3 +234,16 @@ class S3Storage:
             return True
         except self.s3.exceptions.ClientError:
             return False
+
+    async def delete_async(self, key: str) -> None:
+        await to_thread.run_sync(self.delete, key)
+
+    async def exists_async(self, key: str) -> bool:
+        return await to_thread.run_sync(self.exists, key)
+
+
+def get_storage():
+    """Almacenamiento configurado (`STORAGE_BACKEND`: local | s3)."""
+    if settings.storage_backend == "s3":
+        return S3Storage(settings.aws_s3_bucket, settings.aws_region)
+    return LocalStorage()
@@ -1,6 +1,6 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.concurrency import asynccontextmanager
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from mediatr import Mediator
@@ -9,6 +9,8 @@ import os
 import uvicorn
 from pathlib import Path
 from asisya_api.core.config import settings
+from asisya_api.core.database import SessionLocal, dispose_async_engine
+from asisya_api.core.unit_of_work import UnitOfWorkMiddleware
 from asisya_api.core.constants import (
     TITLE,
     DESCRIPTION,
@@ -17,12 +19,14 @@ from asisya_api.core.constants import (
     SWAGGER_UI_PARAMETERS,
     SWAGGER_FAVICON_URL,
 )
+from asisya_api.crosscutting.bounded_executor import ExecutorSaturatedError
 from asisya_api.crosscutting.logging import get_logger
+from asisya_api.crosscutting.metrics import CONTENT_TYPE, MetricsMiddleware, render_metrics
+from asisya_api.crosscutting.query_profiler import QueryProfilerMiddleware
 from asisya_api.features.auth.auth_service import AuthService
 from asisya_api.features.auth.controller import AuthController
 from asisya_api.features.products.controller import ProductController
 from asisya_api.features.user.controller import UserController
-from asisya_api.features.user.repository import UserRepository
 from asisya_api.features.categories.controller import CategoryController  # ✅ nuevo
 
 logger = get_logger(__name__)
@@ -35,12 +39,24 @@ async def lifespan(app: FastAPI):
     ahora se manejan mediante Alembic.
     """
     yield
+    await dispose_async_engine()
+
+
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    # Back-pressure: el pool (p. ej. bcrypt) está lleno, el cliente debe reintentar
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Server is busy, please retry later"},
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
 
 
 def create_app(
     mediator=None,
     auth_service=None,
     notification_service=None,
+    session_factory=None,
+    async_session_factory=None,
 ):
     app = FastAPI(
         title=TITLE,
@@ -83,8 +99,27 @@ def create_app(
     # ✅ Servir archivos de imagen o media local
     app.mount(settings.MEDIA_URL, StaticFiles(directory=settings.MEDIA_ROOT), name="media")
 
-    # ✅ Dependencias base
-    user_repository = UserRepository.instance()
+    # ✅ Una sesión de base de datos por petición (unidad de trabajo)
+    app.add_middleware(
+        UnitOfWorkMiddleware,
+        session_factory=session_factory or SessionLocal,
+        async_session_factory=async_session_factory,
+    )
+
+    # ✅ Perfil de SQL de las peticiones con la cabecera X-Query-Profile
+    if settings.query_profiler_enabled:
+        app.add_middleware(QueryProfilerMiddleware)
+
+    # ✅ Latencia por ruta (el behavior del mediator mide los handlers) y GET /metrics
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
+
+    # ✅ Pools acotados saturados -> 429
+    app.add_exception_handler(ExecutorSaturatedError, executor_saturated_handler)
 
     # ✅ Mediator global
     if not mediator:
@@ -92,7 +127,7 @@ def create_app(
 
     # ✅ Servicios principales
     if not auth_service:
-        auth_service = AuthService(user_repository)
+        auth_service = AuthService()
 
     # ✅ Controladores
     auth_controller = AuthController(auth_service)
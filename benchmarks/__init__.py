@@ -0,0 +1,18 @@
+"""
+Benchmarks de rendimiento de la API.
+
+Ejecución (desde la raíz del repo):
+    python -m benchmarks.<nombre_del_benchmark> --help
+
+`asisya_api.core.config.Settings` exige algunas variables de entorno; aquí se les
+da un valor por defecto para que los benchmarks puedan correr sin un `.env`.
+"""
+import os
+
+os.environ.setdefault("INITIAL_ADMIN_USERNAME", "admin")
+os.environ.setdefault("INITIAL_ADMIN_EMAIL", "admin@example.com")
+os.environ.setdefault("INITIAL_ADMIN_PASSWORD", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
@@ -0,0 +1,104 @@
+"""
+Tiempo hasta el 202 de una carga masiva: encolado en SQS de N productos.
+
+  - sequential: un `send_message` por lote de 100 productos, uno detrás de otro
+    (comportamiento anterior).
+  - batched: `CreateBulkProductsCommandHandler` (send_message_batch con 10 mensajes
+    por llamada y llamadas en paralelo).
+
+Se usa `InMemorySqsClient` con una latencia fija por llamada para simular el ida y
+vuelta HTTP a SQS. El handler registra el job de importación en `--database-url`.
+
+    python -m benchmarks.bench_bulk_enqueue --products 50000 --latency-ms 20
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from benchmarks.common import make_async_session_factory, make_session
+from asisya_api.core.unit_of_work import async_unit_of_work
+from asisya_api.features.products.commands.create_bulk_products_command import (
+    CreateBulkProductsCommand,
+    CreateBulkProductsCommandHandler,
+)
+from asisya_api.infrastructure.in_memory_sqs import InMemorySqsClient
+from asisya_api.infrastructure.sqs_batch_sender import SqsBatchSender
+
+QUEUE_URL = "memory://bulk-products"
+
+
+class SlowSqsClient(InMemorySqsClient):
+    def __init__(self, latency_seconds: float):
+        super().__init__()
+        self.latency_seconds = latency_seconds
+
+    def send_message(self, *args, **kwargs):
+        time.sleep(self.latency_seconds)
+        return super().send_message(*args, **kwargs)
+
+    def send_message_batch(self, *args, **kwargs):
+        time.sleep(self.latency_seconds)
+        return super().send_message_batch(*args, **kwargs)
+
+
+class User:
+    id = 1
+
+
+def products(total: int):
+    return [
+        {"name": f"Product {i}", "sku": f"SKU-{i}", "price": 10.5, "stock": i % 100, "description": "Bulk product"}
+        for i in range(total)
+    ]
+
+
+def sequential(client, items, batch_size: int) -> int:
+    for i in range(0, len(items), batch_size):
+        client.send_message(QueueUrl=QUEUE_URL, MessageBody=json.dumps({"user_id": 1, "products": items[i:i + batch_size]}))
+    return client.calls["send_message"]
+
+
+def batched(client, items, batch_size: int, concurrency: int, database_url: str) -> int:
+    session = make_session(database_url)
+    async_session_factory = make_async_session_factory(database_url)
+    sender = SqsBatchSender(client, QUEUE_URL, max_workers=concurrency)
+
+    async def run():
+        async with async_unit_of_work(lambda: session, async_session_factory):
+            handler = CreateBulkProductsCommandHandler(sender=sender)
+            await handler.handle(CreateBulkProductsCommand(items, User(), batch_size=batch_size))
+        await async_session_factory.kw["bind"].dispose()
+
+    asyncio.run(run())
+    sender.shutdown()
+    return client.calls["send_message_batch"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///./benchmark.db")
+    parser.add_argument("--products", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.getLogger("asisya_api").setLevel(logging.WARNING)
+    items = products(args.products)
+
+    print(f"{'mode':>10} | {'calls':>6} | {'seconds':>8}")
+    print("-" * 32)
+    for mode in ("sequential", "batched"):
+        client = SlowSqsClient(args.latency_ms / 1000)
+        start = time.perf_counter()
+        if mode == "sequential":
+            calls = sequential(client, items, args.batch_size)
+        else:
+            calls = batched(client, items, args.batch_size, args.concurrency, args.database_url)
+        print(f"{mode:>10} | {calls:>6} | {time.perf_counter() - start:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
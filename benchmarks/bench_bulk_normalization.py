@@ -0,0 +1,69 @@
+"""
+Normalización de un lote de productos de carga masiva: fila a fila
+(`RowProductNormalizer`, el bucle anterior del worker) frente a por columnas
+(`ColumnarProductNormalizer`).
+
+Los productos tienen la forma de los mensajes que encola la API (alias `stock`, precio
+float y un tercio sin SKU); un 1 % es inválido. Sólo se mide la CPU de la normalización,
+sin base de datos.
+
+    python -m benchmarks.bench_bulk_normalization --rows 100 10000 100000
+"""
+import argparse
+import time
+
+from asisya_api.features.products.normalization import PRODUCT_NORMALIZERS
+
+
+def raw_products(total: int):
+    """Productos tal como los encola la API (`ProductBulkCreateDTO.dict()`): mismas claves en todos."""
+    return [
+        {
+            "name": "" if i % 100 == 99 else f"Product {i}",
+            "sku": f"SKU-{i}" if i % 3 else None,
+            "slug": None,
+            "description": f"Bulk product number {i}",
+            "price": (i % 1000) + 0.99,
+            "stock": i % 50,
+            "category_id": None,
+        }
+        for i in range(total)
+    ]
+
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} | {'normalizer':>10} | {'ms':>9} | {'rows/s':>11} | {'speedup':>7}")
+    print("-" * 58)
+    for total in args.rows:
+        products = raw_products(total)
+        # Repeticiones internas para que los lotes pequeños no queden por debajo de la resolución del reloj
+        inner = max(1, 10_000 // total)
+        baseline = None
+        for name, normalizer_cls in PRODUCT_NORMALIZERS.items():
+            normalizer = normalizer_cls()
+
+            def run():
+                for _ in range(inner):
+                    normalizer.normalize(products, 7, on_error=lambda product, error: None)
+
+            seconds = best_of(args.repeat, run) / inner
+            baseline = baseline or seconds
+            print(f"{total:>8,} | {name:>10} | {seconds * 1000:>9.3f} | {total / seconds:>11,.0f} | {baseline / seconds:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
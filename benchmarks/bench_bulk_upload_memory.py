@@ -0,0 +1,129 @@
+"""
+Memoria (RSS máximo) de la API al recibir una carga masiva de N productos:
+
+  - json: `POST /products/bulk` con todo el catálogo en el cuerpo JSON.
+  - csv / ndjson: `POST /products/bulk/file` con el fichero en streaming.
+
+Cada medida se hace en un proceso nuevo; el cliente envía el cuerpo desde disco en
+bloques (httpx + ASGITransport, en proceso) y SQS se sustituye por un cliente que
+descarta los mensajes, así que lo medido es sólo el lado de la API.
+
+    python -m benchmarks.bench_bulk_upload_memory --products 100000 200000
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+MODES = ("json", "csv", "ndjson")
+
+
+def write_feed(mode: str, total: int, directory: str) -> str:
+    path = os.path.join(directory, f"feed-{total}.{mode}")
+    with open(path, "w") as feed:
+        if mode == "csv":
+            feed.write("name,sku,price,stock,description\n")
+        elif mode == "json":
+            feed.write('{"batch_size": 100, "products": [')
+        for i in range(total):
+            product = {"name": f"Product {i}", "sku": f"SKU-{i}", "price": 10.5, "stock": i % 100,
+                       "description": f"Bulk product number {i}"}
+            if mode == "csv":
+                feed.write(f"{product['name']},{product['sku']},{product['price']},{product['stock']},{product['description']}\n")
+            elif mode == "ndjson":
+                feed.write(json.dumps(product) + "\n")
+            else:
+                feed.write(("," if i else "") + json.dumps(product))
+        if mode == "json":
+            feed.write("]}")
+    return path
+
+
+def max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def upload(mode: str, path: str) -> int:
+    import httpx
+    from asisya_api.core.database import dispose_async_engine
+    from asisya_api.crosscutting.authorization import get_authenticated_user
+    from asisya_api.features.products.commands import create_bulk_products_command
+    from asisya_api.features.user.models import User
+    from asisya_api.infrastructure.in_memory_sqs import InMemorySqsClient
+    from asisya_api.infrastructure.sqs_batch_sender import SqsBatchSender
+    from asisya_api.main import app
+
+    class DiscardingSqsClient(InMemorySqsClient):
+        def send_message_batch(self, QueueUrl, Entries, **kwargs):
+            return {"Successful": [{"Id": e["Id"], "MessageId": e["Id"]} for e in Entries], "Failed": []}
+
+    create_bulk_products_command._sender = SqsBatchSender(DiscardingSqsClient(), "memory://bulk")
+    user = User(id=1, username="bench", full_name="Bench", email="bench@example.com", roles=["user"])
+    app.dependency_overrides[get_authenticated_user] = lambda: user
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+        with open(path, "rb") as feed:
+            if mode == "json":
+                async def chunks():
+                    for chunk in iter(lambda: feed.read(64 * 1024), b""):
+                        yield chunk
+
+                response = await client.post(
+                    "/products/bulk", content=chunks(), headers={"Content-Type": "application/json"}
+                )
+            else:
+                response = await client.post("/products/bulk/file", files={"file": (os.path.basename(path), feed)})
+    # ASGITransport no ejecuta el lifespan de la app: cerrar aquí las conexiones async
+    await dispose_async_engine()
+    return response.status_code
+
+
+def measure(mode: str, path: str) -> None:
+    """Se ejecuta en el proceso hijo: imprime RSS tras importar la app y tras la carga."""
+    logging.disable(logging.INFO)
+    import asisya_api.main  # noqa: F401
+    from asisya_api.core.database import Base, engine
+
+    Base.metadata.create_all(engine)  # tabla de jobs de importación
+
+    baseline = max_rss_mb()
+    status_code = asyncio.run(upload(mode, path))
+    print(json.dumps({"status": status_code, "baseline_mb": baseline, "peak_mb": max_rss_mb()}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, nargs="+", default=[50_000, 200_000])
+    parser.add_argument("--measure", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(*args.measure)
+        return
+
+    print(f"{'products':>9} | {'mode':>6} | {'file MB':>8} | {'RSS growth MB':>13}")
+    print("-" * 46)
+    with tempfile.TemporaryDirectory() as directory:
+        for total in args.products:
+            for mode in MODES:
+                path = write_feed(mode, total, directory)
+                output = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_bulk_upload_memory", "--measure", mode, path],
+                    check=True, capture_output=True, text=True,
+                ).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                assert result["status"] == 202, result
+                growth = result["peak_mb"] - result["baseline_mb"]
+                size = os.path.getsize(path) / 1024 / 1024
+                print(f"{total:>9,} | {mode:>6} | {size:>8.1f} | {growth:>13.1f}")
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
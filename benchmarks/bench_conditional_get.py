@@ -0,0 +1,77 @@
+"""
+Coste por petición de los listados con y sin revalidación (`If-None-Match`):
+
+  - 200: el cliente no tiene el ETag (primera carga): cuerpo completo.
+  - 304: el cliente revalida con el ETag recibido y los datos no han cambiado.
+
+Mide latencia (mediana, en proceso con httpx + ASGITransport) y bytes de cuerpo
+enviados para `GET /categories/` y `GET /products/` con distintos tamaños de página.
+
+    python -m benchmarks.bench_conditional_get --products 20000 --repeat 200
+"""
+import argparse
+import asyncio
+import logging
+
+import httpx
+
+from benchmarks.common import make_session, median_ms, seed_products, time_call_async
+from asisya_api.core.database import dispose_async_engine
+from asisya_api.crosscutting.authorization import get_authenticated_user
+from asisya_api.features.user.models import User
+from asisya_api.main import app
+
+
+async def measure(client: httpx.AsyncClient, url: str, repeat: int) -> dict:
+    first = await client.get(url)
+    assert first.status_code == 200, first.status_code
+    headers = {"If-None-Match": first.headers["ETag"]}
+    result = {}
+    for mode, request_headers, expected in (("200", {}, 200), ("304", headers, 304)):
+        sizes = []
+
+        async def call():
+            response = await client.get(url, headers=request_headers)
+            assert response.status_code == expected, response.status_code
+            sizes.append(len(response.content))
+
+        samples = await time_call_async(call, repeat)
+        result[mode] = (median_ms(samples), sizes[-1])
+    return result
+
+
+async def run_benchmark(args) -> None:
+    user = User(id=1, username="bench", full_name="Bench", email="bench@example.com", roles=["user"])
+    app.dependency_overrides[get_authenticated_user] = lambda: user
+
+    urls = ["/categories/"] + [f"/products/?per_page={size}" for size in args.page_sizes]
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        print(f"{'endpoint':>24} | {'200 ms':>7} | {'304 ms':>7} | {'200 bytes':>9} | {'304 bytes':>9}")
+        print("-" * 70)
+        for url in urls:
+            result = await measure(client, url, args.repeat)
+            (ok_ms, ok_bytes), (nm_ms, nm_bytes) = result["200"], result["304"]
+            print(f"{url:>24} | {ok_ms:>7} | {nm_ms:>7} | {ok_bytes:>9} | {nm_bytes:>9}")
+    # ASGITransport no ejecuta el lifespan de la app: cerrar aquí las conexiones async
+    await dispose_async_engine()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=20_000)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 100])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    from asisya_api.core.config import settings
+    session = make_session(settings.database_url)
+    seed_products(session, args.products)
+    session.close()
+
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Tiempo de serialización de una página de listado (sin base de datos):
+
+  - products: `jsonable_encoder` + `JSONResponse` (ruta por defecto de FastAPI para
+    el dict que devuelve `GetProductsQueryHandler`) frente a `FastJSONResponse`.
+  - categories: validación contra `response_model=List[CategoryResponseDTO]` y
+    serialización como hace FastAPI, frente a `FastJSONResponse` sobre los DTOs.
+
+    python -m benchmarks.bench_list_serialization --items 100 1000 --repeat 50
+"""
+import argparse
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.utils import create_model_field
+
+from benchmarks.common import median_ms, time_call
+from asisya_api.crosscutting.responses import FastJSONResponse
+from asisya_api.features.categories.models import CategoryResponseDTO
+
+
+def product_page(items: int) -> dict:
+    now = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    return {
+        "items": [
+            {
+                "id": i, "name": f"Product {i}", "sku": f"SKU-{i:08d}", "description": f"Synthetic product {i}",
+                "quantity_per_unit": "10 boxes", "units_in_stock": i % 500, "units_on_order": 0,
+                "discontinued": False, "price": 10.5 + i, "available": True, "category_id": i % 50,
+                "created_by_user_id": 1, "created_at": now + timedelta(seconds=i), "updated_at": now,
+            }
+            for i in range(items)
+        ],
+        "page": 1, "per_page": items, "total_items": items * 10, "total_items_is_estimate": False,
+        "total_pages": 10, "next_cursor": "eyJ2IjoxfQ",
+    }
+
+
+def categories(items: int) -> List[CategoryResponseDTO]:
+    now = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    return [
+        CategoryResponseDTO(i, f"Category {i}", f"category-{i}", f"Description {i}", None, now, now)
+        for i in range(items)
+    ]
+
+
+def fastapi_category_response(field, content) -> bytes:
+    # Lo mismo que `fastapi.routing.serialize_response` con response_model: validar y volcar a JSON
+    value, errors = field.validate(content, {}, loc=("response",))
+    assert not errors, errors
+    return JSONResponse(field.serialize(value, mode="json")).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    field = create_model_field("response", List[CategoryResponseDTO], mode="serialization")
+    print(f"{'payload':>10} | {'items':>6} | {'fastapi ms':>10} | {'orjson ms':>9} | {'speedup':>7}")
+    print("-" * 56)
+    for items in args.items:
+        page = product_page(items)
+        default = median_ms(time_call(lambda: JSONResponse(jsonable_encoder(page)).body, args.repeat))
+        fast = median_ms(time_call(lambda: FastJSONResponse(page).body, args.repeat))
+        print(f"{'products':>10} | {items:>6} | {default:>10} | {fast:>9} | {default / fast:>6.1f}x")
+
+        dtos = categories(items)
+        default = median_ms(time_call(lambda: fastapi_category_response(field, dtos), args.repeat))
+        fast = median_ms(time_call(lambda: FastJSONResponse(dtos).body, args.repeat))
+        print(f"{'categories':>10} | {items:>6} | {default:>10} | {fast:>9} | {default / fast:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Tormenta de logins contra la API (en proceso, un único event loop como un worker de
+uvicorn) mientras un cliente lista productos.
+
+Compara:
+  - blocking: bcrypt ejecutado en el event loop (comportamiento anterior).
+  - pool: bcrypt en `password_executor` (pool acotado, 429 cuando se satura).
+
+Reporta p50/p99 del login (sólo respuestas 200), cuántos logins recibieron 429 y la
+latencia del listado de productos sin tormenta y durante la tormenta.
+
+    python -m benchmarks.bench_login_storm --concurrency 32 --duration 10
+"""
+import argparse
+import asyncio
+import logging
+import time
+from typing import List
+
+import httpx
+
+from benchmarks.common import make_session, seed_products
+from asisya_api.core.database import dispose_async_engine
+from asisya_api.domain.user import UserEntity
+from asisya_api.features.auth.auth_service import AuthService
+from asisya_api.main import app
+
+USERNAME = "storm"
+PASSWORD = "storm-password"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return round(ordered[index], 1)
+
+
+def seed_user(session) -> None:
+    if session.query(UserEntity).filter(UserEntity.username == USERNAME).first() is None:
+        session.add(UserEntity(
+            username=USERNAME,
+            email="storm@example.com",
+            full_name="Login Storm",
+            hashed_password=AuthService.get_password_hash(PASSWORD),
+            disabled=False,
+            roles="user",
+        ))
+        session.commit()
+
+
+def use_blocking_bcrypt(enabled: bool, original=AuthService.authenticate_user_async):
+    """Con `enabled` la verificación vuelve a ejecutarse dentro del event loop."""
+    async def blocking(self, username, password):
+        return self.authenticate_user(username, password)
+
+    AuthService.authenticate_user_async = blocking if enabled else original
+
+
+async def timed(client: httpx.AsyncClient, method: str, url: str, **kwargs):
+    start = time.perf_counter()
+    response = await client.request(method, url, **kwargs)
+    return response.status_code, (time.perf_counter() - start) * 1000
+
+
+async def list_products(client, headers, stop_at: float) -> List[float]:
+    samples = []
+    while time.perf_counter() < stop_at:
+        status_code, elapsed = await timed(client, "GET", "/products/?per_page=20", headers=headers)
+        assert status_code == 200, status_code
+        samples.append(elapsed)
+        await asyncio.sleep(0.02)
+    return samples
+
+
+async def login_loop(client, stop_at: float, latencies: List[float], statuses: dict) -> None:
+    form = {"username": USERNAME, "password": PASSWORD}
+    while time.perf_counter() < stop_at:
+        status_code, elapsed = await timed(client, "POST", "/auth/token", data=form)
+        statuses[status_code] = statuses.get(status_code, 0) + 1
+        if status_code == 200:
+            latencies.append(elapsed)
+        elif status_code == 429:
+            await asyncio.sleep(0.05)
+
+
+async def run_mode(client, headers, args) -> dict:
+    baseline = await list_products(client, headers, time.perf_counter() + args.baseline)
+
+    stop_at = time.perf_counter() + args.duration
+    login_latencies, statuses = [], {}
+    storm = [
+        asyncio.create_task(login_loop(client, stop_at, login_latencies, statuses))
+        for _ in range(args.concurrency)
+    ]
+    during = await list_products(client, headers, stop_at)
+    await asyncio.gather(*storm)
+
+    return {
+        "login_ok": statuses.get(200, 0),
+        "login_429": statuses.get(429, 0),
+        "login_p50_ms": percentile(login_latencies, 50),
+        "login_p99_ms": percentile(login_latencies, 99),
+        "list_p50_ms_idle": percentile(baseline, 50),
+        "list_p99_ms_idle": percentile(baseline, 99),
+        "list_p50_ms_storm": percentile(during, 50),
+        "list_p99_ms_storm": percentile(during, 99),
+        "list_requests_storm": len(during),
+    }
+
+
+async def run_benchmark(args) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        response = await client.post("/auth/token", data={"username": USERNAME, "password": PASSWORD})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        results = {}
+        for mode in ("blocking", "pool"):
+            use_blocking_bcrypt(mode == "blocking")
+            results[mode] = await run_mode(client, headers, args)
+        use_blocking_bcrypt(False)
+    await dispose_async_engine()
+
+    metrics = list(results["pool"])
+    print(f"{'metric':>22} | {'blocking':>10} | {'pool':>10}")
+    print("-" * 48)
+    for metric in metrics:
+        print(f"{metric:>22} | {results['blocking'][metric]:>10} | {results['pool'][metric]:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=32, help="clientes haciendo login en bucle")
+    parser.add_argument("--duration", type=float, default=10.0, help="segundos de tormenta por modo")
+    parser.add_argument("--baseline", type=float, default=3.0, help="segundos de listado sin tormenta")
+    args = parser.parse_args()
+
+    logging.getLogger("asisya_api").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    for name in ("asisya_api.features.auth.controller", "asisya_api.main",
+                 "asisya_api.features.products.queries.get_products_query",
+                 "asisya_api.crosscutting.bounded_executor"):
+        logging.getLogger(name).setLevel(logging.ERROR)
+
+    from asisya_api.core.config import settings
+    session = make_session(settings.database_url)
+    seed_products(session, args.products)
+    seed_user(session)
+    session.close()
+
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Coste de las métricas de latencia (`MetricsMiddleware` + `HandlerMetricsBehavior` +
+eventos de cursor de SQLAlchemy):
+
+  - por petición: latencia (mediana, en proceso con httpx + ASGITransport) de
+    `GET /categories/` (sin caché: handler + consulta) y `GET /products/` con las
+    métricas desactivadas y activadas;
+  - por observación: coste de `Histogram.observe` y de `render_metrics`.
+
+    python -m benchmarks.bench_metrics_overhead --products 20000 --repeat 500
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+
+from benchmarks.common import make_session, median_ms, seed_products, time_call_async
+from asisya_api.core.config import settings
+from asisya_api.core.database import dispose_async_engine
+from asisya_api.crosscutting import metrics
+from asisya_api.crosscutting.authorization import get_authenticated_user
+from asisya_api.features.categories.cache import invalidate_categories
+from asisya_api.features.user.models import User
+from asisya_api.main import create_app
+
+URLS = ["/categories/", "/products/?per_page=20"]
+
+
+def build_app(enabled: bool):
+    settings.metrics_enabled = enabled
+    app = create_app()
+    user = User(id=1, username="bench", full_name="Bench", email="bench@example.com", roles=["user"])
+    app.dependency_overrides[get_authenticated_user] = lambda: user
+    return app
+
+
+async def measure(app, enabled: bool, url: str, repeat: int) -> float:
+    settings.metrics_enabled = enabled
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+
+        async def call():
+            invalidate_categories()
+            response = await client.get(url)
+            assert response.status_code == 200, response.status_code
+
+        await time_call_async(call, 20)  # calentamiento
+        return median_ms(await time_call_async(call, repeat))
+
+
+async def run_benchmark(args) -> None:
+    apps = {False: build_app(False), True: build_app(True)}
+    print(f"{'endpoint':>24} | {'off ms':>7} | {'on ms':>7} | {'overhead':>8}")
+    print("-" * 56)
+    for url in URLS:
+        # Alternar varias rondas para repartir el ruido entre los dos modos
+        samples = {False: [], True: []}
+        for _ in range(args.rounds):
+            for enabled, app in apps.items():
+                samples[enabled].append(await measure(app, enabled, url, args.repeat))
+        off, on = sorted(samples[False])[args.rounds // 2], sorted(samples[True])[args.rounds // 2]
+        print(f"{url:>24} | {off:>7} | {on:>7} | {(on - off) * 1000:>6.0f}us")
+    # ASGITransport no ejecuta el lifespan de la app: cerrar aquí las conexiones async
+    await dispose_async_engine()
+
+
+def bench_primitives(repeat: int) -> None:
+    histogram = metrics.Histogram("bench_seconds", "Bench.", ("method", "route", "status"))
+    start = time.perf_counter()
+    for i in range(repeat):
+        histogram.observe(i % 100 / 1000, "GET", "/products/", "200")
+    observe_us = (time.perf_counter() - start) / repeat * 1e6
+
+    start = time.perf_counter()
+    for _ in range(100):
+        metrics.render_metrics()
+    render_ms = (time.perf_counter() - start) / 100 * 1000
+    print(f"Histogram.observe: {observe_us:.2f}us | render_metrics: {render_ms:.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    session = make_session(settings.database_url)
+    seed_products(session, args.products)
+    session.close()
+
+    asyncio.run(run_benchmark(args))
+    bench_primitives(100_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Descarga del catálogo completo:
+
+  - paging: `GET /products/?page=N&per_page=P` hasta la última página (lo que hacían
+    las sincronizaciones nocturnas: OFFSET creciente y total en cada página).
+  - export: `GET /products/export` (NDJSON o CSV) en una sola respuesta en streaming.
+
+Reporta el tiempo total, las filas por segundo y el pico de memoria Python
+(tracemalloc) de la API mientras se descarga.
+
+    python -m benchmarks.bench_product_export --products 100000 --per-page 100
+"""
+import argparse
+import asyncio
+import logging
+import time
+import tracemalloc
+
+import httpx
+
+from benchmarks.common import make_session, seed_products
+from asisya_api.core.database import dispose_async_engine
+from asisya_api.crosscutting.authorization import get_authenticated_user
+from asisya_api.features.user.models import User
+from asisya_api.main import app
+
+
+async def download_pages(client: httpx.AsyncClient, per_page: int) -> int:
+    rows, page = 0, 1
+    while True:
+        response = await client.get("/products/", params={"page": page, "per_page": per_page})
+        assert response.status_code == 200, response.status_code
+        body = response.json()
+        rows += len(body["items"])
+        if page >= body["total_pages"]:
+            return rows
+        page += 1
+
+
+async def download_export(client: httpx.AsyncClient, export_format: str) -> int:
+    """
+    Llama a la app ASGI directamente: ASGITransport de httpx acumula el cuerpo entero
+    antes de devolverlo y falsearía la memoria. Aquí cada bloque se cuenta y se descarta.
+    """
+    rows, statuses = 0, []
+    requested = asyncio.Event()
+    finished = asyncio.Event()
+
+    async def receive():
+        # Primero el cuerpo (vacío) de la petición; después el cliente sólo se desconecta al terminar
+        if not requested.is_set():
+            requested.set()
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal rows
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+        elif message["type"] == "http.response.body":
+            rows += message.get("body", b"").count(b"\n")
+
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http", "root_path": "",
+        "path": "/products/export", "raw_path": b"/products/export",
+        "query_string": f"format={export_format}".encode(), "headers": [],
+        "server": ("bench", 80), "client": ("127.0.0.1", 50000),
+    }
+    await app(scope, receive, send)
+    finished.set()
+    assert statuses == [200], statuses
+    return rows - (1 if export_format == "csv" else 0)
+
+
+async def run_benchmark(args) -> None:
+    user = User(id=1, username="bench", full_name="Bench", email="bench@example.com", roles=["user"])
+    app.dependency_overrides[get_authenticated_user] = lambda: user
+
+    modes = {
+        f"paging ({args.per_page}/page)": lambda client: download_pages(client, args.per_page),
+        "export ndjson": lambda client: download_export(client, "ndjson"),
+        "export csv": lambda client: download_export(client, "csv"),
+    }
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+        print(f"{'mode':>20} | {'rows':>8} | {'seconds':>8} | {'rows/s':>9} | {'peak MB':>8}")
+        print("-" * 66)
+        for mode, download in modes.items():
+            tracemalloc.start()
+            start = time.perf_counter()
+            rows = await download(client)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+            print(f"{mode:>20} | {rows:>8} | {elapsed:>8.2f} | {rows / elapsed:>9.0f} | {peak:>8.1f}")
+    # ASGITransport no ejecuta el lifespan de la app: cerrar aquí las conexiones async
+    await dispose_async_engine()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--per-page", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    from asisya_api.core.config import settings
+    session = make_session(settings.database_url)
+    seed_products(session, args.products)
+    session.close()
+
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
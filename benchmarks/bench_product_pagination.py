@@ -0,0 +1,81 @@
+"""
+Compara la paginación por número de página (OFFSET) con la paginación por cursor
+(keyset) de `GetProductsQueryHandler` desde la página 1 hasta la 10.000.
+
+    python -m benchmarks.bench_product_pagination --products 200000 --per-page 10
+
+Con OFFSET la latencia crece linealmente con la página (la base de datos recorre y
+descarta todas las filas anteriores); con cursor debe mantenerse plana.
+"""
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import select
+
+from benchmarks.common import make_async_session_factory, make_session, median_ms, seed_products, time_call_async
+from asisya_api.core.unit_of_work import async_unit_of_work
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.pagination import encode_cursor
+from asisya_api.features.products.queries.get_products_query import GetProductsQuery, GetProductsQueryHandler
+
+PAGES = (1, 10, 100, 1_000, 10_000)
+
+
+def cursor_for_page(session, page: int, per_page: int, sort_by: str) -> str:
+    """Cursor equivalente a haber llegado a `page` navegando con next_cursor."""
+    if page == 1:
+        return ""
+    sort_column = getattr(ProductEntity, sort_by)
+    last = session.execute(
+        select(sort_column, ProductEntity.id)
+        .order_by(sort_column, ProductEntity.id)
+        .offset((page - 1) * per_page - 1)
+        .limit(1)
+    ).one()
+    return encode_cursor(sort_by, "asc", last[0], last[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///./benchmark.db")
+    parser.add_argument("--products", type=int, default=200_000)
+    parser.add_argument("--per-page", type=int, default=10)
+    parser.add_argument("--sort-by", default="created_at", choices=("id", "name", "price", "created_at"))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.getLogger("asisya_api").setLevel(logging.WARNING)
+    logging.getLogger("asisya_api.features.products.queries.get_products_query").setLevel(logging.WARNING)
+
+    session = make_session(args.database_url)
+    seed_products(session, args.products)
+    async_session_factory = make_async_session_factory(args.database_url)
+    asyncio.run(run_benchmark(session, async_session_factory, args))
+
+
+async def run_benchmark(session, async_session_factory, args):
+    async with async_unit_of_work(lambda: session, async_session_factory):
+        handler = GetProductsQueryHandler()
+
+        print(f"{'page':>8} | {'offset (ms)':>12} | {'cursor (ms)':>12}")
+        print("-" * 38)
+        for page in PAGES:
+            if (page - 1) * args.per_page >= args.products:
+                break
+            cursor = cursor_for_page(session, page, args.per_page, args.sort_by)
+            offset_ms = median_ms(await time_call_async(
+                lambda: handler.handle(GetProductsQuery(page=page, per_page=args.per_page, sort_by=args.sort_by)),
+                args.repeat,
+            ))
+            cursor_ms = median_ms(await time_call_async(
+                lambda: handler.handle(GetProductsQuery(per_page=args.per_page, cursor=cursor, sort_by=args.sort_by)),
+                args.repeat,
+            ))
+            print(f"{page:>8} | {offset_ms:>12} | {cursor_ms:>12}")
+
+    await async_session_factory.kw["bind"].dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Lectura de una página del listado de productos (consulta + items) con:
+
+  - orm: `select(ProductEntity)` con entidades, identity map y los joins
+    `lazy="joined"` de `category` y `created_by_user` (camino anterior).
+  - columns: las columnas del item como filas (`PRODUCT_COLUMNS`), como hace ahora
+    `GetProductsQueryHandler`.
+  - columns+category: lo mismo con `include_category` (un LEFT JOIN explícito).
+
+    python -m benchmarks.bench_product_read_path --products 50000 --per-page 10 100 1000
+"""
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import select, update
+
+from benchmarks.common import make_async_session_factory, make_session, median_ms, seed_products, time_call_async
+from asisya_api.core.unit_of_work import async_unit_of_work
+from asisya_api.domain.product import ProductEntity
+from asisya_api.domain.user import UserEntity
+from asisya_api.features.auth.auth_service import AuthService
+from asisya_api.features.products.queries.get_products_query import GetProductsQuery, GetProductsQueryHandler
+
+
+def orm_items(products):
+    # Conversión de entidades a items del camino anterior
+    return [
+        {
+            "id": p.id, "name": p.name, "sku": p.sku, "description": p.description,
+            "quantity_per_unit": p.quantity_per_unit, "units_in_stock": p.units_in_stock,
+            "units_on_order": p.units_on_order, "discontinued": p.discontinued, "price": float(p.price),
+            "available": p.available, "category_id": p.category_id, "created_by_user_id": p.created_by_user_id,
+            "created_at": p.created_at, "updated_at": p.updated_at,
+        }
+        for p in products
+    ]
+
+
+def seed_creator(session) -> None:
+    """Los productos del benchmark los ha creado un usuario: el join con users trae sus filas."""
+    if session.scalar(select(UserEntity.id).where(UserEntity.username == "bench")) is None:
+        session.add(UserEntity(
+            username="bench", email="bench@example.com", full_name="Bench",
+            hashed_password=AuthService.get_password_hash("bench"), disabled=False, roles="user",
+        ))
+        session.commit()
+    user_id = session.scalar(select(UserEntity.id).where(UserEntity.username == "bench"))
+    session.execute(update(ProductEntity).values(created_by_user_id=user_id))
+    session.commit()
+
+
+async def run_benchmark(session, async_session_factory, args) -> None:
+    print(f"{'per_page':>8} | {'orm ms':>8} | {'columns ms':>10} | {'+category ms':>12} | {'speedup':>7}")
+    print("-" * 58)
+    for per_page in args.per_page:
+        async with async_unit_of_work(lambda: session, async_session_factory) as uow:
+            handler = GetProductsQueryHandler()
+            db = uow.async_session
+
+            async def orm():
+                stmt = select(ProductEntity).order_by(ProductEntity.id).limit(per_page)
+                result = orm_items((await db.execute(stmt)).scalars().all())
+                db.expunge_all()  # como en una petición nueva: identity map vacío
+                return result
+
+            async def columns(include_category=False):
+                request = GetProductsQuery(per_page=per_page, include_category=include_category)
+                stmt = (await handler._ordered_select(request, [])).limit(per_page)
+                return handler._to_items((await db.execute(stmt)).all())
+
+            assert await orm() == await columns()
+            orm_ms = median_ms(await time_call_async(orm, args.repeat))
+            columns_ms = median_ms(await time_call_async(columns, args.repeat))
+            category_ms = median_ms(await time_call_async(lambda: columns(True), args.repeat))
+        print(f"{per_page:>8} | {orm_ms:>8} | {columns_ms:>10} | {category_ms:>12} | {orm_ms / columns_ms:>6.1f}x")
+    # Cerrar las conexiones async en el mismo event loop que las abrió
+    await async_session_factory.kw["bind"].dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///./benchmark.db")
+    parser.add_argument("--products", type=int, default=50_000)
+    parser.add_argument("--per-page", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    logging.getLogger("asisya_api").setLevel(logging.WARNING)
+
+    session = make_session(args.database_url)
+    seed_products(session, args.products)
+    seed_creator(session)
+    async_session_factory = make_async_session_factory(args.database_url)
+    asyncio.run(run_benchmark(session, async_session_factory, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Mensajes por segundo del worker de carga masiva contra una cola SQS en memoria.
+
+  - legacy: el poller anterior (recibe 10, procesa de uno en uno, borra cada mensaje
+    con delete_message y duerme 1 s).
+  - threads-N / processes-N: `SqsConsumer` con N workers.
+
+El procesamiento de cada mensaje se simula con `--io-ms` de espera (idas y vueltas a
+la base de datos) y `--cpu-ms` de CPU (normalización), para aislar el consumidor.
+
+    python -m benchmarks.bench_sqs_consumer --messages 200 --io-ms 40 --cpu-ms 5
+"""
+import argparse
+import functools
+import logging
+import threading
+import time
+
+from asisya_api.infrastructure.in_memory_sqs import InMemorySqsClient
+from asisya_api.infrastructure.sqs_consumer import SqsConsumer
+
+QUEUE_URL = "memory://bulk-products"
+
+
+def simulated_work(message, io_seconds: float, cpu_seconds: float) -> None:
+    time.sleep(io_seconds)
+    end = time.process_time() + cpu_seconds
+    while time.process_time() < end:
+        pass
+
+
+def filled_queue(messages: int) -> InMemorySqsClient:
+    client = InMemorySqsClient()
+    for i in range(messages):
+        client.send_message(QueueUrl=QUEUE_URL, MessageBody=f'{{"message": {i}}}')
+    return client
+
+
+def run_legacy(client, process) -> None:
+    while client.messages(QUEUE_URL):
+        response = client.receive_message(QueueUrl=QUEUE_URL, MaxNumberOfMessages=10, WaitTimeSeconds=5)
+        for message in response.get("Messages", []):
+            process(message)
+            client.delete_message(QueueUrl=QUEUE_URL, ReceiptHandle=message["ReceiptHandle"])
+        time.sleep(1)
+
+
+def run_consumer(client, process, concurrency: int, use_processes: bool) -> float:
+    """Devuelve el instante en que la cola queda vacía (sin contar la parada del consumidor)."""
+    consumer = SqsConsumer(
+        client, QUEUE_URL, process, concurrency=concurrency, use_processes=use_processes, wait_time_seconds=1
+    )
+    thread = threading.Thread(target=consumer.run)
+    thread.start()
+    while consumer.stats["deleted"] < consumer.stats["received"] or client.messages(QUEUE_URL):
+        time.sleep(0.005)
+    drained_at = time.perf_counter()
+    consumer.stop()
+    thread.join()
+    return drained_at
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--io-ms", type=float, default=40)
+    parser.add_argument("--cpu-ms", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    logging.getLogger("asisya_api").setLevel(logging.WARNING)
+    process = functools.partial(simulated_work, io_seconds=args.io_ms / 1000, cpu_seconds=args.cpu_ms / 1000)
+
+    modes = [("legacy", None, False)]
+    modes += [(f"threads-{n}", n, False) for n in args.concurrency]
+    modes += [(f"processes-{n}", n, True) for n in args.concurrency if n > 1]
+
+    print(f"{'mode':>13} | {'msg/s':>8} | {'seconds':>8}")
+    print("-" * 36)
+    for name, concurrency, use_processes in modes:
+        client = filled_queue(args.messages)
+        start = time.perf_counter()
+        if concurrency is None:
+            run_legacy(client, process)
+            elapsed = time.perf_counter() - start
+        else:
+            elapsed = run_consumer(client, process, concurrency, use_processes) - start
+        print(f"{name:>13} | {args.messages / elapsed:>8.1f} | {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from asisya_api.core.database import Base, async_database_url
+from asisya_api.domain.category import CategoryEntity
+from asisya_api.domain.product import ProductEntity
+from asisya_api.domain.user import UserEntity
+import asisya_api.domain  # noqa: F401  (registra todas las tablas)
+
+
+def make_session(database_url: str, **engine_kwargs) -> Session:
+    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, connect_args=connect_args, **engine_kwargs)
+    Base.metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+def make_async_session_factory(database_url: str, **engine_kwargs) -> async_sessionmaker:
+    """Sesiones async sobre la misma base de datos que `make_session` (para handlers async)."""
+    engine = create_async_engine(async_database_url(database_url), **engine_kwargs)
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def seed_products(session: Session, total: int, categories: int = 50, chunk_size: int = 10_000) -> None:
+    """
+    Inserta `total` productos sintéticos (idempotente: sólo completa lo que falte).
+    """
+    existing_categories = session.scalar(select(func.count()).select_from(CategoryEntity))
+    if existing_categories < categories:
+        session.execute(insert(CategoryEntity), [
+            {"name": f"Category {i}", "slug": f"category-{i}"}
+            for i in range(existing_categories, categories)
+        ])
+        session.commit()
+    category_ids = session.scalars(select(CategoryEntity.id)).all()
+
+    existing = session.scalar(select(func.count()).select_from(ProductEntity))
+    rnd = random.Random(42)
+    base_date = datetime(2024, 1, 1)
+    for start in range(existing, total, chunk_size):
+        rows = [
+            {
+                "name": f"Product {rnd.randint(0, total)}",
+                "sku": f"BENCH-{i:09d}",
+                "description": f"Synthetic product number {i}",
+                "price": Decimal(rnd.randint(100, 100_000)) / 100,
+                "units_in_stock": rnd.randint(0, 500),
+                "units_on_order": 0,
+                "available": rnd.random() > 0.2,
+                "discontinued": rnd.random() < 0.1,
+                "category_id": rnd.choice(category_ids),
+                "created_at": base_date + timedelta(seconds=i),
+                "updated_at": base_date + timedelta(seconds=i),
+            }
+            for i in range(start, min(start + chunk_size, total))
+        ]
+        session.execute(insert(ProductEntity), rows)
+        session.commit()
+
+
+def seed_users(session: Session, total: int, hashed_password: str, chunk_size: int = 10_000) -> None:
+    """
+    Inserta `total` usuarios `bench-user-<n>` con la misma contraseña (idempotente). El
+    hash se calcula una vez fuera: bcrypt por usuario haría la carga inicial de minutos.
+    """
+    existing = session.scalar(select(func.count()).select_from(UserEntity).where(UserEntity.username.like("bench-user-%")))
+    for start in range(existing, total, chunk_size):
+        session.execute(insert(UserEntity), [
+            {
+                "username": f"bench-user-{i}",
+                "email": f"bench-user-{i}@example.com",
+                "full_name": f"Bench User {i}",
+                "hashed_password": hashed_password,
+                "disabled": False,
+                "roles": "user",
+            }
+            for i in range(start, min(start + chunk_size, total))
+        ])
+        session.commit()
+
+
+def time_call(fn: Callable[[], object], repeat: int = 5) -> List[float]:
+    """Ejecuta `fn` `repeat` veces y devuelve las duraciones en milisegundos."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def time_call_async(fn: Callable[[], Awaitable[object]], repeat: int = 5) -> List[float]:
+    """Como `time_call`, para corutinas."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def median_ms(samples: List[float]) -> float:
+    return round(statistics.median(samples), 3)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Percentil sin interpolar (la muestra de posición más cercana), en las unidades de `samples`."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return round(ordered[index], 3)
+
+
+def git_commit() -> Optional[str]:
+    """Commit actual (abreviado) para identificar los resultados guardados."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,281 @@
+"""
+Prueba de carga de los caminos calientes de la API, con resultados comparables entre commits.
+
+Carga un dataset realista (productos, categorías y usuarios sintéticos, idempotente)
+en la base de datos de `DATABASE_URL` (PostgreSQL o SQLite) y lanza, uno tras otro,
+estos escenarios con `--concurrency` clientes durante `--duration` segundos cada uno:
+
+  - auth_token:      POST /auth/token con usuarios al azar (bcrypt real).
+  - products_list:   GET /products/ con filtros mezclados (categoría, disponibilidad,
+                     rango de precio, orden, búsqueda, cursor, include_category).
+  - categories_list: GET /categories/.
+  - products_bulk:   POST /products/bulk con `--bulk-size` productos nuevos.
+
+Por escenario informa peticiones, errores, throughput y latencias p50/p95/p99, y lo
+guarda en un JSON (`--output`) con los datos de la ejecución (commit, base de datos,
+dataset, concurrencia) para poder versionarlo y compararlo con `--compare`.
+
+En PostgreSQL hay que aplicar antes las migraciones (`alembic upgrade head`): la
+búsqueda usa los índices GIN y pg_trgm que crean.
+
+Por defecto la API se ejecuta en proceso (httpx + ASGITransport, un único event loop
+como un worker de uvicorn) y las cargas masivas se procesan en la propia petición
+(`BULK_SYNC_MAX_ROWS`), sin SQS. Con `--base-url` se ataca un servidor ya arrancado,
+que debe usar la misma base de datos.
+
+    python -m benchmarks.load_test --products 1000000 --categories 500 --users 10000 \\
+        --concurrency 32 --duration 30 --output benchmarks/results/load_baseline.json
+    python -m benchmarks.load_test --compare benchmarks/results/load_baseline.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+from sqlalchemy.engine import make_url
+
+from benchmarks.common import git_commit, make_session, percentile, seed_products, seed_users
+
+PASSWORD = "bench-password"
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "load_baseline.json"
+LATEST_OUTPUT = DEFAULT_OUTPUT.with_name("load_latest.json")
+SCENARIOS = ("auth_token", "products_list", "categories_list", "products_bulk")
+COMPARED_METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms", "error_rate")
+
+# (método, url, kwargs de httpx)
+Request = Tuple[str, str, dict]
+
+
+class Scenario:
+    """Genera las peticiones de un escenario; `rnd` es propio de cada cliente (reproducible)."""
+
+    def __init__(self, name: str, build: Callable[[random.Random], Request], authenticated: bool = True):
+        self.name = name
+        self.build = build
+        self.authenticated = authenticated
+
+
+def _price_range(rnd: random.Random, args) -> dict:
+    low = rnd.randint(1, 900)
+    return {"min_price": low, "max_price": low + 10}
+
+
+# Mezcla de filtros de GET /products/ (cada petición elige uno al azar)
+PRODUCT_FILTERS: Dict[str, Callable[[random.Random, argparse.Namespace], dict]] = {
+    "page": lambda rnd, args: {},
+    "category": lambda rnd, args: {"category_id": rnd.randint(1, args.categories)},
+    "category_available": lambda rnd, args: {"category_id": rnd.randint(1, args.categories), "available": "true"},
+    "price_range": _price_range,
+    "active_by_price": lambda rnd, args: {"sort_by": "price", "sort_order": "desc", "discontinued": "false"},
+    "search": lambda rnd, args: {"search": f"Product {rnd.randint(1, args.products)}"},
+    "cursor": lambda rnd, args: {"cursor": "", "category_id": rnd.randint(1, args.categories)},
+    "with_category": lambda rnd, args: {"include_category": "true", "page": rnd.randint(1, 50)},
+}
+
+
+def product_list_request(args) -> Callable[[random.Random], Request]:
+    filters = [PRODUCT_FILTERS[name] for name in args.product_filters]
+
+    def build(rnd: random.Random) -> Request:
+        params = {"per_page": rnd.choice((20, 50)), **rnd.choice(filters)(rnd, args)}
+        return "GET", "/products/", {"params": params}
+
+    return build
+
+
+def bulk_request(args, run_id: str) -> Callable[[random.Random], Request]:
+    def build(rnd: random.Random) -> Request:
+        prefix = f"LOAD-{run_id}-{rnd.getrandbits(48):012x}"
+        products = [
+            {
+                "name": f"Load product {prefix}-{n}",
+                "sku": f"{prefix}-{n}",
+                "price": rnd.randint(100, 100_000) / 100,
+                "stock": rnd.randint(0, 500),
+                "category_id": rnd.randint(1, args.categories),
+            }
+            for n in range(args.bulk_size)
+        ]
+        return "POST", "/products/bulk", {"json": {"products": products, "batch_size": min(args.bulk_size, 200)}}
+
+    return build
+
+
+def build_scenarios(args) -> Dict[str, Scenario]:
+    def login(rnd: random.Random) -> Request:
+        username = f"bench-user-{rnd.randrange(args.users)}"
+        return "POST", "/auth/token", {"data": {"username": username, "password": PASSWORD}}
+
+    scenarios = [
+        Scenario("auth_token", login, authenticated=False),
+        Scenario("products_list", product_list_request(args)),
+        Scenario("categories_list", lambda rnd: ("GET", "/categories/", {})),
+        Scenario("products_bulk", bulk_request(args, uuid.uuid4().hex[:8])),
+    ]
+    return {scenario.name: scenario for scenario in scenarios if scenario.name in args.scenarios}
+
+
+async def client_loop(client, scenario: Scenario, headers: dict, rnd: random.Random,
+                      warmup_until: float, stop_at: float, latencies: List[float], statuses: Dict[int, int]) -> None:
+    while time.perf_counter() < stop_at:
+        method, url, kwargs = scenario.build(rnd)
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, headers=headers if scenario.authenticated else None, **kwargs)
+            status_code = response.status_code
+        except httpx.HTTPError:
+            status_code = 0  # error de transporte (timeout, conexión)
+        if start < warmup_until:
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+        statuses[status_code] = statuses.get(status_code, 0) + 1
+
+
+async def run_scenario(client, scenario: Scenario, headers: dict, args) -> dict:
+    latencies, statuses = [], {}
+    warmup_until = time.perf_counter() + args.warmup
+    stop_at = warmup_until + args.duration
+    await asyncio.gather(*(
+        client_loop(client, scenario, headers, random.Random(f"{scenario.name}-{n}"), warmup_until, stop_at,
+                    latencies, statuses)
+        for n in range(args.concurrency)
+    ))
+    errors = sum(count for status_code, count in statuses.items() if not 200 <= status_code < 400)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "error_rate": round(errors / len(latencies), 4) if latencies else 0.0,
+        "statuses": {str(status_code): count for status_code, count in sorted(statuses.items())},
+        "throughput_rps": round(len(latencies) / args.duration, 1),
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else float("nan"),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": round(max(latencies), 3) if latencies else float("nan"),
+    }
+
+
+async def run_load_test(args) -> dict:
+    if args.base_url:
+        transport, base_url, app = None, args.base_url, None
+    else:
+        from asisya_api.core.config import settings
+        from asisya_api.main import app
+
+        settings.bulk_sync_max_rows = max(settings.bulk_sync_max_rows, args.bulk_size)
+        transport, base_url = httpx.ASGITransport(app=app), "http://load-test"
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        response = await client.post("/auth/token", data={"username": "bench-user-0", "password": PASSWORD})
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        results = {}
+        for name, scenario in build_scenarios(args).items():
+            results[name] = await run_scenario(client, scenario, headers, args)
+            print(format_row(name, results[name]))
+
+    if app is not None:
+        # ASGITransport no ejecuta el lifespan de la app: cerrar aquí las conexiones async
+        from asisya_api.core.database import dispose_async_engine
+        await dispose_async_engine()
+    return results
+
+
+def format_row(name: str, result: dict) -> str:
+    return (
+        f"{name:>16} | {result['requests']:>8} | {result['errors']:>6} | {result['throughput_rps']:>8} | "
+        f"{result['p50_ms']:>8} | {result['p95_ms']:>8} | {result['p99_ms']:>8}"
+    )
+
+
+def run_metadata(args, database_url: str) -> dict:
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "database": make_url(database_url).get_backend_name(),
+        "target": args.base_url or "in-process",
+        "python": platform.python_version(),
+        "dataset": {"products": args.products, "categories": args.categories, "users": args.users},
+        "concurrency": args.concurrency,
+        "duration_seconds": args.duration,
+        "bulk_size": args.bulk_size,
+        "product_filters": args.product_filters,
+    }
+
+
+def compare(previous: dict, current: dict) -> None:
+    """Diferencia relativa de cada métrica respecto a la ejecución anterior."""
+    print(f"\nvs {previous['meta'].get('commit')} ({previous['meta'].get('timestamp')})")
+    print(f"{'scenario':>16} | {'metric':>14} | {'before':>10} | {'after':>10} | {'change':>8}")
+    print("-" * 70)
+    for name, result in current["scenarios"].items():
+        before = previous["scenarios"].get(name)
+        if before is None:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = before[metric], result[metric]
+            change = f"{(new - old) / old * 100:+.1f}%" if old else "-"
+            print(f"{name:>16} | {metric:>14} | {old:>10} | {new:>10} | {change:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=500)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=32, help="clientes simultáneos por escenario")
+    parser.add_argument("--duration", type=float, default=30.0, help="segundos medidos por escenario")
+    parser.add_argument("--warmup", type=float, default=3.0, help="segundos previos sin medir por escenario")
+    parser.add_argument("--bulk-size", type=int, default=100, help="productos por POST /products/bulk")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument(
+        "--product-filters", nargs="+", choices=list(PRODUCT_FILTERS), default=list(PRODUCT_FILTERS),
+        help="filtros de products_list (p. ej. sin `search` en un PostgreSQL sin pg_trgm)",
+    )
+    parser.add_argument("--base-url", help="servidor ya arrancado (por defecto, la API en proceso)")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", type=Path, help=f"por defecto {DEFAULT_OUTPUT.name} (o {LATEST_OUTPUT.name} con --compare)")
+    parser.add_argument("--compare", type=Path, help="resultados anteriores con los que comparar")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    # El emisor de SQS se construye aunque la carga se procese en la petición
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+    from asisya_api.core.config import settings
+    from asisya_api.features.auth.auth_service import AuthService
+
+    previous = json.loads(args.compare.read_text()) if args.compare else None
+    # Comparar no sobrescribe la línea base
+    output = args.output or (LATEST_OUTPUT if args.compare else DEFAULT_OUTPUT)
+
+    session = make_session(settings.database_url)
+    seed_products(session, args.products, categories=args.categories)
+    seed_users(session, args.users, AuthService.get_password_hash(PASSWORD))
+    session.close()
+
+    print(f"{'scenario':>16} | {'requests':>8} | {'errors':>6} | {'req/s':>8} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8}")
+    print("-" * 82)
+    results = asyncio.run(run_load_test(args))
+
+    report = {"meta": run_metadata(args, settings.database_url), "scenarios": results}
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print(f"\nResultados en {output}")
+    if previous is not None:
+        compare(previous, report)
+
+
+if __name__ == "__main__":
+    main()
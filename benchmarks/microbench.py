@@ -0,0 +1,268 @@
+"""
+Microbenchmarks en proceso de los puntos calientes en Python puro, con resultados
+guardados y comparación contra una ejecución anterior.
+
+  - product.to_domain:              `ProductEntity.to_domain` (con su categoría).
+  - products.to_items:              los dicts del listado (`GetProductsQueryHandler._to_items`).
+  - category.dto_from_entities:     `CategoryResponseDTO` desde las entidades, como el listado.
+  - category.dto_from_cache:        `CategoryResponseDTO` desde la caché (`decode_categories`).
+  - auth.jwt_decode:                `jwt.decode` del token de acceso.
+  - auth.get_authenticated_user:    la dependencia completa, con el usuario en caché.
+  - bulk.normalize.<normalizador>:  normalización de un mensaje de carga masiva (lo que
+                                    hace el worker `process_bulk_products/handler.py`).
+
+Cada benchmark prepara sus datos fuera de la medición y se ejecuta con `timeit`:
+`autorange` elige el número de llamadas por muestra y se toman `--repeat` muestras en
+cada una de las `--rounds` rondas (alternando los benchmarks). Se guarda el mínimo
+(el valor menos afectado por el ruido del sistema) y la mediana por llamada. Con
+`--compare` se marca como regresión todo benchmark cuyo mínimo empeore más de
+`--threshold` % y el proceso termina con código 1. En máquinas compartidas el ruido
+entre ejecuciones puede superar el 10 %: ajustar el umbral a la máquina.
+
+    python -m benchmarks.microbench
+    python -m benchmarks.microbench --compare benchmarks/results/micro_baseline.json --threshold 15
+    python -m benchmarks.microbench --filter auth --rounds 10
+"""
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from jose import jwt
+from sqlalchemy import create_engine, insert, select
+
+from benchmarks.bench_bulk_normalization import raw_products
+from benchmarks.common import git_commit
+from asisya_api.core.config import settings
+from asisya_api.core.database import Base
+from asisya_api.crosscutting.authorization import get_authenticated_user
+from asisya_api.domain.category import CategoryEntity
+from asisya_api.domain.product import ProductEntity
+from asisya_api.domain.user import UserEntity
+from asisya_api.features.categories.cache import decode_categories, encode_categories
+from asisya_api.features.categories.models import CategoryResponseDTO
+from asisya_api.features.products.normalization import PRODUCT_NORMALIZERS
+from asisya_api.features.products.queries.get_products_query import PRODUCT_COLUMNS, GetProductsQueryHandler
+import asisya_api.domain  # noqa: F401  (registra todas las tablas)
+
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "micro_baseline.json"
+LATEST_OUTPUT = DEFAULT_OUTPUT.with_name("micro_latest.json")
+
+# nombre -> función que prepara los datos y devuelve la llamada a medir
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def microbenchmark(name: str):
+    def register(setup: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _category_entities(total: int) -> list:
+    now = datetime(2024, 1, 1)
+    return [
+        CategoryEntity(
+            id=i, name=f"Category {i}", slug=f"category-{i}", description=f"Category number {i}",
+            picture_path=f"categories/{i}.png", created_at=now, updated_at=now,
+        )
+        for i in range(total)
+    ]
+
+
+@microbenchmark("product.to_domain")
+def product_to_domain():
+    now = datetime(2024, 1, 1)
+    product = ProductEntity(
+        id=1, name="Product 1", sku="SKU-1", description="Synthetic product", quantity_per_unit="1 box",
+        units_in_stock=10, units_on_order=0, discontinued=False, price=Decimal("19.99"), available=True,
+        category=_category_entities(1)[0], created_by_user_id=1, created_at=now, updated_at=now,
+    )
+    return product.to_domain
+
+
+@microbenchmark("products.to_items[50]")
+def products_to_items():
+    # Filas reales de SQLAlchemy (Row), como las que recibe el handler
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    now = datetime(2024, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(insert(ProductEntity), [
+            {"name": f"Product {i}", "sku": f"SKU-{i}", "description": f"Synthetic product {i}",
+             "price": Decimal(i) + Decimal("0.99"), "units_in_stock": i, "units_on_order": 0,
+             "available": True, "discontinued": False, "created_at": now, "updated_at": now}
+            for i in range(50)
+        ])
+        rows = connection.execute(select(*PRODUCT_COLUMNS)).all()
+    engine.dispose()
+    # `_to_items` no usa el estado del handler (su __init__ necesita una unidad de trabajo)
+    handler = object.__new__(GetProductsQueryHandler)
+    return lambda: handler._to_items(rows)
+
+
+@microbenchmark("category.dto_from_entities[100]")
+def category_dto_from_entities():
+    categories = _category_entities(100)
+    # Misma conversión que GetAllCategoriesQueryHandler._load
+    return lambda: [
+        CategoryResponseDTO(
+            id=cat.id,
+            name=cat.name,
+            slug=cat.slug,
+            description=cat.description,
+            picture_url=cat.picture_path,
+            created_at=cat.created_at,
+            updated_at=cat.updated_at,
+        )
+        for cat in categories
+    ]
+
+
+@microbenchmark("category.dto_from_cache[100]")
+def category_dto_from_cache():
+    payload = encode_categories(category_dto_from_entities()())
+    return lambda: decode_categories(payload)
+
+
+def _access_token() -> str:
+    expire = datetime.now(timezone.utc) + timedelta(days=1)
+    return jwt.encode({"sub": "bench", "roles": "user", "exp": expire}, settings.secret_key, algorithm=settings.algorithm)
+
+
+@microbenchmark("auth.jwt_decode")
+def auth_jwt_decode():
+    token = _access_token()
+    return lambda: jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+
+
+@microbenchmark("auth.get_authenticated_user")
+def auth_get_authenticated_user():
+    class UserRepository:
+        # Sólo se consulta si el usuario no está en la caché (primera llamada o TTL vencido)
+        def get_by_username(self, username):
+            return UserEntity(id=1, username=username, email="bench@example.com", full_name="Bench",
+                              hashed_password="x", disabled=False, roles="user")
+
+    token, repo = _access_token(), UserRepository()
+    get_authenticated_user(token, repo)
+    return lambda: get_authenticated_user(token, repo)
+
+
+def _normalize(name: str):
+    # Un mensaje de SQS con el batch_size por defecto de la API
+    products, normalizer = raw_products(100), PRODUCT_NORMALIZERS[name]()
+    now = datetime(2024, 1, 1)
+    return lambda: normalizer.normalize(products, 7, on_error=lambda product, error: None, now=now)
+
+
+@microbenchmark("bulk.normalize.row[100]")
+def bulk_normalize_row():
+    return _normalize("row")
+
+
+@microbenchmark("bulk.normalize.columnar[100]")
+def bulk_normalize_columnar():
+    return _normalize("columnar")
+
+
+def run_benchmarks(names: List[str], rounds: int, repeat: int) -> Dict[str, dict]:
+    """
+    `rounds` rondas alternando los benchmarks, `repeat` muestras de cada uno por ronda:
+    si la máquina se ralentiza un rato afecta a una ronda, no a todas las muestras de
+    un mismo benchmark.
+    """
+    timers = {}
+    for name in names:
+        timer = timeit.Timer(BENCHMARKS[name]())
+        timers[name] = (timer, timer.autorange()[0])
+    samples = {name: [] for name in names}
+    for _ in range(rounds):
+        for name, (timer, number) in timers.items():
+            samples[name].extend(seconds / number * 1e6 for seconds in timer.repeat(repeat=repeat, number=number))
+    return {
+        name: {
+            "min_us": round(min(samples[name]), 3),
+            "median_us": round(statistics.median(samples[name]), 3),
+            "loops": timers[name][1],
+        }
+        for name in names
+    }
+
+
+def compare(previous: dict, current: dict, threshold: float) -> List[str]:
+    """Imprime el cambio de cada benchmark y devuelve los que empeoran más de `threshold` %."""
+    print(f"\nvs {previous['meta'].get('commit')} ({previous['meta'].get('timestamp')}), umbral {threshold}%")
+    print(f"{'benchmark':>34} | {'before us':>10} | {'after us':>10} | {'change':>8}")
+    print("-" * 72)
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        before = previous["benchmarks"].get(name)
+        if before is None:
+            print(f"{name:>34} | {'-':>10} | {result['min_us']:>10} | {'new':>8}")
+            continue
+        change = (result["min_us"] - before["min_us"]) / before["min_us"] * 100
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        print(f"{name:>34} | {before['min_us']:>10} | {result['min_us']:>10} | {change:>+7.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", help="sólo los benchmarks cuyo nombre contiene este texto")
+    parser.add_argument("--rounds", type=int, default=5, help="rondas alternando los benchmarks")
+    parser.add_argument("--repeat", type=int, default=3, help="muestras de cada benchmark por ronda")
+    parser.add_argument("--output", type=Path, help=f"por defecto {DEFAULT_OUTPUT.name} (o {LATEST_OUTPUT.name} con --compare)")
+    parser.add_argument("--compare", type=Path, help="resultados anteriores con los que comparar")
+    parser.add_argument("--threshold", type=float, default=15.0, help="%% de empeoramiento que cuenta como regresión")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    previous = json.loads(args.compare.read_text()) if args.compare else None
+    # Comparar no sobrescribe la línea base
+    output = args.output or (LATEST_OUTPUT if args.compare else DEFAULT_OUTPUT)
+
+    print(f"{'benchmark':>34} | {'min us':>10} | {'median us':>10} | {'loops':>7}")
+    print("-" * 72)
+    names = [name for name in BENCHMARKS if not args.filter or args.filter in name]
+    results = run_benchmarks(names, args.rounds, args.repeat)
+    for name, result in results.items():
+        print(f"{name:>34} | {result['min_us']:>10} | {result['median_us']:>10} | {result['loops']:>7}")
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "rounds": args.rounds,
+            "repeat": args.repeat,
+        },
+        "benchmarks": results,
+    }
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print(f"\nResultados en {output}")
+
+    if previous is not None:
+        regressions = compare(previous, {"benchmarks": results}, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regresiones: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
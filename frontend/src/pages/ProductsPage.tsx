@@ -11,6 +11,7 @@ export function ProductsPage() {
     page: 1,
     per_page: 10,
     total_items: 0,
+    total_items_is_estimate: false,
     total_pages: 0,
   });
   const [filters, setFilters] = useState<ProductsQueryParams>({
@@ -32,6 +33,7 @@ export function ProductsPage() {
         page: response.page,
         per_page: response.per_page,
         total_items: response.total_items,
+        total_items_is_estimate: response.total_items_is_estimate,
         total_pages: response.total_pages,
       });
     } catch (err) {
@@ -91,15 +93,15 @@ export function ProductsPage() {
               htmlFor="name-filter"
               className="block text-sm font-medium text-gray-700 mb-1"
             >
-              Nombre
+              Buscar
             </label>
             <input
               id="name-filter"
               type="text"
-              value={filters.name || ""}
-              onChange={(e) => handleFilterChange("name", e.target.value)}
+              value={filters.search || ""}
+              onChange={(e) => handleFilterChange("search", e.target.value)}
               className="w-full px-3 py-2 border border-gray-300 rounded-md"
-              placeholder="Buscar por nombre..."
+              placeholder="Nombre, SKU o descripción..."
             />
           </div>
           <div>
@@ -262,7 +264,8 @@ export function ProductsPage() {
               pagination.page * pagination.per_page,
               pagination.total_items
             )}{" "}
-            de {pagination.total_items} productos
+            de {pagination.total_items_is_estimate ? "aprox. " : ""}
+            {pagination.total_items} productos
           </div>
           <div className="flex gap-2">
             <button
@@ -43,18 +43,24 @@ export interface ProductsResponse {
   page: number;
   per_page: number;
   total_items: number;
+  total_items_is_estimate: boolean;
   total_pages: number;
+  next_cursor: string | null;
 }
 
 export interface ProductsQueryParams {
   page?: number;
   per_page?: number;
   name?: string;
+  search?: string;
   category_id?: number;
   available?: boolean;
   discontinued?: boolean;
   min_price?: number;
   max_price?: number;
+  cursor?: string;
+  sort_by?: "id" | "name" | "price" | "created_at";
+  sort_order?: "asc" | "desc";
 }
 
 export interface Category {
@@ -39,3 +39,120 @@ def client(mock_db_session):
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def sqlite_url(tmp_path):
+    # File-based so that the sync and the async (aiosqlite) engines see the same data
+    return f"sqlite:///{tmp_path / 'test.db'}"
+
+
+@pytest.fixture
+def sqlite_session(sqlite_url):
+    # SQLite database with the real schema, for handlers that build SQL queries
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from asisya_api.core.database import Base
+    import asisya_api.domain  # noqa: F401  (registers every table in Base.metadata)
+
+    from asisya_api.crosscutting.query_profiler import install_query_profiler
+
+    engine = create_engine(sqlite_url, connect_args={"check_same_thread": False})
+    install_query_profiler(engine)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def sqlite_async_session_factory(sqlite_url, sqlite_session):
+    # Async sessions over the same database as `sqlite_session`. NullPool: every
+    # test request runs in its own event loop (asyncio.run), connections must not outlive it
+    import asyncio
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+    from asisya_api.core.database import async_database_url
+
+    from asisya_api.crosscutting.query_profiler import install_query_profiler
+
+    engine = create_async_engine(async_database_url(sqlite_url), poolclass=NullPool)
+    install_query_profiler(engine)
+    yield async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def run_in_unit_of_work(sqlite_session, sqlite_async_session_factory):
+    # Runs `make_coroutine()` inside an async unit of work over the SQLite test database,
+    # so handlers can be built (their repositories bind to the unit of work) and awaited
+    import asyncio
+    from asisya_api.core.unit_of_work import async_unit_of_work
+
+    def run(make_coroutine):
+        async def main():
+            async with async_unit_of_work(lambda: sqlite_session, sqlite_async_session_factory):
+                return await make_coroutine()
+
+        return asyncio.run(main())
+
+    return run
+
+
+@pytest.fixture
+def max_queries():
+    # `with max_queries(n): ...` fails the test if the block runs more than n SQL statements on the
+    # test engines: handlers, run_in_unit_of_work and TestClient requests (the context reaches the app)
+    from contextlib import contextmanager
+    from asisya_api.crosscutting.query_profiler import profile_queries
+
+    @contextmanager
+    def check(limit):
+        with profile_queries() as profile:
+            yield profile
+        assert profile.statements <= limit, f"expected at most {limit} queries, got {profile.report()}"
+
+    return check
+
+
+def _postgres_schema_session():
+    # Real PostgreSQL (COPY, planner, indexes). Only runs when TEST_POSTGRES_URL is set;
+    # the session works in its own throwaway schema so the target database is left untouched
+    import os
+    import uuid
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import sessionmaker
+    from asisya_api.core.database import Base
+    from asisya_api.crosscutting.query_profiler import install_query_profiler
+    import asisya_api.domain  # noqa: F401  (registers every table in Base.metadata)
+
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+
+    schema = f"pytest_{uuid.uuid4().hex[:12]}"
+    admin_engine = create_engine(url)
+    with admin_engine.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(url, connect_args={"options": f"-csearch_path={schema}"})
+    install_query_profiler(engine)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+    with admin_engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+    admin_engine.dispose()
+
+
+@pytest.fixture
+def postgres_session():
+    yield from _postgres_schema_session()
+
+
+@pytest.fixture(scope="module")
+def postgres_module_session():
+    # Same as postgres_session, shared by the tests of a module (large datasets seeded once)
+    yield from _postgres_schema_session()
@@ -1,10 +1,13 @@
+import asyncio
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from asisya_api.core.database import get_db
-from asisya_api.core.base_repository import BaseRepository
+from asisya_api.core.unit_of_work import unit_of_work
+from asisya_api.core.base_repository import AsyncBaseRepository, BaseRepository
 from typing import Type, TypeVar
 
 T = TypeVar('T')
@@ -104,9 +107,15 @@ def test_delete(base_repository, db_session):
 
 
 def test_refresh_db(base_repository):
-    with patch('asisya_api.core.base_repository.get_db', return_value=iter([MagicMock()])):
+    session = MagicMock()
+    with unit_of_work(lambda: session):
         base_repository.refresh_db()
-        assert base_repository.db is not None
+        assert base_repository.db is session
+
+
+def test_refresh_db_without_unit_of_work_keeps_session(base_repository, db_session):
+    base_repository.refresh_db()
+    assert base_repository.db is db_session
 
 
 def test_parse_integrity_error(base_repository):
@@ -115,3 +124,30 @@ def test_parse_integrity_error(base_repository):
 
     parsed_message = base_repository._parse_integrity_error(integrity_error)
     assert parsed_message == "Duplicate entry for column in table. Please choose a different value."
+
+
+def test_async_get_and_get_all(sqlite_session, sqlite_async_session_factory):
+    from asisya_api.domain.category import CategoryEntity
+
+    sqlite_session.add_all([CategoryEntity(name="A", slug="a"), CategoryEntity(name="B", slug="b")])
+    sqlite_session.commit()
+
+    async def run():
+        async with sqlite_async_session_factory() as db:
+            repository = AsyncBaseRepository(CategoryEntity, db)
+            return await repository.get(2), await repository.get_all()
+
+    category, categories = asyncio.run(run())
+    assert category.name == "B"
+    assert [c.slug for c in categories] == ["a", "b"]
+
+
+def test_async_create_integrity_error():
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    db.commit.side_effect = IntegrityError("mock", "params", "UNIQUE constraint failed: table.column")
+    repository = AsyncBaseRepository(MockModel, db)
+
+    with pytest.raises(ValueError, match="Duplicate entry for column in table"):
+        asyncio.run(repository.create(MockModel(name="Test")))
+    db.rollback.assert_awaited_once()
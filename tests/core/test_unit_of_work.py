@@ -0,0 +1,132 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from asisya_api.core.database import async_database_url, get_db
+from asisya_api.core.unit_of_work import (
+    UnitOfWorkMiddleware,
+    async_unit_of_work,
+    current_async_session,
+    current_session,
+    get_current_unit_of_work,
+    unit_of_work,
+)
+
+
+@pytest.fixture
+def sessions():
+    return []
+
+
+@pytest.fixture
+def session_factory(sessions):
+    def factory():
+        session = MagicMock(spec=Session)
+        sessions.append(session)
+        return session
+    return factory
+
+
+@pytest.fixture
+def async_sessions():
+    return []
+
+
+@pytest.fixture
+def async_session_factory(async_sessions):
+    def factory():
+        session = AsyncMock(spec=AsyncSession)
+        async_sessions.append(session)
+        return session
+    return factory
+
+
+@pytest.fixture
+def client(session_factory, async_session_factory):
+    app = FastAPI()
+    app.add_middleware(
+        UnitOfWorkMiddleware, session_factory=session_factory, async_session_factory=async_session_factory
+    )
+
+    @app.get("/db")
+    def read_db(db=Depends(get_db)):
+        return {"same_session": db is current_session()}
+
+    @app.get("/async-db")
+    async def read_async_db():
+        return {"same_session": current_async_session() is current_async_session()}
+
+    @app.get("/no-db")
+    async def no_db():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_session_is_lazy_and_closed_on_exit(session_factory, sessions):
+    with unit_of_work(session_factory) as uow:
+        assert sessions == []
+        assert current_session() is uow.session
+        assert len(sessions) == 1
+    sessions[0].close.assert_called_once()
+    assert get_current_unit_of_work() is None
+
+
+def test_nested_unit_of_work_reuses_outer_session(session_factory, sessions):
+    with unit_of_work(session_factory) as outer:
+        with unit_of_work(session_factory) as inner:
+            assert inner is outer
+            inner.session
+        sessions[0].close.assert_not_called()
+    sessions[0].close.assert_called_once()
+
+
+def test_current_session_outside_unit_of_work_fails():
+    with pytest.raises(RuntimeError):
+        current_session()
+
+
+def test_middleware_opens_one_session_per_request(client, sessions):
+    assert client.get("/db").json() == {"same_session": True}
+    assert client.get("/db").json() == {"same_session": True}
+
+    assert len(sessions) == 2
+    for session in sessions:
+        session.close.assert_called_once()
+
+
+def test_middleware_does_not_open_sessions_for_requests_without_db(client, sessions):
+    assert client.get("/no-db").status_code == 200
+    assert sessions == []
+
+
+def test_middleware_closes_async_sessions(client, sessions, async_sessions):
+    assert client.get("/async-db").json() == {"same_session": True}
+
+    assert sessions == []
+    assert len(async_sessions) == 1
+    async_sessions[0].close.assert_awaited_once()
+
+
+def test_async_unit_of_work_closes_both_sessions(session_factory, sessions, async_session_factory, async_sessions):
+    async def run():
+        async with async_unit_of_work(session_factory, async_session_factory) as uow:
+            assert current_async_session() is uow.async_session
+            assert current_session() is uow.session
+
+    asyncio.run(run())
+    sessions[0].close.assert_called_once()
+    async_sessions[0].close.assert_awaited_once()
+    assert get_current_unit_of_work() is None
+
+
+def test_async_database_url():
+    assert async_database_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert async_database_url("sqlite:///./qna.db") == "sqlite+aiosqlite:///./qna.db"
+    with pytest.raises(ValueError):
+        async_database_url("mysql://u:p@db/app")
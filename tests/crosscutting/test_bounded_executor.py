@@ -0,0 +1,37 @@
+import asyncio
+import threading
+
+import pytest
+
+from asisya_api.crosscutting.bounded_executor import BoundedExecutor, ExecutorSaturatedError
+
+
+def test_run_executes_off_the_event_loop_thread():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+    loop_thread = threading.get_ident()
+
+    worker_thread = asyncio.run(executor.run(threading.get_ident))
+
+    assert worker_thread != loop_thread
+    assert executor.stats()["completed"] == 1
+    executor.shutdown()
+
+
+def test_rejects_work_beyond_workers_plus_queue():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(release.wait)
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        # Con los trabajos terminados vuelve a haber hueco
+        assert await executor.run(lambda: "ok") == "ok"
+
+    asyncio.run(scenario())
+    assert executor.stats()["rejected"] == 1
+    assert executor.stats()["in_flight"] == 0
+    executor.shutdown()
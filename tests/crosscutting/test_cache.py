@@ -0,0 +1,178 @@
+from unittest.mock import patch
+
+from asisya_api.crosscutting.cache import TTLCache
+
+
+def test_get_and_set():
+    cache = TTLCache(max_size=10, ttl_seconds=30)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(max_size=10, ttl_seconds=5)
+    with patch("asisya_api.crosscutting.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("asisya_api.crosscutting.cache.time.monotonic", return_value=104.0):
+        assert cache.get("a") == 1
+    with patch("asisya_api.crosscutting.cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_size=2, ttl_seconds=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_invalidate_and_clear():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("b") is None
+
+
+def _read_through(backend=None, ttl_seconds=30):
+    from asisya_api.crosscutting.cache import LocalCacheBackend, ReadThroughCache
+
+    return ReadThroughCache("test", backend or LocalCacheBackend(), ttl_seconds=ttl_seconds)
+
+
+def _counting_loader(value, calls, delay=0):
+    import asyncio
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return value
+
+    return load
+
+
+def test_read_through_loads_once_and_serves_from_cache():
+    import asyncio
+
+    cache = _read_through()
+    calls = []
+
+    async def main():
+        first = await cache.get_or_load("k", _counting_loader({"a": 1}, calls))
+        second = await cache.get_or_load("k", _counting_loader({"a": 2}, calls))
+        return first, second
+
+    assert asyncio.run(main()) == ({"a": 1}, {"a": 1})
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_read_through_concurrent_misses_share_one_load():
+    import asyncio
+
+    cache = _read_through()
+    calls = []
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_load("k", _counting_loader([1], calls, delay=0.01)) for _ in range(5)))
+
+    assert asyncio.run(main()) == [[1]] * 5
+    assert len(calls) == 1
+
+
+def test_read_through_invalidate_discards_entry_and_in_flight_load():
+    import asyncio
+
+    cache = _read_through()
+    calls = []
+
+    async def main():
+        await cache.get_or_load("k", _counting_loader(1, calls))
+        cache.invalidate("k")
+        # La carga empezada antes de invalidar no debe guardarse
+        load = asyncio.ensure_future(cache.get_or_load("k", _counting_loader(2, calls, delay=0.01)))
+        await asyncio.sleep(0)
+        cache.invalidate("k")
+        await load
+        return await cache.get_or_load("k", _counting_loader(3, calls))
+
+    assert asyncio.run(main()) == 3
+    assert len(calls) == 3
+    assert cache.invalidations == 2
+
+
+def test_read_through_falls_back_to_loader_when_backend_fails():
+    import asyncio
+    from asisya_api.crosscutting.cache import CacheBackend
+
+    class BrokenBackend(CacheBackend):
+        def get(self, key):
+            raise ConnectionError("down")
+
+    cache = _read_through(BrokenBackend())
+    calls = []
+    assert asyncio.run(cache.get_or_load("k", _counting_loader("v", calls))) == "v"
+    assert cache.errors == 1
+    assert cache.stats()["backend"] == "BrokenBackend"
+
+
+def test_redis_backend_stores_encoded_values_with_ttl():
+    import asyncio
+    from asisya_api.crosscutting.cache import RedisCacheBackend
+    from asisya_api.infrastructure.in_memory_redis import InMemoryRedisClient
+
+    client = InMemoryRedisClient()
+    cache = _read_through(RedisCacheBackend(client), ttl_seconds=60)
+    calls = []
+
+    async def main():
+        await cache.get_or_load(1, _counting_loader({"id": 1}, calls))
+        return await cache.get_or_load(1, _counting_loader({"id": 1}, calls))
+
+    assert asyncio.run(main()) == {"id": 1}
+    assert client.get("test:1") == b'{"id":1}'
+    assert 0 < client.ttl("test:1") <= 60
+    assert len(calls) == 1
+
+    cache.invalidate(1)
+    assert client.exists("test:1") == 0
+
+
+def test_invalidate_async_deletes_off_the_event_loop():
+    import asyncio
+    import threading
+    from asisya_api.crosscutting.cache import RedisCacheBackend
+    from asisya_api.infrastructure.in_memory_redis import InMemoryRedisClient
+
+    class RecordingRedisClient(InMemoryRedisClient):
+        delete_threads = []
+
+        def delete(self, *keys):
+            self.delete_threads.append(threading.get_ident())
+            return super().delete(*keys)
+
+    client = RecordingRedisClient()
+    cache = _read_through(RedisCacheBackend(client))
+    calls = []
+
+    async def main():
+        await cache.get_or_load(1, _counting_loader({"id": 1}, calls))
+        await cache.invalidate_async(1)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+    assert client.exists("test:1") == 0
+    assert cache.invalidations == 1
+    assert client.delete_threads and loop_thread not in client.delete_threads
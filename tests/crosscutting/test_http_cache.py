@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from asisya_api.crosscutting.http_cache import compute_etag, etag_matches
+from asisya_api.features.categories.models import CategoryResponseDTO
+
+
+def _category(**changes):
+    data = dict(id=1, name="Beverages", slug="beverages", description=None, picture_url=None,
+                created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1))
+    data.update(changes)
+    return CategoryResponseDTO(**data)
+
+
+def test_etag_is_stable_and_changes_with_content():
+    etag = compute_etag([_category()])
+    assert etag == compute_etag([_category()])
+    assert etag.startswith('"') and etag.endswith('"')
+    assert compute_etag([_category(description="Drinks")]) != etag
+    assert compute_etag([_category(updated_at=datetime(2024, 1, 1, 0, 0, 0, 1))]) != etag
+
+
+def test_if_none_match_comparison():
+    etag = '"abc"'
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"x", "abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"abcd"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from mediatr import Mediator
+from sqlalchemy import create_engine, text
+
+from asisya_api.crosscutting import metrics
+from asisya_api.crosscutting.metrics import Histogram, MetricsMiddleware
+
+
+class SlowQuery:
+    pass
+
+
+@Mediator.handler
+class SlowQueryHandler:
+    async def handle(self, request: SlowQuery):
+        await asyncio.sleep(0.01)
+        return "done"
+
+
+class FailingCommand:
+    pass
+
+
+@Mediator.handler
+class FailingCommandHandler:
+    def handle(self, request: FailingCommand):
+        raise ValueError("boom")
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    for histogram in metrics.REGISTRY:
+        histogram.clear()
+    yield
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("test_seconds", "Test.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(5, "/a")
+
+    lines = histogram.render()
+
+    assert 'test_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'test_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'test_seconds_sum{route="/a"} 5.15' in lines
+    assert 'test_seconds_count{route="/a"} 3' in lines
+
+
+def test_behavior_times_async_and_sync_handlers():
+    assert asyncio.run(Mediator().send_async(SlowQuery())) == "done"
+    with pytest.raises(ValueError):
+        Mediator().send(FailingCommand())
+
+    series = metrics.handler_duration.series()
+    _, total, count = series[("SlowQueryHandler", "success")]
+    assert count == 1 and total >= 0.01
+    assert series[("FailingCommandHandler", "error")][2] == 1
+
+
+def test_middleware_records_route_template_and_db_time(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as connection:
+            return {"id": connection.execute(text("SELECT :id"), {"id": item_id}).scalar()}
+
+    client = TestClient(app)
+    assert client.get("/items/1").status_code == 200
+    assert client.get("/items/2").status_code == 200
+    assert client.get("/missing").status_code == 404
+
+    durations = metrics.http_request_duration.series()
+    assert durations[("GET", "/items/{item_id}", "200")][2] == 2
+    assert durations[("GET", "unmatched", "404")][2] == 1
+    _, db_seconds, _ = metrics.http_request_db_duration.series()[("GET", "/items/{item_id}")]
+    assert db_seconds > 0
+    assert metrics.http_request_db_duration.series()[("GET", "unmatched")][1] == 0
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    from asisya_api.main import app
+
+    client = TestClient(app)
+    client.get("/")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/",status="307"} 1' in response.text
@@ -0,0 +1,67 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from asisya_api.core.config import settings
+from asisya_api.crosscutting.authorization import get_authenticated_user
+from asisya_api.crosscutting.query_profiler import profile_queries
+from asisya_api.domain.category import CategoryEntity
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.categories.cache import invalidate_categories
+from asisya_api.features.user.models import User
+from asisya_api.main import create_app
+
+
+@pytest.fixture
+def catalog(sqlite_session):
+    for index in range(3):
+        category = CategoryEntity(name=f"Category {index}", slug=f"category-{index}")
+        category.products = [
+            ProductEntity(name=f"Product {index}-{n}", sku=f"SKU-{index}-{n}", price=n + 1) for n in range(2)
+        ]
+        sqlite_session.add(category)
+    sqlite_session.commit()
+    sqlite_session.expunge_all()
+    return sqlite_session
+
+
+@pytest.fixture
+def client(catalog, sqlite_async_session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "query_profiler_enabled", True)
+    app = create_app(session_factory=lambda: catalog, async_session_factory=sqlite_async_session_factory)
+    user = User(id=1, username="testuser", full_name="Test User", email="testuser@example.com", roles=["user"])
+    app.dependency_overrides[get_authenticated_user] = lambda: user
+    invalidate_categories()
+    with TestClient(app) as client:
+        yield client
+
+
+def test_lazy_loads_are_flagged_as_repeated(catalog):
+    with profile_queries() as profile:
+        categories = catalog.scalars(select(CategoryEntity)).all()
+        assert sum(len(category.products) for category in categories) == 6
+
+    # 1 consulta de categorías + 1 carga perezosa de `products` por categoría (N+1)
+    assert profile.statements == 4
+    [(sql, stats)] = profile.repeated()
+    assert stats.count == 3 and "FROM products" in sql
+    assert "3x" in profile.report()
+
+
+def test_profile_header_adds_query_stats(client):
+    response = client.get("/categories/", headers={"X-Query-Profile": "1"})
+
+    assert response.status_code == 200
+    assert int(response.headers["X-Query-Count"]) >= 1
+    assert float(response.headers["X-Query-Time-Ms"]) >= 0
+    assert response.headers["X-Query-Repeated"] == "0"
+    assert "X-Query-Count" not in client.get("/categories/").headers
+
+
+def test_listing_endpoints_query_budget(client, max_queries):
+    with max_queries(1):
+        assert len(client.get("/categories/").json()) == 3
+    with max_queries(0):
+        client.get("/categories/")  # servido desde la caché
+    with max_queries(2):
+        assert client.get("/products/?per_page=4").json()["total_items"] == 6
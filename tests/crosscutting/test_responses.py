@@ -0,0 +1,22 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+
+from asisya_api.crosscutting.responses import FastJSONResponse
+from asisya_api.features.categories.models import CategoryResponseDTO
+
+
+def test_output_matches_jsonable_encoder():
+    content = {
+        "items": [
+            {"id": 1, "price": 10.5, "created_at": datetime(2024, 1, 2, 3, 4, 5, 678)},
+            {"id": 2, "price": Decimal("3"), "created_at": datetime(2024, 1, 2)},
+        ],
+        "total": Decimal("2.50"),
+        "categories": [CategoryResponseDTO(1, "Tea", "tea", None, None, datetime(2024, 1, 1), datetime(2024, 1, 1))],
+        "next_cursor": None,
+    }
+    assert json.loads(FastJSONResponse(content).body) == jsonable_encoder(content)
+    assert FastJSONResponse(content).media_type == "application/json"
@@ -1,8 +1,10 @@
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import timedelta
 from jose import jwt
-from asisya_api.features.auth.auth_service import AuthService
+from asisya_api.features.auth.auth_service import AuthService, password_executor
 from asisya_api.domain.user import UserEntity
 from asisya_api.core.config import settings
 
@@ -62,3 +64,20 @@ def test_verify_password(auth_service):
     password = "password123"
     hashed_password = auth_service.get_password_hash(password)
     assert auth_service._verify_password(password, hashed_password)  # Ensure the password verifies correctly
+
+
+def test_authenticate_user_async_runs_in_password_executor(auth_service):
+    mock_user = MagicMock(spec=UserEntity)
+    auth_service.user_repo.get_by_username.return_value = mock_user
+    completed = password_executor.completed
+
+    with patch('passlib.context.CryptContext.verify', return_value=True):
+        result = asyncio.run(auth_service.authenticate_user_async("testuser", "password"))
+
+    assert result is mock_user
+    assert password_executor.completed == completed + 1
+
+
+def test_get_password_hash_async():
+    hashed_password = asyncio.run(AuthService.get_password_hash_async("password123"))
+    assert AuthService(MagicMock())._verify_password("password123", hashed_password)
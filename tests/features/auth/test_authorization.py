@@ -1,9 +1,17 @@
+from unittest.mock import MagicMock, patch
+
 import pytest
-from fastapi import Depends
+from fastapi import Depends, HTTPException
 from fastapi.testclient import TestClient
 from jose import jwt
 from datetime import datetime, timedelta, timezone
-from asisya_api.crosscutting.authorization import get_admin_user, get_authenticated_user
+from asisya_api.crosscutting.authorization import (
+    authenticated_user_cache,
+    get_admin_user,
+    get_authenticated_user,
+    invalidate_authenticated_user,
+)
+from asisya_api.features.admin.commands.enable_user_command import EnableUserCommand, EnableUserCommandHandler
 from asisya_api.main import app
 from asisya_api.core.config import settings
 from asisya_api.features.user.repository import UserRepository
@@ -111,3 +119,63 @@ def some_protected_route(current_user: UserEntity = Depends(get_authenticated_us
 @app.get("/some_admin_only_route")
 def some_protected_route(current_user: UserEntity = Depends(get_admin_user)):
     return {"username": current_user.username}
+
+
+class CountingUserRepository(FakeUserRepository):
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    def get_by_username(self, username: str) -> UserEntity | None:
+        self.lookups += 1
+        return super().get_by_username(username)
+
+
+@pytest.fixture
+def counting_repo():
+    authenticated_user_cache.clear()
+    yield CountingUserRepository()
+    authenticated_user_cache.clear()
+
+
+def test_authenticated_user_is_cached(counting_repo, authenticated_user_token):
+    first = get_authenticated_user(authenticated_user_token, counting_repo)
+    second = get_authenticated_user(authenticated_user_token, counting_repo)
+
+    assert counting_repo.lookups == 1
+    assert second is not first
+    assert (second.id, second.username, second.roles) == (1, "testuser", "user")
+
+
+def test_invalidated_user_is_reloaded(counting_repo, authenticated_user_token):
+    get_authenticated_user(authenticated_user_token, counting_repo)
+    counting_repo.users["testuser"].disabled = True
+    invalidate_authenticated_user("testuser")
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_authenticated_user(authenticated_user_token, counting_repo)
+    assert exc_info.value.status_code == 403
+    assert counting_repo.lookups == 2
+
+
+def test_unknown_users_are_not_cached(counting_repo):
+    token = jwt.encode(
+        {"sub": "ghost", "exp": datetime.now(timezone.utc) + timedelta(minutes=15)},
+        settings.secret_key, algorithm=settings.algorithm,
+    )
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            get_authenticated_user(token, counting_repo)
+    assert counting_repo.lookups == 2
+
+
+def test_enable_user_command_invalidates_cached_user(counting_repo, authenticated_user_token):
+    get_authenticated_user(authenticated_user_token, counting_repo)
+    disabled_user = UserEntity(id=1, username="testuser", disabled=True, roles="user")
+    repository = MagicMock()
+    repository.get.return_value = disabled_user
+
+    with patch.object(UserRepository, "instance", return_value=repository):
+        EnableUserCommandHandler().handle(EnableUserCommand(1))
+
+    assert authenticated_user_cache.get("testuser") is None
@@ -1,10 +1,11 @@
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from datetime import timedelta  # Add this import
 from asisya_api.main import app
 from asisya_api.features.auth.auth_service import AuthService
 from asisya_api.features.auth.controller import AuthController
+from asisya_api.crosscutting.bounded_executor import ExecutorSaturatedError
 from asisya_api.core.config import settings  # Make sure to import settings
 
 
@@ -29,7 +30,7 @@ def auth_controller(auth_service):
     return controller
 
 
-@patch.object(AuthService, 'authenticate_user')
+@patch.object(AuthService, 'authenticate_user_async', new_callable=AsyncMock)
 @patch.object(AuthService, 'create_access_token')
 def test_authenticate_success(mock_create_access_token, mock_authenticate_user, client, auth_service, auth_controller):
     # Mock the methods of the service
@@ -54,13 +55,13 @@ def test_authenticate_success(mock_create_access_token, mock_authenticate_user,
     assert response.json() == {"access_token": "testtoken", "token_type": "bearer"}
 
     # Ensure that the mock methods were called as expected
-    mock_authenticate_user.assert_called_once_with("testuser", "testpassword")
+    mock_authenticate_user.assert_awaited_once_with("testuser", "testpassword")
     mock_create_access_token.assert_called_once_with(data={"sub": "testuser", "roles": ["user"]},
                                                      expires_delta=timedelta(
                                                          minutes=settings.access_token_expire_minutes))
 
 
-@patch.object(AuthService, 'authenticate_user')
+@patch.object(AuthService, 'authenticate_user_async', new_callable=AsyncMock)
 def test_authenticate_failure(mock_authenticate_user, client, auth_service, auth_controller):
     # Mock the authentication method to return None
     mock_authenticate_user.return_value = None
@@ -83,4 +84,14 @@ def test_authenticate_failure(mock_authenticate_user, client, auth_service, auth
     assert response.json() == {"detail": "Incorrect username or password"}
 
     # Ensure that the mock method was called as expected
-    mock_authenticate_user.assert_called_once_with("testuser", "wrongpassword")
+    mock_authenticate_user.assert_awaited_once_with("testuser", "wrongpassword")
+
+
+@patch.object(AuthService, 'authenticate_user_async', new_callable=AsyncMock)
+def test_authenticate_returns_429_when_password_pool_is_saturated(mock_authenticate_user, client):
+    mock_authenticate_user.side_effect = ExecutorSaturatedError("password-hash")
+
+    response = client.post("/auth/token", data={"username": "testuser", "password": "testpassword"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import event
+
+from asisya_api.domain.category import CategoryEntity
+from asisya_api.features.categories.cache import invalidate_categories
+from asisya_api.features.categories.commands.create_category_command import (
+    CreateCategoryCommand,
+    CreateCategoryCommandHandler,
+)
+from asisya_api.features.categories.models import CategoryCreateDTO
+from asisya_api.features.categories.queries.get_all_categories_query import (
+    GetAllCategoriesQuery,
+    GetAllCategoriesQueryHandler,
+)
+from asisya_api.features.categories.queries.get_category_by_id_query import (
+    GetCategoryByIdQuery,
+    GetCategoryByIdQueryHandler,
+)
+from asisya_api.features.user.models import User
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    # La caché es global al proceso: cada test empieza sin categorías cacheadas
+    invalidate_categories(1, 2)
+    yield
+
+
+@pytest.fixture
+def categories(sqlite_session, sqlite_async_session_factory):
+    sqlite_session.add(CategoryEntity(name="Beverages", slug="beverages"))
+    sqlite_session.commit()
+    # Cuenta las consultas que llegan a la base de datos async
+    statements = []
+    engine = sqlite_async_session_factory.kw["bind"].sync_engine
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_categories_are_served_from_cache(run_in_unit_of_work, categories):
+    first = run_in_unit_of_work(lambda: GetAllCategoriesQueryHandler().handle(GetAllCategoriesQuery()))
+    queries = len(categories)
+    second = run_in_unit_of_work(lambda: GetAllCategoriesQueryHandler().handle(GetAllCategoriesQuery()))
+
+    assert [c.name for c in second] == [c.name for c in first] == ["Beverages"]
+    assert second[0].created_at == first[0].created_at
+    assert len(categories) == queries
+
+
+def test_category_by_id_is_cached_and_not_found_is_not(run_in_unit_of_work, categories):
+    category = run_in_unit_of_work(lambda: GetCategoryByIdQueryHandler().handle(GetCategoryByIdQuery(1)))
+    assert category.slug == "beverages"
+    queries = len(categories)
+    run_in_unit_of_work(lambda: GetCategoryByIdQueryHandler().handle(GetCategoryByIdQuery(1)))
+    assert len(categories) == queries
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            run_in_unit_of_work(lambda: GetCategoryByIdQueryHandler().handle(GetCategoryByIdQuery(2)))
+    assert len(categories) > queries + 1
+
+
+def test_create_invalidates_listing(run_in_unit_of_work, categories):
+    run_in_unit_of_work(lambda: GetAllCategoriesQueryHandler().handle(GetAllCategoriesQuery()))
+
+    user = User(id=1, username="admin", full_name="Admin", email="admin@example.com", roles=["admin"])
+    run_in_unit_of_work(lambda: CreateCategoryCommandHandler().handle(
+        CreateCategoryCommand(CategoryCreateDTO(name="Condiments", slug="condiments"), None, user)
+    ))
+
+    listing = run_in_unit_of_work(lambda: GetAllCategoriesQueryHandler().handle(GetAllCategoriesQuery()))
+    assert [c.name for c in listing] == ["Beverages", "Condiments"]
+
+
+def test_cache_stats_query_reports_registered_caches(run_in_unit_of_work, categories):
+    from asisya_api.features.admin.queries.get_cache_stats_query import GetCacheStatsQuery, GetCacheStatsQueryHandler
+
+    before = GetCacheStatsQueryHandler().handle(GetCacheStatsQuery())["categories"]
+    for _ in range(2):
+        run_in_unit_of_work(lambda: GetAllCategoriesQueryHandler().handle(GetAllCategoriesQuery()))
+    stats = GetCacheStatsQueryHandler().handle(GetCacheStatsQuery())
+
+    assert {"categories", "product_counts", "authenticated_users"} <= set(stats)
+    assert stats["categories"]["hits"] == before["hits"] + 1
+    assert stats["categories"]["misses"] == before["misses"] + 1
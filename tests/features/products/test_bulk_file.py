@@ -0,0 +1,157 @@
+import io
+import json
+import tracemalloc
+
+import pytest
+from sqlalchemy import select
+
+from asisya_api.domain.import_job import ImportJobEntity, ImportJobErrorEntity
+from asisya_api.features.products.bulk_file import CSV, NDJSON, BulkFileReader, detect_format
+from asisya_api.features.products.commands.create_bulk_products_from_file_command import (
+    CreateBulkProductsFromFileCommand,
+    CreateBulkProductsFromFileCommandHandler,
+)
+from asisya_api.infrastructure.in_memory_sqs import InMemorySqsClient
+from asisya_api.infrastructure.sqs_batch_sender import SqsBatchSender
+
+QUEUE_URL = "memory://bulk-products"
+
+
+class User:
+    id = 7
+
+
+class DiscardingSqsClient(InMemorySqsClient):
+    """Cuenta los mensajes sin guardarlos (para medir la memoria del lado de la API)."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = 0
+
+    def send_message_batch(self, QueueUrl, Entries, **kwargs):
+        self.sent += len(Entries)
+        return {"Successful": [{"Id": entry["Id"], "MessageId": entry["Id"]} for entry in Entries], "Failed": []}
+
+
+def _csv(rows):
+    lines = ["name,sku,price,stock,category_id"]
+    lines += [f"Product {i},SKU-{i},{i}.5,{i % 10}," for i in range(rows)]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _upload(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+def _handle(run_in_unit_of_work, client, path, **kwargs):
+    sender = SqsBatchSender(client, QUEUE_URL, max_workers=2)
+    with open(path, "rb") as file:
+        command = CreateBulkProductsFromFileCommand(file, path.name, None, User(), **kwargs)
+        return run_in_unit_of_work(lambda: CreateBulkProductsFromFileCommandHandler(sender=sender).handle(command))
+
+
+def test_detect_format():
+    assert detect_format("feed.CSV", None) == CSV
+    assert detect_format("feed", "application/x-ndjson; charset=utf-8") == NDJSON
+    with pytest.raises(ValueError):
+        detect_format("feed.xlsx", "application/octet-stream")
+
+
+def test_csv_reader_validates_rows_incrementally():
+    content = b"\xef\xbb\xbfname,price,stock,description\nTea,1.5,3,\n,2,1,missing name\nCoffee,abc,1,\nCake,4,2,Sweet\n"
+    reader = BulkFileReader(io.BytesIO(content), CSV)
+
+    assert [p["name"] for p in reader.read_valid(1)] == ["Tea"]
+    assert [p["name"] for p in reader.read_valid(10)] == ["Cake"]
+    assert reader.read_valid(10) == []
+
+    assert reader.accepted == 2 and reader.rejected == 2
+    assert [error["line"] for error in reader.errors] == [3, 4]
+    assert "price" in reader.errors[1]["error"]
+
+
+def test_ndjson_reader_reports_bad_lines():
+    content = b'{"name": "Tea", "price": 1, "stock": 2}\n\nnot json\n[1, 2]\n{"name": "Cake", "price": 2, "stock": 1}\n'
+    reader = BulkFileReader(io.BytesIO(content), NDJSON)
+
+    assert [p["name"] for p in reader.read_valid(10)] == ["Tea", "Cake"]
+    assert [error["line"] for error in reader.errors] == [3, 4]
+
+
+def test_ndjson_reader_rejects_over_long_lines_without_loading_them():
+    long_line = b'{"name": "' + b"x" * (8 * 1024 * 1024) + b'", "price": 1}'
+    content = long_line + b'\n{"name": "Tea", "price": 2, "stock": 1}\n' + b"y" * (4 * 1024 * 1024)
+    reader = BulkFileReader(io.BytesIO(content), NDJSON, max_line_bytes=1024)
+
+    tracemalloc.start()
+    try:
+        products = reader.read_valid(10)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert [p["name"] for p in products] == ["Tea"]
+    assert reader.rejected == 2
+    assert [error["line"] for error in reader.errors] == [1, 3]
+    assert "longer than 1024 bytes" in reader.errors[0]["error"]
+    assert peak < 256 * 1024
+
+
+def test_handler_enqueues_file_in_batches(tmp_path, run_in_unit_of_work):
+    client = InMemorySqsClient()
+    path = _upload(tmp_path, "feed.csv", _csv(450))
+    result = _handle(run_in_unit_of_work, client, path, on_conflict="update", batch_size=100)
+
+    messages = [json.loads(body) for body in client.messages(QUEUE_URL)]
+    assert result["accepted"] == 450 and result["rejected"] == 0
+    assert result["messages"] == len(messages) == 5
+    assert {(m["job_id"], m["on_conflict"], m["user_id"]) for m in messages} == {(result["job_id"], "update", 7)}
+    assert sorted(p["name"] for m in messages for p in m["products"]) == sorted(f"Product {i}" for i in range(450))
+
+
+def test_handler_records_job_totals_and_rejected_lines(tmp_path, run_in_unit_of_work, sqlite_session):
+    content = _csv(250) + b"Broken,SKU-X,not-a-price,1,\n"
+    result = _handle(run_in_unit_of_work, InMemorySqsClient(), _upload(tmp_path, "feed.csv", content), batch_size=100)
+
+    job = sqlite_session.get(ImportJobEntity, result["job_id"])
+    assert (job.source, job.status, job.user_id) == ("csv", "queued", 7)
+    assert (job.total_rows, job.rejected_rows, job.messages_total, job.error_count) == (250, 1, 3, 1)
+    error = sqlite_session.scalars(select(ImportJobErrorEntity)).one()
+    assert error.line == 252 and "price" in error.error
+
+
+def test_handler_marks_job_failed_when_the_file_breaks_midway(tmp_path, run_in_unit_of_work, sqlite_session):
+    client = InMemorySqsClient()
+    # Un byte que no es UTF-8 después del primer bloque de filas (batch_size * 40)
+    content = _csv(1000) + b"Broken \xff,SKU-X,1,1,\n"
+
+    with pytest.raises(UnicodeDecodeError):
+        _handle(run_in_unit_of_work, client, _upload(tmp_path, "feed.csv", content), batch_size=10)
+
+    job = sqlite_session.scalars(select(ImportJobEntity)).one()
+    assert job.status == "failed" and job.finished_at is not None
+    assert client.messages(QUEUE_URL)  # lo enviado antes del error sigue en la cola
+
+
+def _peak_memory(tmp_path, run_in_unit_of_work, rows):
+    path = _upload(tmp_path, f"feed-{rows}.csv", _csv(rows))
+    client = DiscardingSqsClient()
+    tracemalloc.start()
+    try:
+        result = _handle(run_in_unit_of_work, client, path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert result["accepted"] == rows
+    return peak
+
+
+def test_memory_stays_flat_regardless_of_file_size(tmp_path, run_in_unit_of_work):
+    small = _peak_memory(tmp_path, run_in_unit_of_work, 5_000)
+    large = _peak_memory(tmp_path, run_in_unit_of_work, 50_000)
+
+    # 10 veces más filas: el pico sólo depende del bloque que se encola de una vez
+    assert large < small * 1.5
+    assert large < 20 * 1024 * 1024
@@ -0,0 +1,136 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from mediatr import Mediator
+
+from asisya_api.crosscutting.authorization import get_authenticated_user
+from asisya_api.features.products.commands.create_bulk_products_from_file_command import (
+    CreateBulkProductsFromFileCommand,
+)
+from asisya_api.features.products.models import ImportJobResponseDTO
+from asisya_api.features.products.queries.get_import_job_errors_query import GetImportJobErrorsQuery
+from asisya_api.features.products.queries.get_import_job_query import GetImportJobQuery
+from asisya_api.features.user.models import User
+from asisya_api.infrastructure.sqs_batch_sender import QueueSendError
+from asisya_api.main import create_app
+
+
+@pytest.fixture
+def mediator():
+    return MagicMock(spec=Mediator)
+
+
+@pytest.fixture
+def client(mediator):
+    app = create_app(mediator=mediator)
+    user = User(id=1, username="testuser", full_name="Test User", email="testuser@example.com", roles=["user"])
+    app.dependency_overrides[get_authenticated_user] = lambda: user
+    with TestClient(app) as client:
+        yield client
+
+
+def test_bulk_file_upload_returns_job(client, mediator):
+    mediator.send_async.return_value = {"job_id": "abc", "accepted": 2, "rejected": 0, "messages": 1, "errors": []}
+
+    response = client.post(
+        "/products/bulk/file",
+        files={"file": ("feed.csv", b"name,price,stock\nTea,1,2\nCake,2,1\n", "text/csv")},
+        data={"on_conflict": "update", "batch_size": "50"},
+    )
+
+    assert response.status_code == 202
+    assert response.json()["job_id"] == "abc"
+    command = mediator.send_async.call_args.args[0]
+    assert isinstance(command, CreateBulkProductsFromFileCommand)
+    assert (command.filename, command.on_conflict, command.batch_size) == ("feed.csv", "update", 50)
+
+
+def test_bulk_file_upload_errors(client, mediator):
+    files = {"file": ("feed.xlsx", b"...", "application/octet-stream")}
+
+    mediator.send_async.side_effect = ValueError("Unsupported file format")
+    assert client.post("/products/bulk/file", files=files).status_code == 400
+
+    mediator.send_async.side_effect = QueueSendError(1, [{"Id": "0"}])
+    assert client.post("/products/bulk/file", files=files).status_code == 503
+
+
+def test_bulk_job_status(client, mediator):
+    mediator.send_async.return_value = None
+    assert client.get("/products/bulk/unknown").status_code == 404
+
+    now = datetime(2024, 1, 1)
+    mediator.send_async.return_value = ImportJobResponseDTO(
+        job_id="abc", status="processing", source="csv", on_conflict="update", total_rows=10, rejected_rows=0,
+        messages_total=2, messages_processed=1, progress=0.5, counts={"inserted": 5}, error_count=0,
+        created_at=now, updated_at=now, finished_at=None,
+    )
+    response = client.get("/products/bulk/abc")
+
+    assert response.status_code == 200
+    assert (response.json()["status"], response.json()["progress"]) == ("processing", 0.5)
+    query = mediator.send_async.call_args.args[0]
+    assert isinstance(query, GetImportJobQuery) and (query.job_id, query.user.id) == ("abc", 1)
+
+
+def test_bulk_job_error_report_download(client, mediator):
+    mediator.send_async.return_value = "line,sku,name,error\n3,,,price: invalid\n"
+
+    response = client.get("/products/bulk/abc/errors")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="import-abc-errors.csv"' in response.headers["content-disposition"]
+    assert isinstance(mediator.send_async.call_args.args[0], GetImportJobErrorsQuery)
+
+
+def test_bulk_returns_counts_when_processed_in_the_request(client, mediator):
+    products = [{"name": "Tea", "price": 1, "stock": 2}]
+
+    mediator.send_async.return_value = {"job_id": "abc", "message": "1 productos encolados en 1 mensajes", "messages": 1}
+    assert client.post("/products/bulk", json={"products": products}).status_code == 202
+
+    mediator.send_async.return_value = {"job_id": "abc", "message": "1 productos procesados", "messages": 0, "counts": {"inserted": 1}}
+    response = client.post("/products/bulk", json={"products": products})
+    assert response.status_code == 200 and response.json()["counts"] == {"inserted": 1}
+
+
+def test_products_listing_supports_conditional_get(client, mediator):
+    page = {"items": [{"id": 1, "name": "Tea", "updated_at": datetime(2024, 1, 1)}], "per_page": 10, "next_cursor": None}
+    mediator.send_async.return_value = page
+
+    first = client.get("/products/")
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    etag = first.headers["ETag"]
+
+    revalidated = client.get("/products/", headers={"If-None-Match": f'W/"other", {etag}'})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+
+    page["items"][0]["name"] = "Green tea"
+    changed = client.get("/products/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["items"][0]["name"] == "Green tea"
+
+
+def test_export_streams_handler_chunks(client, mediator):
+    async def chunks():
+        yield b'{"id":1}\n'
+        yield b'{"id":2}\n'
+
+    mediator.send_async.return_value = chunks()
+
+    response = client.get("/products/export", params={"format": "ndjson", "available": "true"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.splitlines() == ['{"id":1}', '{"id":2}']
+    query = mediator.send_async.call_args.args[0]
+    assert (query.export_format, query.available) == ("ndjson", True)
+
+    assert client.get("/products/export", params={"format": "xml"}).status_code == 422
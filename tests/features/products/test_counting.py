@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from asisya_api.crosscutting.cache import TTLCache
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.counting import ProductCountStrategy
+
+
+@pytest.fixture
+def session(sqlite_session):
+    for i in range(20):
+        sqlite_session.add(ProductEntity(name=f"P{i}", sku=f"SKU-{i}", price=Decimal("1.00"), available=i < 5))
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def _filtered(available=None):
+    stmt = select(ProductEntity.id)
+    if available is not None:
+        stmt = stmt.where(ProductEntity.available == available)
+    return stmt
+
+
+def test_exact_count_for_small_results(session):
+    strategy = ProductCountStrategy(session, cache=TTLCache(), exact_threshold=100)
+    assert strategy.count(("available", True), _filtered(True)) == (5, False)
+
+
+def test_count_is_cached_by_filter_key(session):
+    cache = TTLCache()
+    strategy = ProductCountStrategy(session, cache=cache, exact_threshold=100)
+    assert strategy.count(("all",), _filtered()) == (20, False)
+
+    session.add(ProductEntity(name="new", sku="SKU-NEW", price=Decimal("1.00")))
+    session.commit()
+
+    assert strategy.count(("all",), _filtered()) == (20, False)
+    assert cache.hits == 1
+    cache.clear()
+    assert strategy.count(("all",), _filtered()) == (21, False)
+
+
+def test_planner_estimate_used_for_large_results(session, monkeypatch):
+    strategy = ProductCountStrategy(session, cache=TTLCache(), exact_threshold=10)
+    monkeypatch.setattr(strategy, "_supports_estimate", lambda: True)
+    monkeypatch.setattr(strategy, "_planner_estimate", lambda filtered: 1_000_000)
+    assert strategy.count(("all",), _filtered()) == (1_000_000, True)
+
+
+def test_exact_count_when_estimate_is_small(session, monkeypatch):
+    strategy = ProductCountStrategy(session, cache=TTLCache(), exact_threshold=10)
+    monkeypatch.setattr(strategy, "_supports_estimate", lambda: True)
+    monkeypatch.setattr(strategy, "_planner_estimate", lambda filtered: 3)
+    assert strategy.count(("available", True), _filtered(True)) == (5, False)
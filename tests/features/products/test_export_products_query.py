@@ -0,0 +1,54 @@
+import csv
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.queries.export_products_query import (
+    ExportProductsQuery,
+    ExportProductsQueryHandler,
+)
+
+
+@pytest.fixture
+def export(sqlite_session, run_in_unit_of_work):
+    for i in range(1, 11):
+        sqlite_session.add(ProductEntity(
+            name=f"Product {i}", sku=f"SKU-{i:03d}", price=Decimal(f"{i}.50"), available=i % 2 == 0,
+        ))
+    sqlite_session.commit()
+
+    def export(query: ExportProductsQuery) -> list:
+        # La respuesta se consume dentro de la unidad de trabajo, como en la petición
+        async def run():
+            chunks = await ExportProductsQueryHandler().handle(query)
+            return [chunk async for chunk in chunks]
+        return run_in_unit_of_work(run)
+
+    return export
+
+
+def test_ndjson_export_streams_filtered_products_in_batches(export):
+    chunks = export(ExportProductsQuery("ndjson", available=True, batch_size=2))
+
+    assert len(chunks) == 3
+    products = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+    assert [p["sku"] for p in products] == ["SKU-002", "SKU-004", "SKU-006", "SKU-008", "SKU-010"]
+    assert products[0]["price"] == 2.5
+    assert "T" in products[0]["created_at"]  # ISO 8601, como el listado
+
+
+def test_csv_export_has_header_and_one_row_per_product(export):
+    chunks = export(ExportProductsQuery("csv", min_price=8, batch_size=100))
+
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert [row["sku"] for row in rows] == ["SKU-008", "SKU-009", "SKU-010"]
+    assert rows[0]["price"] == "8.50"
+    assert rows[0]["description"] == ""
+
+
+def test_unknown_format_is_rejected_before_streaming(export):
+    with pytest.raises(ValueError):
+        export(ExportProductsQuery("xml"))
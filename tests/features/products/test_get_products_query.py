@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from asisya_api.core.unit_of_work import async_unit_of_work
+from asisya_api.domain.category import CategoryEntity
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.counting import product_count_cache
+from asisya_api.features.products.pagination import decode_cursor, encode_cursor
+from asisya_api.features.products.queries.get_products_query import GetProductsQuery, GetProductsQueryHandler
+
+
+@pytest.fixture
+def send(sqlite_session, sqlite_async_session_factory):
+    created_at = datetime(2025, 1, 1)
+    for i in range(1, 26):
+        sqlite_session.add(ProductEntity(
+            name=f"Product {i % 5}",
+            sku=f"SKU-{i:03d}",
+            price=Decimal(i % 7),
+            available=i % 2 == 0,
+            discontinued=False,
+            created_at=created_at + timedelta(minutes=i % 3),
+        ))
+    sqlite_session.add(CategoryEntity(id=1, name="Beverages", slug="beverages"))
+    sqlite_session.commit()
+
+    product_count_cache.clear()
+
+    def send(query: GetProductsQuery) -> dict:
+        # Cada llamada es una "petición": unidad de trabajo propia con sesión async
+        async def run():
+            async with async_unit_of_work(lambda: sqlite_session, sqlite_async_session_factory):
+                return await GetProductsQueryHandler().handle(query)
+        return asyncio.run(run())
+
+    yield send
+    product_count_cache.clear()
+
+
+def _walk_cursor(send, **kwargs):
+    ids, cursor = [], ""
+    for _ in range(50):
+        if cursor is None:
+            break
+        result = send(GetProductsQuery(per_page=4, cursor=cursor, **kwargs))
+        ids.extend(item["id"] for item in result["items"])
+        cursor = result["next_cursor"]
+    return ids
+
+
+def test_cursor_roundtrip():
+    cursor = encode_cursor("price", "desc", Decimal("10.50"), 42)
+    assert decode_cursor(cursor, "price", "desc") == (Decimal("10.50"), 42)
+
+
+def test_cursor_rejects_garbage_and_mismatched_sort():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", "id", "asc")
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor("name", "asc", "a", 1), "price", "asc")
+
+
+def test_page_mode_keeps_totals_and_returns_next_cursor(send):
+    result = send(GetProductsQuery(page=1, per_page=10))
+    assert result["total_items"] == 25
+    assert result["total_items_is_estimate"] is False
+    assert result["total_pages"] == 3
+    assert [item["id"] for item in result["items"]] == list(range(1, 11))
+    assert result["next_cursor"] is not None
+
+    last_page = send(GetProductsQuery(page=3, per_page=10))
+    assert last_page["next_cursor"] is None
+
+
+@pytest.mark.parametrize("sort_by", ["id", "name", "price", "created_at"])
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+def test_cursor_mode_matches_page_mode_order(send, sort_by, sort_order):
+    expected = [
+        item["id"]
+        for item in send(GetProductsQuery(per_page=100, sort_by=sort_by, sort_order=sort_order))["items"]
+    ]
+    assert _walk_cursor(send, sort_by=sort_by, sort_order=sort_order) == expected
+
+
+def test_cursor_mode_applies_filters(send):
+    ids = _walk_cursor(send, available=True, sort_by="price")
+    assert len(ids) == 12
+    assert len(set(ids)) == 12
+
+
+def test_page_cursor_continues_in_cursor_mode(send):
+    first = send(GetProductsQuery(page=1, per_page=10, sort_by="name"))
+    second = send(GetProductsQuery(per_page=10, sort_by="name", cursor=first["next_cursor"]))
+    page_two = send(GetProductsQuery(page=2, per_page=10, sort_by="name"))
+    assert second["items"] == page_two["items"]
+
+
+def test_invalid_sort_raises_value_error(send):
+    with pytest.raises(ValueError):
+        send(GetProductsQuery(sort_by="hashed_password"))
+
+
+def test_items_are_plain_dicts_with_optional_category_name(send, sqlite_session):
+    sqlite_session.get(ProductEntity, 1).category_id = 1
+    sqlite_session.commit()
+
+    items = send(GetProductsQuery(page=1, per_page=2))["items"]
+    assert set(items[0]) == {
+        "id", "name", "sku", "description", "quantity_per_unit", "units_in_stock", "units_on_order",
+        "discontinued", "price", "available", "category_id", "created_by_user_id", "created_at", "updated_at",
+    }
+    assert isinstance(items[0]["price"], float)
+
+    items = send(GetProductsQuery(per_page=2, cursor="", include_category=True, name="Product 1"))["items"]
+    assert [(item["id"], item["category_name"]) for item in items] == [(1, "Beverages"), (6, None)]
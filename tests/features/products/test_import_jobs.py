@@ -0,0 +1,171 @@
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from asisya_api.core.config import settings
+from asisya_api.core.unit_of_work import unit_of_work
+from asisya_api.domain.import_job import ImportJobEntity, ImportJobErrorEntity
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products import repository
+from asisya_api.features.products.commands.create_bulk_products_command import (
+    CreateBulkProductsCommand,
+    CreateBulkProductsCommandHandler,
+)
+from asisya_api.features.products.ingestion import ExecutemanyProductIngestor
+from asisya_api.features.products.queries.get_import_job_errors_query import (
+    GetImportJobErrorsQuery,
+    GetImportJobErrorsQueryHandler,
+)
+from asisya_api.features.products.queries.get_import_job_query import GetImportJobQuery, GetImportJobQueryHandler
+from asisya_api.features.products.repository import AsyncImportJobRepository, ImportJobRepository
+from asisya_api.infrastructure.in_memory_sqs import InMemorySqsClient
+from asisya_api.infrastructure.lambdas.process_bulk_products import handler as bulk_handler
+from asisya_api.infrastructure.sqs_batch_sender import SqsBatchSender
+
+
+class User:
+    id = 7
+
+
+def _start(run_in_unit_of_work, job_id="job1", **kwargs):
+    return run_in_unit_of_work(lambda: AsyncImportJobRepository.instance().start(job_id, 7, "json", "update", **kwargs))
+
+
+def _event(*messages):
+    return {"Records": [{"Body": json.dumps({"user_id": 7, "job_id": "job1", **message})} for message in messages]}
+
+
+def test_worker_updates_job_counters_per_message(run_in_unit_of_work, sqlite_session):
+    _start(run_in_unit_of_work, total_rows=5, messages_total=2)
+    first = {"on_conflict": "update", "products": [{"name": "A", "sku": "A-1", "price": 1}, {"sku": "no-name"}]}
+    second = {"on_conflict": "update", "products": [
+        {"name": "A", "sku": "A-1", "price": 2}, {"name": "B", "sku": "B-1", "price": 1}, {"name": "B", "sku": "B-1", "price": 1},
+    ]}
+
+    with unit_of_work(lambda: sqlite_session):
+        bulk_handler._process_records(_event(first))
+        job = sqlite_session.get(ImportJobEntity, "job1")
+        assert (job.status, job.messages_processed, job.finished_at) == ("processing", 1, None)
+
+        bulk_handler._process_records(_event(second))
+
+    job = sqlite_session.get(ImportJobEntity, "job1")
+    assert job.status == "completed" and job.finished_at is not None
+    assert (job.inserted_rows, job.updated_rows, job.duplicate_rows, job.failed_rows) == (2, 1, 1, 1)
+    error = sqlite_session.scalars(select(ImportJobErrorEntity)).one()
+    assert (error.sku, error.name, error.line) == ("no-name", None, None)
+    assert job.error_count == 1
+
+
+def test_rejected_batch_counts_every_row_as_failed(run_in_unit_of_work, sqlite_session):
+    _start(run_in_unit_of_work, total_rows=3, messages_total=2)
+    products = [{"name": "A", "sku": "A-1", "price": 1}, {"name": "B", "sku": "B-1", "price": 1}]
+
+    with unit_of_work(lambda: sqlite_session):
+        bulk_handler._process_records(_event({"products": products[:1]}, {"products": products}))
+
+    job = sqlite_session.get(ImportJobEntity, "job1")
+    assert (job.status, job.inserted_rows, job.failed_rows, job.error_count) == ("completed", 1, 2, 1)
+    assert "rejected" in sqlite_session.scalars(select(ImportJobErrorEntity.error)).one()
+
+
+def _lose_connection(self, rows, on_conflict):
+    raise OperationalError("INSERT INTO products ...", {}, Exception("server closed the connection unexpectedly"))
+
+
+def test_transient_errors_fail_only_their_message(run_in_unit_of_work, sqlite_session, monkeypatch):
+    _start(run_in_unit_of_work, total_rows=3, messages_total=3)
+    write = ExecutemanyProductIngestor._write
+
+    def lose_connection_on_b(self, rows, on_conflict):
+        rows = list(rows)
+        if any(row["sku"] == "B-1" for row in rows):
+            _lose_connection(self, rows, on_conflict)
+        return write(self, rows, on_conflict)
+
+    monkeypatch.setattr(ExecutemanyProductIngestor, "_write", lose_connection_on_b)
+    # Formato del evento de SQS en Lambda (`body`, `messageId`)
+    event = {"Records": [
+        {"messageId": f"m-{sku}", "body": json.dumps({"user_id": 7, "job_id": "job1", "products": [
+            {"name": sku, "sku": sku, "price": 1},
+        ]})}
+        for sku in ("A-1", "B-1", "C-1")
+    ]}
+
+    with unit_of_work(lambda: sqlite_session):
+        response = bulk_handler._process_records(event)
+
+    # Sólo el mensaje fallido vuelve a la cola; los demás no se reprocesan
+    assert response["batchItemFailures"] == [{"itemIdentifier": "m-B-1"}]
+    job = sqlite_session.get(ImportJobEntity, "job1")
+    assert (job.messages_processed, job.inserted_rows, job.failed_rows, job.error_count) == (2, 2, 0, 0)
+
+
+def test_small_load_marks_job_failed_on_transient_error(run_in_unit_of_work, sqlite_session, monkeypatch):
+    monkeypatch.setattr(settings, "bulk_sync_max_rows", 10)
+    monkeypatch.setattr(ExecutemanyProductIngestor, "_write", _lose_connection)
+    command = CreateBulkProductsCommand([{"name": "A", "sku": "A-1", "price": 1}], User(), "update")
+    sender = SqsBatchSender(InMemorySqsClient(), "memory://bulk")
+
+    with pytest.raises(OperationalError):
+        run_in_unit_of_work(lambda: CreateBulkProductsCommandHandler(sender=sender).handle(command))
+
+    job = sqlite_session.scalars(select(ImportJobEntity)).one()
+    assert job.status == "failed" and job.failed_rows == 0
+
+
+def test_error_report_is_capped(run_in_unit_of_work, sqlite_session, monkeypatch):
+    monkeypatch.setattr(repository, "MAX_JOB_ERRORS", 3)
+    _start(run_in_unit_of_work, messages_total=2)
+    errors = [{"sku": f"S-{i}", "error": "bad"} for i in range(2)]
+
+    with unit_of_work(lambda: sqlite_session):
+        ImportJobRepository.instance().record_batch("job1", {}, 2, errors)
+        ImportJobRepository.instance().record_batch("job1", {}, 2, errors)
+
+    job = sqlite_session.get(ImportJobEntity, "job1")
+    assert (job.failed_rows, job.error_count) == (4, 3)
+
+
+def test_job_completes_when_totals_arrive_after_the_worker(run_in_unit_of_work, sqlite_session):
+    # Carga desde fichero: el worker puede terminar antes de que la API fije los totales
+    _start(run_in_unit_of_work)
+    with unit_of_work(lambda: sqlite_session):
+        ImportJobRepository.instance().record_batch("job1", {"inserted": 10})
+
+    run_in_unit_of_work(lambda: AsyncImportJobRepository.instance().finish_enqueue(
+        "job1", 10, 1, 1, [{"line": 3, "error": "price: invalid"}]
+    ))
+
+    job = run_in_unit_of_work(lambda: GetImportJobQueryHandler().handle(GetImportJobQuery("job1", User())))
+    assert (job.status, job.total_rows, job.rejected_rows, job.progress) == ("completed", 10, 1, 1.0)
+    assert job.counts == {"inserted": 10, "updated": 0, "unchanged": 0, "skipped": 0, "duplicate": 0, "failed": 0}
+
+    report = run_in_unit_of_work(lambda: GetImportJobErrorsQueryHandler().handle(GetImportJobErrorsQuery("job1", User())))
+    assert report.splitlines() == ["line,sku,name,error", "3,,,price: invalid"]
+
+
+def test_jobs_are_only_visible_to_their_owner(run_in_unit_of_work):
+    _start(run_in_unit_of_work)
+    other = type("User", (), {"id": 8})()
+
+    assert run_in_unit_of_work(lambda: GetImportJobQueryHandler().handle(GetImportJobQuery("job1", other))) is None
+    assert run_in_unit_of_work(lambda: GetImportJobErrorsQueryHandler().handle(GetImportJobErrorsQuery("job1", other))) is None
+
+
+def test_small_loads_are_processed_in_the_request(run_in_unit_of_work, sqlite_session, monkeypatch):
+    monkeypatch.setattr(settings, "bulk_sync_max_rows", 10)
+    client = InMemorySqsClient()
+    products = [{"name": "A", "sku": "A-1", "price": 1}, {"name": "B", "price": "2.5", "stock": 3}, {"price": 1}]
+    command = CreateBulkProductsCommand(products, User(), "update")
+
+    result = run_in_unit_of_work(
+        lambda: CreateBulkProductsCommandHandler(sender=SqsBatchSender(client, "memory://bulk")).handle(command)
+    )
+
+    assert result["counts"] == {"inserted": 2} and client.calls == {}
+    assert sorted(sqlite_session.scalars(select(ProductEntity.sku))) == ["A-1", "b-7"]
+    job = sqlite_session.get(ImportJobEntity, result["job_id"])
+    assert (job.status, job.messages_total, job.inserted_rows, job.failed_rows) == ("completed", 1, 2, 1)
@@ -0,0 +1,191 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from asisya_api.core.unit_of_work import unit_of_work
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.ingestion import (
+    ExecutemanyProductIngestor,
+    PostgresCopyProductIngestor,
+    get_product_ingestor,
+    normalize_product_row,
+    normalize_rows,
+)
+from asisya_api.features.products.normalization import get_product_normalizer
+from asisya_api.features.products.repository import ProductRepository
+from asisya_api.infrastructure.lambdas.process_bulk_products import handler as bulk_handler
+
+NOW = datetime(2024, 1, 1)
+
+
+def _rows(count, prefix="SKU", user_id=None):
+    return [
+        normalize_product_row({"name": f"Product {i}", "sku": f"{prefix}-{i}", "price": "9.90", "qty": i}, user_id, NOW)
+        for i in range(count)
+    ]
+
+
+def test_normalize_applies_aliases_and_defaults():
+    row = normalize_product_row({"name": "Green Tea", "price_value": 3.5, "stock": "12", "color": "green"}, 7, NOW)
+
+    assert row["sku"] == "green-tea-7"
+    assert row["price"] == Decimal("3.5")
+    assert row["units_in_stock"] == 12
+    assert row["discontinued"] is False and row["available"] is True
+    assert row["created_by_user_id"] == 7 and row["created_at"] == NOW
+    assert "color" not in row
+
+
+def test_normalize_rows_skips_invalid_products():
+    errors = []
+    rows = list(normalize_rows(
+        [{"name": "ok"}, {"price": 1}, {"name": "bad", "price": "abc"}], 7, on_error=lambda raw, e: errors.append(raw)
+    ))
+
+    assert [row["name"] for row in rows] == ["ok"]
+    assert len(errors) == 2
+
+
+def test_sqlite_uses_executemany_ingestor(sqlite_session):
+    ingestor = get_product_ingestor(sqlite_session)
+    assert isinstance(ingestor, ExecutemanyProductIngestor)
+
+    ingestor.chunk_size = 3
+    assert ingestor.ingest(iter(_rows(10))).counts == {"inserted": 10}
+    assert sqlite_session.query(ProductEntity).count() == 10
+
+
+def test_ingest_is_all_or_nothing(sqlite_session):
+    rows = _rows(5) + _rows(1)
+
+    with pytest.raises(ValueError):
+        ProductRepository(sqlite_session).bulk_ingest(rows)
+    assert sqlite_session.query(ProductEntity).count() == 0
+
+
+def _outcomes(result):
+    return [(row["sku"], row["outcome"]) for row in result.rows]
+
+
+def _upsert_round_trip(session, chunk_size=None):
+    ingestor = get_product_ingestor(session)
+    if chunk_size:
+        ingestor.chunk_size = chunk_size
+    ingestor.ingest(_rows(3))
+
+    feed = _rows(4)
+    feed[1]["price"] = Decimal("12.50")
+    feed.append(dict(feed[0]))
+
+    updated = ingestor.ingest(feed, "update")
+    assert _outcomes(updated) == [
+        ("SKU-0", "unchanged"), ("SKU-1", "updated"), ("SKU-2", "unchanged"), ("SKU-3", "inserted"),
+        ("SKU-0", "duplicate"),
+    ]
+    assert session.scalars(select(ProductEntity.price).where(ProductEntity.sku == "SKU-1")).one() == Decimal("12.50")
+
+    feed = _rows(5)
+    feed[1]["price"] = Decimal("99.00")
+    skipped = ingestor.ingest(feed, "skip")
+    assert skipped.counts == {"skipped": 4, "inserted": 1}
+    assert session.scalars(select(ProductEntity.price).where(ProductEntity.sku == "SKU-1")).one() == Decimal("12.50")
+    assert session.query(ProductEntity).count() == 5
+
+
+def test_sqlite_upsert_modes(sqlite_session):
+    _upsert_round_trip(sqlite_session, chunk_size=2)
+
+
+def _partial_update_round_trip(session, normalizer):
+    ingestor = get_product_ingestor(session)
+    ingestor.ingest([normalize_product_row({
+        "name": f"Product {i}", "sku": f"SKU-{i}", "price": "9.90", "stock": 5, "description": "Original",
+        "discontinued": True, "available": False, "units_on_order": 3,
+    }, None, NOW) for i in range(2)])
+
+    # Mensaje con productos que envían campos distintos: sólo se reemplaza lo enviado
+    feed = get_product_normalizer(normalizer).normalize([
+        {"name": "Product 0", "sku": "SKU-0", "price": "12.50", "stock": 5},
+        {"name": "Product 1", "sku": "SKU-1", "description": None},
+        {"name": "Product 2", "sku": "SKU-2"},
+    ], None)
+    assert _outcomes(ingestor.ingest(feed, "update")) == [
+        ("SKU-0", "updated"), ("SKU-1", "updated"), ("SKU-2", "inserted"),
+    ]
+
+    session.expire_all()
+    products = {p.sku: p for p in session.scalars(select(ProductEntity))}
+    first, second = products["SKU-0"], products["SKU-1"]
+    assert first.price == Decimal("12.50") and first.description == "Original"
+    assert second.price == Decimal("9.90") and second.units_in_stock == 5 and second.description is None
+    for product in (first, second):
+        assert product.discontinued is True and product.available is False and product.units_on_order == 3
+        assert product.created_at == NOW
+    assert products["SKU-2"].available is True and products["SKU-2"].price == Decimal("0.00")
+
+
+@pytest.mark.parametrize("normalizer", ["row", "columnar"])
+def test_sqlite_update_keeps_omitted_fields(sqlite_session, normalizer):
+    _partial_update_round_trip(sqlite_session, normalizer)
+
+
+def test_invalid_conflict_mode(sqlite_session):
+    with pytest.raises(ValueError):
+        get_product_ingestor(sqlite_session).ingest(_rows(1), "replace")
+
+
+def test_lambda_handler_ingests_each_message(sqlite_session):
+    event = {"Records": [
+        {"Body": json.dumps({"user_id": 1, "products": [{"name": "A", "price": 1}, {"name": "B", "qty": 2}]})},
+        {"Body": json.dumps({"user_id": 2, "products": [{"name": "A", "price": 1}, {"sku": "no-name"}]})},
+    ]}
+
+    with unit_of_work(lambda: sqlite_session):
+        bulk_handler._process_records(event)
+
+    skus = sqlite_session.scalars(select(ProductEntity.sku).order_by(ProductEntity.sku)).all()
+    assert skus == ["a-1", "a-2", "b-1"]
+
+
+def test_lambda_handler_upserts_resent_messages(sqlite_session):
+    body = {"user_id": 1, "on_conflict": "update", "products": [{"name": "A", "sku": "A-1", "price": 1}]}
+    event = {"Records": [{"Body": json.dumps(body)}]}
+
+    with unit_of_work(lambda: sqlite_session):
+        first = bulk_handler._process_records(event)["batches"]
+        body["products"].append({"name": "B", "sku": "B-1", "price": 2})
+        second = bulk_handler._process_records({"Records": [{"Body": json.dumps(body)}]})["batches"]
+
+    assert first[0]["counts"] == {"inserted": 1}
+    assert second[0]["rows"] == [{"sku": "A-1", "outcome": "unchanged"}, {"sku": "B-1", "outcome": "inserted"}]
+
+
+def test_postgres_copy_ingestor(postgres_session):
+    ingestor = get_product_ingestor(postgres_session)
+    assert isinstance(ingestor, PostgresCopyProductIngestor)
+
+    rows = _rows(3)
+    rows[0]["description"] = "tab\there, new\nline and back\\slash"
+    assert ingestor.ingest(rows).counts == {"inserted": 3}
+
+    first = postgres_session.scalars(select(ProductEntity).where(ProductEntity.sku == "SKU-0")).one()
+    assert first.description == "tab\there, new\nline and back\\slash"
+    assert first.category_id is None and first.quantity_per_unit is None
+    assert first.price == Decimal("9.90")
+
+    with pytest.raises(ValueError):
+        ingestor.ingest(_rows(2, prefix="NEW") + _rows(1))
+    assert postgres_session.query(ProductEntity).count() == 3
+
+
+def test_postgres_copy_upsert_modes(postgres_session):
+    assert isinstance(get_product_ingestor(postgres_session), PostgresCopyProductIngestor)
+    _upsert_round_trip(postgres_session)
+
+
+def test_postgres_copy_update_keeps_omitted_fields(postgres_session):
+    assert isinstance(get_product_ingestor(postgres_session), PostgresCopyProductIngestor)
+    _partial_update_round_trip(postgres_session, "columnar")
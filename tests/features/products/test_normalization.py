@@ -0,0 +1,71 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from asisya_api.features.products.normalization import (
+    ColumnarProductNormalizer,
+    RowProductNormalizer,
+    get_product_normalizer,
+)
+
+NOW = datetime(2024, 1, 1)
+
+PRODUCTS = [
+    {"name": "Green Tea", "price": "1.50", "qty": 3},
+    {"name": "Coffee", "sku": "COF-1", "price": 2, "stock": "4", "available": False},
+    {"sku": "no-name", "price": 1},
+    {"name": "Cake", "price": "abc"},
+    {"name": "Juice", "price": 1, "stock": "1.5"},
+    {"name": "Water", "price_value": None, "units_in_stock": 2, "stock": 9, "slug": "ignored"},
+    {"name": "Green Tea", "price": "1.50", "qty": 3},
+    {"name": "", "price": "x"},
+]
+
+
+def _normalize(normalizer, products):
+    errors = []
+    rows = normalizer.normalize(products, 7, on_error=lambda product, error: errors.append((product, str(error))), now=NOW)
+    return rows, errors
+
+
+def test_columnar_matches_row_by_row():
+    expected_rows, expected_errors = _normalize(RowProductNormalizer(), PRODUCTS)
+    rows, errors = _normalize(ColumnarProductNormalizer(), PRODUCTS)
+
+    assert rows == expected_rows
+    assert errors == expected_errors
+    assert [error for _, error in errors] == [
+        "Product name is required",
+        "Invalid numeric value for product 'Cake': [<class 'decimal.ConversionSyntax'>]",
+        "Invalid numeric value for product 'Juice': invalid literal for int() with base 10: '1.5'",
+        "Product name is required",
+    ]
+
+
+@pytest.mark.parametrize("prices", [
+    [1.5, 2.25, 3.0],
+    [1.5, None, 3],
+    ["1.5", 2, "x"],
+    [1.5, True, "2"],
+])
+def test_columnar_matches_row_by_row_on_uniform_messages(prices):
+    products = [{"name": f"P{i}", "sku": None, "price": price, "stock": i} for i, price in enumerate(prices)]
+
+    assert _normalize(ColumnarProductNormalizer(), products) == _normalize(RowProductNormalizer(), products)
+
+
+def test_columnar_rows():
+    rows, _ = _normalize(ColumnarProductNormalizer(), PRODUCTS)
+
+    assert [row["sku"] for row in rows] == ["green-tea-7", "COF-1", "water-7", "green-tea-7"]
+    assert rows[0]["price"] == Decimal("1.50") and rows[0]["units_in_stock"] == 3
+    # "stock" va después de "units_in_stock" en el producto: gana el alias, como fila a fila
+    assert rows[2]["units_in_stock"] == 9 and rows[2]["price"] == Decimal("0.00")
+    assert {row["created_at"] for row in rows} == {NOW} and {row["created_by_user_id"] for row in rows} == {7}
+
+
+def test_get_product_normalizer():
+    assert isinstance(get_product_normalizer("row"), RowProductNormalizer)
+    with pytest.raises(ValueError):
+        get_product_normalizer("pandas")
@@ -0,0 +1,97 @@
+"""
+Regresión de planes: cada combinación de filtros del listado debe resolverse con
+índices sobre una tabla grande. Sólo con PostgreSQL (TEST_POSTGRES_URL).
+"""
+import pytest
+from sqlalchemy import and_, func, select, text
+from sqlalchemy.dialects import postgresql
+
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.pagination import SORT_COLUMNS
+from asisya_api.features.products.queries.get_products_query import (
+    PRODUCT_COLUMNS,
+    GetProductsQuery,
+    build_product_filters,
+)
+
+PRODUCTS = 200_000
+CATEGORIES = 50
+
+# Filtros del listado -> índice con el que se debe calcular el total
+FILTER_COMBINATIONS = {
+    "category": (dict(category_id=7), "ix_products_category_available_price_id"),
+    "category_available": (dict(category_id=7, available=True), "ix_products_category_available_price_id"),
+    "category_available_price": (
+        dict(category_id=7, available=True, min_price=100, max_price=150),
+        "ix_products_category_available_price_id",
+    ),
+    "category_price": (dict(category_id=7, min_price=100, max_price=150), "ix_products_category_available_price_id"),
+    "category_active": (dict(category_id=7, discontinued=False), "ix_products_active_category_id"),
+    "active_price": (dict(discontinued=False, min_price=100, max_price=110), "ix_products_active_price_id"),
+    "price": (dict(min_price=100, max_price=110), "ix_products_price_id"),
+    "available_price": (dict(available=True, min_price=100, max_price=110), "ix_products_price_id"),
+}
+
+
+@pytest.fixture(scope="module")
+def db(postgres_module_session):
+    # Datos deterministas (sin random()): 20% no disponibles, 10% descatalogados, precios repartidos
+    session = postgres_module_session
+    session.execute(text(
+        "INSERT INTO categories (name, slug, created_at, updated_at) "
+        "SELECT 'Category ' || g, 'category-' || g, now(), now() FROM generate_series(1, :categories) g"
+    ), {"categories": CATEGORIES})
+    session.execute(text(
+        "INSERT INTO products (name, sku, description, price, units_in_stock, units_on_order, available, "
+        "discontinued, category_id, created_at, updated_at) "
+        "SELECT 'Product ' || g, 'SKU-' || g, 'Synthetic product ' || g, (g * 7919 % 100000) / 100.0, 1, 0, "
+        "g % 5 <> 0, g % 10 = 0, 1 + g % :categories, "
+        "timestamp '2024-01-01' + g * interval '1 minute', timestamp '2024-01-01' "
+        "FROM generate_series(1, :products) g"
+    ), {"categories": CATEGORIES, "products": PRODUCTS})
+    session.commit()
+    # VACUUM: visibility map al día para que los totales puedan ser index-only scans
+    with session.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE products"))
+    return session
+
+
+def _plan_nodes(db, stmt) -> list:
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    nodes, pending = [], [plan[0]["Plan"]]
+    while pending:
+        node = pending.pop()
+        nodes.append(node)
+        pending.extend(node.get("Plans", []))
+    return nodes
+
+
+def _scans(nodes) -> list:
+    return [(node["Node Type"], node.get("Index Name")) for node in nodes if "Scan" in node["Node Type"]]
+
+
+@pytest.mark.parametrize("combination", FILTER_COMBINATIONS)
+def test_total_uses_the_matching_index(db, combination):
+    filters, index = FILTER_COMBINATIONS[combination]
+    # La misma consulta que ProductCountStrategy._exact_count
+    filtered = select(ProductEntity.id).where(and_(*build_product_filters(GetProductsQuery(**filters))))
+    scans = _scans(_plan_nodes(db, select(func.count()).select_from(filtered.subquery())))
+
+    assert ("Seq Scan", None) not in scans, scans
+    assert index in {name for _, name in scans}, scans
+
+
+@pytest.mark.parametrize("sort_by", SORT_COLUMNS)
+@pytest.mark.parametrize("combination", FILTER_COMBINATIONS)
+def test_page_never_scans_the_whole_table(db, combination, sort_by):
+    filters, _ = FILTER_COMBINATIONS[combination]
+    stmt = (
+        select(*PRODUCT_COLUMNS)
+        .where(and_(*build_product_filters(GetProductsQuery(**filters))))
+        .order_by(SORT_COLUMNS[sort_by], ProductEntity.id)
+        .limit(11)
+    )
+    scans = _scans(_plan_nodes(db, stmt))
+
+    assert scans and all(node_type != "Seq Scan" for node_type, _ in scans), scans
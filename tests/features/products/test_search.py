@@ -0,0 +1,83 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from asisya_api.core.unit_of_work import async_unit_of_work
+from asisya_api.domain.product import ProductEntity
+from asisya_api.features.products.counting import product_count_cache
+from asisya_api.features.products.queries.get_products_query import GetProductsQuery, GetProductsQueryHandler
+from asisya_api.features.products.search import InMemoryProductSearchIndex, product_search_index, tokenize
+
+
+@pytest.fixture
+def session(sqlite_session):
+    products = [
+        ("Silla ergonómica", "CHAIR-001", "Silla con soporte lumbar"),
+        ("Mesa de oficina", "DESK-002", "Mesa amplia para silla y monitor"),
+        ("Monitor 27 pulgadas", "MON-027", None),
+        ("Silla gamer", "CHAIR-003", "Reclinable"),
+    ]
+    for name, sku, description in products:
+        sqlite_session.add(ProductEntity(name=name, sku=sku, description=description, price=Decimal("10.00")))
+    sqlite_session.commit()
+    return sqlite_session
+
+
+@pytest.fixture
+def send(session, sqlite_async_session_factory):
+    product_count_cache.clear()
+    product_search_index.invalidate()
+
+    def send(query: GetProductsQuery) -> dict:
+        async def run():
+            async with async_unit_of_work(lambda: session, sqlite_async_session_factory):
+                return await GetProductsQueryHandler().handle(query)
+        return asyncio.run(run())
+
+    yield send
+    product_search_index.invalidate()
+    product_count_cache.clear()
+
+
+def test_tokenize():
+    assert tokenize("Silla Ergonómica, SKU-12") == ["silla", "ergonómica", "sku", "12"]
+
+
+def test_index_ranks_name_matches_before_description_matches(session):
+    ids = InMemoryProductSearchIndex().search(session, "silla")
+    # Las dos sillas (coincidencia en nombre) van antes que la mesa (sólo descripción)
+    assert ids[:2] == [1, 4]
+    assert ids[2] == 2
+
+
+def test_index_matches_prefixes_and_requires_every_token(session):
+    index = InMemoryProductSearchIndex()
+    assert index.search(session, "monit") == [3, 2]
+    assert index.search(session, "silla gam") == [4]
+    assert index.search(session, "chair-00") == [1, 4]
+    assert index.search(session, "teclado") == []
+
+
+def test_handler_search_filters_counts_and_ranks(send):
+    result = send(GetProductsQuery(search="silla", per_page=2))
+    assert [item["id"] for item in result["items"]] == [1, 4]
+    assert result["total_items"] == 3 and result["total_items_is_estimate"] is False
+    # Hay página siguiente, pero la búsqueda no admite cursor
+    assert result["total_pages"] == 2 and result["next_cursor"] is None
+
+
+def test_handler_flags_truncated_search_totals(send, monkeypatch):
+    monkeypatch.setattr(product_search_index, "MAX_RESULTS", 2)
+    result = send(GetProductsQuery(search="silla"))
+    assert result["total_items"] == 2 and result["total_items_is_estimate"] is True
+
+
+def test_handler_search_combines_with_filters(send):
+    result = send(GetProductsQuery(search="silla", name="gamer"))
+    assert [item["id"] for item in result["items"]] == [4]
+
+
+def test_search_is_not_allowed_with_cursor(send):
+    with pytest.raises(ValueError):
+        send(GetProductsQuery(search="silla", cursor=""))
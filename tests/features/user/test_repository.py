@@ -1,6 +1,7 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from sqlalchemy.orm import Session
+from asisya_api.core.unit_of_work import unit_of_work
 from asisya_api.domain.user import UserEntity
 from asisya_api.features.user.repository import UserRepository
 
@@ -19,18 +20,31 @@ def user_repository(db_session):
 
 
 def test_instance_method(db_session):
-    with patch('asisya_api.features.user.repository.get_db', return_value=iter([db_session])):
-        # Reset the singleton instance for other tests
-        UserRepository._instance = None
+    with unit_of_work(lambda: db_session):
         instance1 = UserRepository.instance()
         instance2 = UserRepository.instance()
 
-        assert instance1 is instance2
+        # Cada llamada devuelve un repositorio ligado a la sesión de la unidad de trabajo actual
         assert isinstance(instance1, UserRepository)
-        assert instance1.db == db_session
+        assert instance1.db is db_session
+        assert instance2.db is db_session
 
-        # Reset the singleton instance for other tests
-        UserRepository._instance = None
+
+def test_instance_method_requires_unit_of_work():
+    with pytest.raises(RuntimeError):
+        UserRepository.instance()
+
+
+def test_instance_method_uses_a_session_per_unit_of_work():
+    sessions = []
+    with unit_of_work(lambda: MagicMock(spec=Session)):
+        sessions.append(UserRepository.instance().db)
+    with unit_of_work(lambda: MagicMock(spec=Session)):
+        sessions.append(UserRepository.instance().db)
+
+    assert sessions[0] is not sessions[1]
+    sessions[0].close.assert_called_once()
+    sessions[1].close.assert_called_once()
 
 
 def test_get_by_username(user_repository, db_session):
@@ -0,0 +1,140 @@
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+from sqlalchemy import select
+
+from asisya_api.domain.import_job import ImportJobEntity
+
+from asisya_api.features.products.commands.create_bulk_products_command import (
+    CreateBulkProductsCommand,
+    CreateBulkProductsCommandHandler,
+)
+from asisya_api.infrastructure.in_memory_sqs import InMemorySqsClient
+from asisya_api.infrastructure.sqs_batch_sender import (
+    MAX_PAYLOAD_BYTES,
+    QueueSendError,
+    SqsBatchSender,
+    chunk_messages,
+    group_entries,
+)
+
+QUEUE_URL = "memory://bulk-products"
+
+
+class FlakySqsClient(InMemorySqsClient):
+    """Falla entradas concretas las primeras veces, como SQS bajo throttling."""
+
+    def __init__(self, failures_per_id=None, sender_fault_ids=(), raise_first_calls=0):
+        super().__init__()
+        self.failures_per_id = dict(failures_per_id or {})
+        self.sender_fault_ids = set(sender_fault_ids)
+        self.raise_first_calls = raise_first_calls
+
+    def send_message_batch(self, QueueUrl, Entries, **kwargs):
+        if self.raise_first_calls:
+            self.raise_first_calls -= 1
+            raise ClientError({"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "SendMessageBatch")
+        accepted, failed = [], []
+        for entry in Entries:
+            if entry["Id"] in self.sender_fault_ids:
+                failed.append({"Id": entry["Id"], "SenderFault": True, "Code": "InvalidMessageContents"})
+            elif self.failures_per_id.get(entry["Id"], 0) > 0:
+                self.failures_per_id[entry["Id"]] -= 1
+                failed.append({"Id": entry["Id"], "SenderFault": False, "Code": "InternalError"})
+            else:
+                accepted.append(entry)
+        response = super().send_message_batch(QueueUrl, accepted) if accepted else {"Successful": []}
+        return {"Successful": response["Successful"], "Failed": failed}
+
+
+def _products(count, description_size=10):
+    return [{"name": f"Product {i}", "price": 1.5, "description": "x" * description_size} for i in range(count)]
+
+
+def _sender(client, **kwargs):
+    kwargs.setdefault("retry_backoff_seconds", 0)
+    return SqsBatchSender(client, QUEUE_URL, max_workers=4, **kwargs)
+
+
+def test_chunk_messages_respects_item_and_size_limits():
+    products = _products(25, description_size=1000)
+    bodies = list(chunk_messages(products, {"user_id": 1}, max_items=10, max_bytes=8_000))
+
+    decoded = [json.loads(body) for body in bodies]
+    assert all(len(body) <= 8_000 for body in bodies)
+    assert all(len(message["products"]) <= 10 for message in decoded)
+    assert [p for message in decoded for p in message["products"]] == products
+    assert all(message["user_id"] == 1 for message in decoded)
+
+
+def test_chunk_messages_rejects_products_over_the_sqs_limit():
+    with pytest.raises(ValueError):
+        list(chunk_messages(_products(1, description_size=MAX_PAYLOAD_BYTES), {}, max_items=10))
+
+
+def test_group_entries_respects_batch_limits():
+    bodies = ["a" * 100_000] * 5 + ["b"] * 12
+    batches = list(group_entries(bodies))
+
+    assert all(len(batch) <= 10 for batch in batches)
+    assert all(sum(len(entry["MessageBody"]) for entry in batch) <= MAX_PAYLOAD_BYTES for batch in batches)
+    assert [entry["MessageBody"] for batch in batches for entry in batch] == bodies
+
+
+def test_sender_uses_one_call_per_ten_messages():
+    client = InMemorySqsClient()
+    bodies = [json.dumps({"n": i}) for i in range(95)]
+
+    result = _sender(client).send(bodies)
+
+    assert result.sent == 95 and not result.failed
+    assert client.calls == {"send_message_batch": 10}
+    assert sorted(client.messages(QUEUE_URL), key=lambda b: json.loads(b)["n"]) == bodies
+
+
+def test_sender_retries_only_failed_entries():
+    client = FlakySqsClient(failures_per_id={"3": 2, "7": 1}, raise_first_calls=1)
+    bodies = [f"message {i}" for i in range(10)]
+
+    result = _sender(client).send(bodies)
+
+    assert result.sent == 10 and not result.failed
+    assert sorted(client.messages(QUEUE_URL)) == sorted(bodies)
+
+
+def test_sender_reports_permanent_failures():
+    client = FlakySqsClient(failures_per_id={"1": 10}, sender_fault_ids={"2"})
+
+    result = _sender(client, max_retries=2).send([f"message {i}" for i in range(5)])
+
+    assert result.sent == 3
+    assert sorted(failure["Id"] for failure in result.failed) == ["1", "2"]
+
+
+def test_bulk_command_enqueues_in_batches(run_in_unit_of_work, sqlite_session):
+    client = InMemorySqsClient()
+    user = type("User", (), {"id": 7})()
+    command = CreateBulkProductsCommand(_products(1_050), user, "update", batch_size=100)
+
+    result = run_in_unit_of_work(lambda: CreateBulkProductsCommandHandler(sender=_sender(client)).handle(command))
+
+    messages = [json.loads(body) for body in client.messages(QUEUE_URL)]
+    assert result["messages"] == len(messages) == 11
+    assert client.calls == {"send_message_batch": 2}
+    assert {(m["user_id"], m["on_conflict"], m["job_id"]) for m in messages} == {(7, "update", result["job_id"])}
+    assert sum(len(m["products"]) for m in messages) == 1_050
+
+    job = sqlite_session.get(ImportJobEntity, result["job_id"])
+    assert (job.status, job.source, job.total_rows, job.messages_total) == ("queued", "json", 1_050, 11)
+
+
+def test_bulk_command_raises_when_messages_are_lost(run_in_unit_of_work, sqlite_session):
+    client = FlakySqsClient(sender_fault_ids={"0"})
+    user = type("User", (), {"id": 7})()
+    command = CreateBulkProductsCommand(_products(300), user, batch_size=100)
+
+    with pytest.raises(QueueSendError) as error:
+        run_in_unit_of_work(lambda: CreateBulkProductsCommandHandler(sender=_sender(client)).handle(command))
+    assert error.value.sent == 2
+    assert sqlite_session.scalars(select(ImportJobEntity.status)).all() == ["failed"]
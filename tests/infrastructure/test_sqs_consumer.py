@@ -0,0 +1,125 @@
+import json
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from asisya_api.core.unit_of_work import unit_of_work
+
+from asisya_api.infrastructure.in_memory_sqs import InMemorySqsClient
+from asisya_api.infrastructure.sqs_consumer import SqsConsumer
+
+QUEUE_URL = "memory://bulk-products"
+
+
+@pytest.fixture
+def client():
+    client = InMemorySqsClient()
+    for i in range(20):
+        client.send_message(QueueUrl=QUEUE_URL, MessageBody=f"message {i}")
+    return client
+
+
+def _run_until(consumer, condition, timeout=10):
+    thread = threading.Thread(target=consumer.run)
+    thread.start()
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    consumer.stop()
+    thread.join(timeout)
+    assert not thread.is_alive()
+
+
+def test_in_memory_visibility_timeout():
+    client = InMemorySqsClient()
+    client.send_message(QueueUrl=QUEUE_URL, MessageBody="hello")
+
+    first = client.receive_message(QueueUrl=QUEUE_URL, VisibilityTimeout=0.2)["Messages"][0]
+    assert client.receive_message(QueueUrl=QUEUE_URL) == {}
+
+    again = client.receive_message(QueueUrl=QUEUE_URL, WaitTimeSeconds=1)["Messages"][0]
+    assert again["MessageId"] == first["MessageId"]
+
+    client.delete_message_batch(QueueUrl=QUEUE_URL, Entries=[{"Id": "1", "ReceiptHandle": again["ReceiptHandle"]}])
+    assert client.messages(QUEUE_URL) == []
+
+
+def test_consumer_processes_concurrently_and_deletes_in_batches(client):
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def process(message):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+
+    consumer = SqsConsumer(client, QUEUE_URL, process, concurrency=4, wait_time_seconds=1)
+    _run_until(consumer, lambda: not client.messages(QUEUE_URL))
+
+    assert consumer.stats["processed"] == consumer.stats["deleted"] == 20
+    assert peak[0] == 4
+    assert "delete_message" not in client.calls
+    assert client.calls["delete_message_batch"] < 20
+
+
+def test_failed_messages_are_not_deleted(client):
+    def process(message):
+        if message["Body"] == "message 3":
+            raise RuntimeError("boom")
+
+    consumer = SqsConsumer(client, QUEUE_URL, process, concurrency=2, wait_time_seconds=1)
+    _run_until(consumer, lambda: consumer.stats["processed"] == 19)
+
+    assert consumer.stats["failed"] == 1
+    assert client.messages(QUEUE_URL) == ["message 3"]
+
+
+def test_bulk_message_is_kept_when_the_database_is_unreachable(tmp_path, monkeypatch):
+    from asisya_api.infrastructure.lambdas.process_bulk_products import handler as bulk_handler
+
+    unreachable = sessionmaker(bind=create_engine(f"sqlite:///{tmp_path}/missing/dir/db.sqlite"))
+    monkeypatch.setattr(bulk_handler, "unit_of_work", lambda: unit_of_work(unreachable))
+    client = InMemorySqsClient()
+    body = json.dumps({"user_id": 1, "job_id": "job-1", "products": [{"name": "A", "price": 1}]})
+    client.send_message(QueueUrl=QUEUE_URL, MessageBody=body)
+
+    consumer = SqsConsumer(client, QUEUE_URL, bulk_handler.process_message, concurrency=1, wait_time_seconds=1)
+    _run_until(consumer, lambda: consumer.stats["failed"] == 1)
+
+    assert consumer.stats["deleted"] == 0
+    assert client.messages(QUEUE_URL) == [body]
+
+
+def test_visibility_is_extended_for_slow_messages():
+    client = InMemorySqsClient()
+    client.send_message(QueueUrl=QUEUE_URL, MessageBody="slow")
+    deliveries = []
+
+    def process(message):
+        deliveries.append(message["MessageId"])
+        time.sleep(3)
+
+    consumer = SqsConsumer(client, QUEUE_URL, process, concurrency=2, wait_time_seconds=1, visibility_timeout=2)
+    _run_until(consumer, lambda: consumer.stats["deleted"] == 1)
+
+    assert len(deliveries) == 1
+    assert consumer.stats["extended"] >= 1
+
+
+def test_stop_finishes_in_flight_messages(client):
+    started = threading.Event()
+
+    def process(message):
+        started.set()
+        time.sleep(0.3)
+
+    consumer = SqsConsumer(client, QUEUE_URL, process, concurrency=3, wait_time_seconds=1)
+    _run_until(consumer, started.is_set)
+
+    assert consumer.stats["received"] == consumer.stats["processed"] == consumer.stats["deleted"]
+    assert len(client.messages(QUEUE_URL)) == 20 - consumer.stats["deleted"]
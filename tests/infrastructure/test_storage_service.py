@@ -0,0 +1,124 @@
+import asyncio
+import io
+import time
+
+import httpx
+import pytest
+from botocore.exceptions import ClientError
+from fastapi import UploadFile
+
+from asisya_api.crosscutting.authorization import get_authenticated_user
+from asisya_api.domain.category import CategoryEntity
+from asisya_api.features.categories.cache import invalidate_categories
+from asisya_api.features.categories.commands import create_category_command
+from asisya_api.features.user.models import User
+from asisya_api.infrastructure.in_memory_s3 import InMemoryS3Client
+from asisya_api.infrastructure.storage_service import S3_MIN_PART_SIZE, LocalStorage, S3Storage
+from asisya_api.main import create_app
+
+BUCKET = "test-media"
+
+
+def upload(data: bytes, filename: str = "picture.png") -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), filename=filename)
+
+
+def payload(size: int) -> bytes:
+    return bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+
+
+class FailingPartS3Client(InMemoryS3Client):
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        if PartNumber == 2:
+            raise ClientError({"Error": {"Code": "SlowDown", "Message": "slow down"}}, "UploadPart")
+        return super().upload_part(Bucket, Key, UploadId, PartNumber, Body)
+
+
+def test_local_save_async_round_trip(tmp_path):
+    storage = LocalStorage(media_root=str(tmp_path))
+    data = payload(3 * 1024 * 1024 + 7)
+
+    key = asyncio.run(storage.save_async(upload(data), prefix="categories"))
+
+    assert key.startswith("categories/") and key.endswith(".png")
+    assert (tmp_path / key).read_bytes() == data
+    assert asyncio.run(storage.exists_async(key))
+    asyncio.run(storage.delete_async(key))
+    assert not asyncio.run(storage.exists_async(key))
+
+
+def test_small_file_is_a_single_put():
+    client = InMemoryS3Client()
+    storage = S3Storage(BUCKET, "us-east-1", client=client)
+
+    key = asyncio.run(storage.save_async(upload(b"tiny")))
+
+    assert client.objects(BUCKET) == {key: b"tiny"}
+    assert client.calls == {"PutObject": 1}
+    assert asyncio.run(storage.exists_async(key))
+
+
+def test_large_file_uploads_parts_concurrently():
+    client = InMemoryS3Client(latency_seconds=0.05)
+    storage = S3Storage(BUCKET, "us-east-1", client=client, part_size=S3_MIN_PART_SIZE, concurrency=3)
+    data = payload(4 * S3_MIN_PART_SIZE + 123)
+    picture = upload(data)
+
+    key = asyncio.run(storage.save_async(picture))
+
+    assert client.objects(BUCKET)[key] == data
+    assert client.calls["UploadPart"] == 5
+    assert client.max_in_flight == 3
+    assert client.pending_uploads() == 0
+    assert picture.file.tell() == 0
+
+
+def test_failed_part_aborts_the_upload():
+    client = FailingPartS3Client()
+    storage = S3Storage(BUCKET, "us-east-1", client=client, part_size=S3_MIN_PART_SIZE)
+
+    with pytest.raises(ClientError):
+        asyncio.run(storage.save_async(upload(payload(3 * S3_MIN_PART_SIZE))))
+
+    assert client.calls["AbortMultipartUpload"] == 1
+    assert client.pending_uploads() == 0
+    assert client.objects(BUCKET) == {}
+
+
+def test_api_keeps_serving_reads_during_large_upload(sqlite_session, sqlite_async_session_factory, monkeypatch):
+    # Cada llamada a S3 tarda 0.5 s: si la subida bloqueara el event loop, las lecturas
+    # concurrentes esperarían al menos eso
+    latency = 0.5
+    client = InMemoryS3Client(latency_seconds=latency)
+    storage = S3Storage(BUCKET, "us-east-1", client=client, part_size=S3_MIN_PART_SIZE, concurrency=2)
+    monkeypatch.setattr(create_category_command, "get_storage", lambda: storage)
+    sqlite_session.add(CategoryEntity(name="Beverages", slug="beverages"))
+    sqlite_session.commit()
+
+    app = create_app(session_factory=lambda: sqlite_session, async_session_factory=sqlite_async_session_factory)
+    user = User(id=1, username="admin", full_name="Admin", email="admin@example.com", roles=["admin"])
+    app.dependency_overrides[get_authenticated_user] = lambda: user
+    invalidate_categories()
+    data = payload(3 * S3_MIN_PART_SIZE + 1)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            uploading = asyncio.create_task(http.post(
+                "/categories/", data={"name": "Condiments"}, files={"picture": ("big.png", data, "image/png")},
+            ))
+            read_latencies = []
+            while not uploading.done():
+                start = time.perf_counter()
+                response = await http.get("/categories/")
+                assert response.status_code == 200, response.text
+                read_latencies.append(time.perf_counter() - start)
+            return await uploading, read_latencies
+
+    response, read_latencies = asyncio.run(scenario())
+
+    assert response.status_code == 200, response.text
+    assert response.json()["picture_url"].startswith(f"https://{BUCKET}.s3")
+    assert list(client.objects(BUCKET).values()) == [data]
+    assert len(read_latencies) >= 10
+    assert max(read_latencies) < latency